@@ -32,12 +32,14 @@ INSTALLED_APPS = [
 ]
 
 MIDDLEWARE = [
+    'core.middleware.RequestTimingMiddleware',
     'django.middleware.security.SecurityMiddleware',
-    "whitenoise.middleware.WhiteNoiseMiddleware",
+    "core.middleware.AsyncWhiteNoiseMiddleware",
     'django.contrib.sessions.middleware.SessionMiddleware',
     'django.middleware.common.CommonMiddleware',
     'django.middleware.csrf.CsrfViewMiddleware',
     'django.contrib.auth.middleware.AuthenticationMiddleware',
+    'core.middleware.ReplicaMiddleware',
     'django.contrib.messages.middleware.MessageMiddleware',
     'django.middleware.clickjacking.XFrameOptionsMiddleware',
 ]
@@ -64,6 +66,19 @@ TEMPLATES = [
 WSGI_APPLICATION = 'PetCare.wsgi.application'
 
 
+# Read replicas
+# List and detail pages and the dashboard read from one of the
+# REPLICA_DATABASES aliases, picked at random per request. A request that
+# writes keeps the browser's reads on the primary for REPLICA_STICKY_SECONDS,
+# which should exceed the replicas' usual lag.
+
+DATABASE_ROUTERS = ["core.routers.ReplicaRouter"]
+
+REPLICA_DATABASES = []
+
+REPLICA_STICKY_SECONDS = int(os.getenv("REPLICA_STICKY_SECONDS", 10))
+
+
 # Password validation
 # https://docs.djangoproject.com/en/6.0/ref/settings/#auth-password-validators
 
@@ -106,3 +121,114 @@ STATIC_URL = "static/"
 STATICFILES_DIRS = (BASE_DIR / "static",)
 
 STATIC_ROOT = "staticfiles/"
+
+# Dashboard statistics
+# Counters are kept current by model signals, the timeout is only a backstop
+# for writes that bypass them (bulk operations, raw SQL). With the database
+# or file cache, whose increments are not atomic, writes drop the counters
+# and the next dashboard read counts again.
+
+DASHBOARD_STATS_TIMEOUT = int(os.getenv("DASHBOARD_STATS_TIMEOUT", 300))
+
+# Row fragments
+# Cached list rows are keyed on version stamps that model signals replace,
+# so stale rows are never served. The timeout only bounds how long retired
+# rows occupy the cache.
+
+ROW_FRAGMENT_TIMEOUT = int(os.getenv("ROW_FRAGMENT_TIMEOUT", 86400))
+
+# Calendar
+# Calendars are cached per user, period and filters under a version stamp
+# that model signals replace, the timeout only bounds how long retired
+# calendars occupy the cache.
+
+CALENDAR_CACHE_TIMEOUT = int(os.getenv("CALENDAR_CACHE_TIMEOUT", 3600))
+
+# API
+# Largest number of rows a single bulk API request may create, update or delete.
+
+API_MAX_BATCH_SIZE = int(os.getenv("API_MAX_BATCH_SIZE", 1000))
+
+# Search
+# Backend used by the list views for name/title substring search.
+
+SEARCH_BACKEND = "core.search.ContainsSearchBackend"
+
+# Request timing
+# Fraction of requests whose query count, database, view and template time
+# are measured. Sampled requests slower than REQUEST_TIMING_SLOW_MS are
+# written to the "core.timing" log, and staff users (everyone with DEBUG)
+# get the measurements in a Server-Timing header.
+
+REQUEST_TIMING_SAMPLE_RATE = float(os.getenv("REQUEST_TIMING_SAMPLE_RATE", 0.01))
+
+REQUEST_TIMING_SLOW_MS = float(os.getenv("REQUEST_TIMING_SLOW_MS", 500))
+
+# Email
+# Reminders and digests are sent over SMTP. To try them locally, point
+# EMAIL_HOST and EMAIL_PORT at an SMTP stand-in such as
+# `python -m aiosmtpd -n -l localhost:1025`, or set EMAIL_BACKEND to
+# django.core.mail.backends.console.EmailBackend.
+
+EMAIL_BACKEND = os.getenv("EMAIL_BACKEND", "django.core.mail.backends.smtp.EmailBackend")
+
+EMAIL_HOST = os.getenv("EMAIL_HOST", "localhost")
+
+EMAIL_PORT = int(os.getenv("EMAIL_PORT", 25))
+
+EMAIL_HOST_USER = os.getenv("EMAIL_HOST_USER", "")
+
+EMAIL_HOST_PASSWORD = os.getenv("EMAIL_HOST_PASSWORD", "")
+
+EMAIL_USE_TLS = os.getenv("EMAIL_USE_TLS", "false").lower() == "true"
+
+DEFAULT_FROM_EMAIL = os.getenv("DEFAULT_FROM_EMAIL", "webmaster@localhost")
+
+# Reminders
+# The send_reminders command emails the user of every health event due in
+# the next REMINDER_LEAD_DAYS days, REMINDER_BATCH_SIZE emails per mail
+# connection.
+
+REMINDER_LEAD_DAYS = int(os.getenv("REMINDER_LEAD_DAYS", 1))
+
+REMINDER_BATCH_SIZE = int(os.getenv("REMINDER_BATCH_SIZE", 100))
+
+# Digests
+# The send_digests command emails every user their activities and health
+# events of the next DIGEST_DAYS days. Agendas are read and emails sent for
+# DIGEST_BATCH_SIZE users at a time, over one mail connection per batch.
+
+DIGEST_DAYS = int(os.getenv("DIGEST_DAYS", 7))
+
+DIGEST_BATCH_SIZE = int(os.getenv("DIGEST_BATCH_SIZE", 200))
+
+# Archive
+# The archive_records command moves activities and health events with a
+# terminal status scheduled more than ARCHIVE_AFTER_DAYS days ago to the
+# archive tables, ARCHIVE_CHUNK_SIZE rows per transaction.
+
+ARCHIVE_AFTER_DAYS = int(os.getenv("ARCHIVE_AFTER_DAYS", 365))
+
+ARCHIVE_CHUNK_SIZE = int(os.getenv("ARCHIVE_CHUNK_SIZE", 1000))
+
+LOGGING = {
+    "version": 1,
+    "disable_existing_loggers": False,
+    "handlers": {
+        "console": {
+            "class": "logging.StreamHandler",
+        },
+    },
+    "loggers": {
+        "core.timing": {
+            "handlers": ["console"],
+            "level": "WARNING",
+            "propagate": False,
+        },
+        "core.warmup": {
+            "handlers": ["console"],
+            "level": "INFO",
+            "propagate": False,
+        },
+    },
+}
@@ -1,3 +1,5 @@
+import os
+
 from .base import *
 
 
@@ -13,5 +15,22 @@ DATABASES = {
     'default': {
         'ENGINE': 'django.db.backends.sqlite3',
         'NAME': BASE_DIR / 'db.sqlite3',
-    }
-}
\ No newline at end of file
+    },
+    # Reads the primary's file unless SQLITE_REPLICA_NAME names a copy of
+    # it, which then lags behind until copied again.
+    'replica': {
+        'ENGINE': 'django.db.backends.sqlite3',
+        'NAME': os.getenv('SQLITE_REPLICA_NAME', BASE_DIR / 'db.sqlite3'),
+        'TEST': {'MIRROR': 'default'},
+    },
+}
+
+REPLICA_DATABASES = ['replica']
+
+# Search
+
+SEARCH_BACKEND = "core.search.FTS5SearchBackend"
+
+# Request timing
+
+REQUEST_TIMING_SAMPLE_RATE = float(os.getenv("REQUEST_TIMING_SAMPLE_RATE", 1.0))
@@ -1,4 +1,8 @@
+import copy
 import os
+
+from django.core.exceptions import ImproperlyConfigured
+
 from .base import *
 
 
@@ -11,6 +15,18 @@ RENDER_EXTERNAL_HOSTNAME = os.environ.get('RENDER_EXTERNAL_HOSTNAME')
 if RENDER_EXTERNAL_HOSTNAME:
     ALLOWED_HOSTS.append(RENDER_EXTERNAL_HOSTNAME)
     
+# Templates
+# Compiled templates are kept in memory for the life of the worker and
+# warmed up at boot by core.warmup (see gunicorn.conf.py).
+
+TEMPLATES[0]['APP_DIRS'] = False
+TEMPLATES[0]['OPTIONS']['loaders'] = [
+    ('django.template.loaders.cached.Loader', [
+        'django.template.loaders.filesystem.Loader',
+        'django.template.loaders.app_directories.Loader',
+    ]),
+]
+
 # Database
 # https://docs.djangoproject.com/en/6.0/ref/settings/#databases
 
@@ -24,3 +40,73 @@ DATABASES = {
         'PORT': int(os.environ['POSTGRES_DB_PORT']),
     }
 }
+
+# Connection management
+# "pool" keeps a psycopg connection pool per worker process, "persistent"
+# reuses one connection per worker thread for up to POSTGRES_CONN_MAX_AGE
+# seconds, "none" opens a new connection for every request. Connections are
+# checked before reuse in both pooled and persistent modes. Under ASGI each
+# request runs its queries in a fresh thread, so persistent connections are
+# not reused; use the pool, whose max_size bounds the queries a worker runs
+# at once.
+
+POSTGRES_CONN_MODE = os.environ.get('POSTGRES_CONN_MODE', 'pool')
+
+if POSTGRES_CONN_MODE == 'pool':
+    from psycopg_pool import ConnectionPool
+
+    DATABASES['default']['OPTIONS'] = {
+        'pool': {
+            'min_size': int(os.environ.get('POSTGRES_POOL_MIN_SIZE', 2)),
+            'max_size': int(os.environ.get('POSTGRES_POOL_MAX_SIZE', 10)),
+            'timeout': float(os.environ.get('POSTGRES_POOL_TIMEOUT', 10)),
+            'check': ConnectionPool.check_connection,
+        },
+    }
+elif POSTGRES_CONN_MODE == 'persistent':
+    DATABASES['default']['CONN_MAX_AGE'] = int(os.environ.get('POSTGRES_CONN_MAX_AGE', 600))
+    DATABASES['default']['CONN_HEALTH_CHECKS'] = True
+elif POSTGRES_CONN_MODE != 'none':
+    raise ImproperlyConfigured(
+        f"POSTGRES_CONN_MODE must be 'pool', 'persistent' or 'none', not {POSTGRES_CONN_MODE!r}."
+    )
+
+# Read replica
+# A streaming replica of the primary, on its own host, with the same
+# credentials and connection management.
+
+POSTGRES_REPLICA_HOST = os.environ.get('POSTGRES_REPLICA_HOST')
+
+if POSTGRES_REPLICA_HOST:
+    DATABASES['replica'] = {
+        **copy.deepcopy(DATABASES['default']),
+        'HOST': POSTGRES_REPLICA_HOST,
+        'PORT': int(os.environ.get('POSTGRES_REPLICA_PORT', DATABASES['default']['PORT'])),
+        'TEST': {'MIRROR': 'default'},
+    }
+    REPLICA_DATABASES = ['replica']
+
+# Search
+
+SEARCH_BACKEND = 'core.search.TrigramSearchBackend'
+
+# Cache
+# https://docs.djangoproject.com/en/6.0/topics/cache/
+# A shared cache keeps cached data consistent across gunicorn workers.
+
+REDIS_URL = os.environ.get('REDIS_URL')
+
+if REDIS_URL:
+    CACHES = {
+        'default': {
+            'BACKEND': 'django.core.cache.backends.redis.RedisCache',
+            'LOCATION': REDIS_URL,
+        }
+    }
+else:
+    CACHES = {
+        'default': {
+            'BACKEND': 'django.core.cache.backends.db.DatabaseCache',
+            'LOCATION': 'core_cache',
+        }
+    }
@@ -0,0 +1,168 @@
+"""
+Compare the throughput of gunicorn sync workers and uvicorn workers serving
+the dashboard, a list page and pet autocomplete, with the same number of
+worker processes and so about the same memory.
+
+    DJANGO_SETTINGS_MODULE=PetCare.settings.prod python -m benchmarks.async_throughput --db-latency 20
+
+Both servers are started on a seeded scratch database and loaded by
+--concurrency client threads, each sending requests with a logged in
+session one after another for --duration seconds. --db-latency adds a
+delay to every query, standing in for a slow or distant database.
+"""
+import argparse
+import http.client
+import os
+import statistics
+import subprocess
+import sys
+import threading
+import time
+from pathlib import Path
+
+from benchmarks.common import BASE_DIR, setup_django, scratch_database, seed
+
+PATHS = ("/", "/activities/", "/autocomplete/pets/?q=pet+1")
+
+# Mode name: (application, worker class).
+MODES = {
+    "sync workers": ("benchmarks.latency_app:wsgi_application", "sync"),
+    "uvicorn workers": ("benchmarks.latency_app:asgi_application", "uvicorn_worker.UvicornWorker"),
+}
+
+
+def session_cookie():
+    from django.contrib.auth import get_user_model
+    from django.test import Client
+
+    user = get_user_model().objects.create_user(username="benchmark", password="benchmark")
+    client = Client()
+    client.force_login(user)
+    return f"sessionid={client.cookies['sessionid'].value}"
+
+
+def start_server(application, worker_class, args, database_name):
+    env = {
+        **os.environ,
+        "POSTGRES_DB": database_name,
+        "RENDER_EXTERNAL_HOSTNAME": "127.0.0.1",
+        "BENCHMARK_DB_LATENCY_MS": str(args.db_latency),
+    }
+    server = subprocess.Popen(
+        [
+            sys.executable, "-m", "gunicorn", application,
+            "--worker-class", worker_class,
+            "--workers", str(args.workers),
+            "--bind", f"127.0.0.1:{args.port}",
+        ],
+        cwd=BASE_DIR,
+        env=env,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+    )
+    deadline = time.monotonic() + 30
+    while time.monotonic() < deadline:
+        try:
+            connection = http.client.HTTPConnection("127.0.0.1", args.port, timeout=1)
+            connection.request("GET", "/accounts/login/")
+            connection.getresponse().read()
+            return server
+        except OSError:
+            time.sleep(0.2)
+    server.terminate()
+    sys.exit(f"gunicorn did not start on port {args.port}.")
+
+
+def worker_rss(server):
+    """Resident memory in MB of the gunicorn master's worker processes."""
+    total = 0
+    for stat in Path("/proc").glob("[0-9]*/stat"):
+        try:
+            fields = stat.read_text().rsplit(")", 1)[1].split()
+            if int(fields[1]) == server.pid:
+                status = (stat.parent / "status").read_text()
+                total += int(status.split("VmRSS:")[1].split()[0])
+        except (OSError, IndexError):
+            continue
+    return total / 1024
+
+
+def load(args, cookie):
+    timings, errors = [], []
+    deadline = time.monotonic() + args.duration
+
+    def client():
+        connection = http.client.HTTPConnection("127.0.0.1", args.port, timeout=30)
+        index = 0
+        while time.monotonic() < deadline:
+            path = PATHS[index % len(PATHS)]
+            index += 1
+            start = time.perf_counter()
+            try:
+                connection.request("GET", path, headers={"Cookie": cookie})
+                response = connection.getresponse()
+                response.read()
+            except (OSError, http.client.HTTPException):
+                errors.append(path)
+                connection.close()
+                continue
+            if response.status != 200:
+                errors.append(path)
+            timings.append(time.perf_counter() - start)
+        connection.close()
+
+    threads = [threading.Thread(target=client) for _ in range(args.concurrency)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    return timings, errors
+
+
+def report(name, timings, errors, duration, rss):
+    timings = sorted(timings) or [0]
+    p95 = timings[int(len(timings) * 0.95) - 1]
+    print(
+        f"{name:<16} {len(timings) / duration:8.1f} req/s"
+        f"   p50 {statistics.median(timings) * 1000:7.1f} ms"
+        f"   p95 {p95 * 1000:7.1f} ms"
+        f"   errors {len(errors):4d}"
+        f"   workers {rss:6.1f} MB"
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--workers", type=int, default=2)
+    parser.add_argument("--concurrency", type=int, default=32)
+    parser.add_argument("--duration", type=float, default=10)
+    parser.add_argument("--db-latency", type=float, default=0, help="milliseconds added to every query")
+    parser.add_argument("--rows", type=int, default=10_000)
+    parser.add_argument("--port", type=int, default=8765)
+    args = parser.parse_args()
+
+    setup_django()
+    from django.db import connection
+
+    if connection.vendor != "postgresql":
+        sys.exit("This benchmark needs PostgreSQL, run it with PetCare.settings.prod.")
+
+    with scratch_database():
+        seed(args.rows)
+        cookie = session_cookie()
+        database_name = connection.settings_dict["NAME"]
+        # The servers need the seeded rows and the session.
+        connection.close()
+        for name, (application, worker_class) in MODES.items():
+            server = start_server(application, worker_class, args, database_name)
+            try:
+                timings, errors = load(args, cookie)
+                rss = worker_rss(server)
+            finally:
+                server.terminate()
+                server.wait()
+            report(name, timings, errors, args.duration, rss)
+
+
+if __name__ == "__main__":
+    main()
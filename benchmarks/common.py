@@ -0,0 +1,108 @@
+import os
+import sys
+import time
+from contextlib import contextmanager
+from datetime import date, timedelta
+from decimal import Decimal
+from pathlib import Path
+
+BASE_DIR = Path(__file__).resolve().parent.parent
+
+
+def setup_django():
+    sys.path.insert(0, str(BASE_DIR))
+    os.environ.setdefault("DJANGO_SETTINGS_MODULE", "PetCare.settings.dev")
+
+    import django
+
+    django.setup()
+
+
+@contextmanager
+def scratch_database(verbosity=0):
+    """Create a throwaway migrated database the same way the test runner does."""
+    from django.db import connection
+
+    old_name = connection.settings_dict["NAME"]
+    connection.creation.create_test_db(verbosity=verbosity, autoclobber=True)
+    try:
+        yield connection
+    finally:
+        connection.creation.destroy_test_db(old_name, verbosity=verbosity)
+
+
+@contextmanager
+def timer(label, results):
+    start = time.perf_counter()
+    yield
+    results[label] = time.perf_counter() - start
+
+
+def seed(rows, users=200, pets=2000, batch_size=5000):
+    from django.contrib.auth import get_user_model
+
+    from core.models import Species, Pet, Status, Priority, Activity, HealthEvent
+
+    User = get_user_model()
+
+    species = Species.objects.bulk_create(Species(name=f"species {i}") for i in range(10))
+    statuses = Status.objects.bulk_create(
+        Status(name=name) for name in ("pending", "completed", "cancelled")
+    )
+    priorities = Priority.objects.bulk_create(
+        Priority(name=name) for name in ("low", "medium", "high")
+    )
+    user_objs = User.objects.bulk_create(
+        User(username=f"user{i}", email=f"user{i}@example.com") for i in range(users)
+    )
+    pet_objs = Pet.objects.bulk_create(
+        (
+            Pet(
+                name=f"pet {i}",
+                species=species[i % len(species)],
+                breed="mixed",
+                weight=Decimal("10.00"),
+                height=Decimal("30.00"),
+                birth_date=date(2020, 1, 1),
+            )
+            for i in range(pets)
+        ),
+        batch_size=batch_size,
+    )
+    Pet.owners.through.objects.bulk_create(
+        (
+            Pet.owners.through(pet_id=pet.pk, user_id=user_objs[i % users].pk)
+            for i, pet in enumerate(pet_objs)
+        ),
+        batch_size=batch_size,
+    )
+
+    start = date(2015, 1, 1)
+    Activity.objects.bulk_create(
+        (
+            Activity(
+                title=f"activity {i}",
+                scheduled_date=start + timedelta(days=i % 4000),
+                user=user_objs[i % users],
+                pet=pet_objs[i % pets],
+                status=statuses[i % len(statuses)],
+            )
+            for i in range(rows)
+        ),
+        batch_size=batch_size,
+    )
+    HealthEvent.objects.bulk_create(
+        (
+            HealthEvent(
+                title=f"health event {i}",
+                scheduled_date=start + timedelta(days=i % 4000),
+                user=user_objs[i % users],
+                pet=pet_objs[i % pets],
+                status=statuses[i % len(statuses)],
+                priority=priorities[i % len(priorities)],
+            )
+            for i in range(rows)
+        ),
+        batch_size=batch_size,
+    )
+    return user_objs, pet_objs, statuses, priorities
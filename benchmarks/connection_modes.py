@@ -0,0 +1,96 @@
+"""
+Compare per-request latency of opening a new PostgreSQL connection for every
+request against persistent connections and a psycopg connection pool.
+
+    DJANGO_SETTINGS_MODULE=PetCare.settings.prod python -m benchmarks.connection_modes --requests 500
+
+Each simulated request runs the activity list page query between the
+connection checks Django makes on request_started and request_finished.
+"""
+import argparse
+import statistics
+import sys
+import time
+
+from benchmarks.common import setup_django, scratch_database, seed
+
+# Mode name: (settings overrides, pool options).
+MODES = {
+    "new connection per request": ({"CONN_MAX_AGE": 0}, None),
+    "persistent": ({"CONN_MAX_AGE": 600, "CONN_HEALTH_CHECKS": True}, None),
+    "pooled": ({"CONN_MAX_AGE": 0}, {"min_size": 1, "max_size": 2}),
+}
+
+
+def make_connection(alias, overrides, pool):
+    from django.db import connections
+
+    default = connections["default"]
+    options = {
+        key: value for key, value in default.settings_dict["OPTIONS"].items() if key != "pool"
+    }
+    if pool is not None:
+        options["pool"] = pool
+    settings_dict = {**default.settings_dict, **overrides, "OPTIONS": options}
+    return default.__class__(settings_dict, alias)
+
+
+def page_query():
+    from django.test import RequestFactory
+
+    from core.views import ActivityListView
+
+    view = ActivityListView()
+    view.setup(RequestFactory().get("/"))
+    queryset = view.get_queryset().order_by(*view.cursor_ordering)[:view.paginate_by + 1]
+    return queryset.query.sql_with_params()
+
+
+def simulate(connection, sql, params, requests):
+    timings = []
+    for _ in range(requests):
+        start = time.perf_counter()
+        connection.close_if_unusable_or_obsolete()
+        with connection.cursor() as cursor:
+            cursor.execute(sql, params)
+            cursor.fetchall()
+        connection.close_if_unusable_or_obsolete()
+        timings.append(time.perf_counter() - start)
+    connection.close()
+    if connection.settings_dict["OPTIONS"].get("pool"):
+        connection.close_pool()
+    return timings
+
+
+def report(name, timings):
+    timings = sorted(timings)
+    p95 = timings[int(len(timings) * 0.95) - 1]
+    print(
+        f"{name:<28} mean {statistics.mean(timings) * 1000:7.3f} ms"
+        f"   p50 {statistics.median(timings) * 1000:7.3f} ms"
+        f"   p95 {p95 * 1000:7.3f} ms"
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--requests", type=int, default=500)
+    parser.add_argument("--rows", type=int, default=10_000)
+    args = parser.parse_args()
+
+    setup_django()
+    from django.db import connection
+
+    if connection.vendor != "postgresql":
+        sys.exit("This benchmark needs PostgreSQL, run it with PetCare.settings.prod.")
+
+    with scratch_database():
+        seed(args.rows)
+        sql, params = page_query()
+        for index, (name, (overrides, pool)) in enumerate(MODES.items()):
+            bench_connection = make_connection(f"bench{index}", overrides, pool)
+            report(name, simulate(bench_connection, sql, params, args.requests))
+
+
+if __name__ == "__main__":
+    main()
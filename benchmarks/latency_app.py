@@ -0,0 +1,28 @@
+"""
+The WSGI and ASGI applications with BENCHMARK_DB_LATENCY_MS milliseconds
+added to every query, standing in for a database on the far side of a
+network. Served by gunicorn in async_throughput.
+"""
+import os
+import time
+
+from django.db.backends.signals import connection_created
+
+LATENCY = float(os.environ.get("BENCHMARK_DB_LATENCY_MS", 0)) / 1000
+
+
+def add_latency(execute, sql, params, many, context):
+    time.sleep(LATENCY)
+    return execute(sql, params, many, context)
+
+
+def install(sender, connection, **kwargs):
+    # Pooled connections are reconnected on every request.
+    if LATENCY and add_latency not in connection.execute_wrappers:
+        connection.execute_wrappers.append(add_latency)
+
+
+connection_created.connect(install)
+
+from PetCare.wsgi import application as wsgi_application  # noqa: E402
+from PetCare.asgi import application as asgi_application  # noqa: E402
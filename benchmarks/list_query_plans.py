@@ -0,0 +1,89 @@
+"""
+Print the plans and timings of the activity and health event list queries
+with and without the composite indexes added in migration 0007.
+
+    python -m benchmarks.list_query_plans --rows 200000
+"""
+import argparse
+import time
+
+from benchmarks.common import setup_django, scratch_database, seed
+
+
+def list_queries(user, pet, status, priority):
+    from django.test import RequestFactory
+
+    from core.views import ActivityListView, HealthEventListView
+
+    factory = RequestFactory()
+    filters = [
+        ("unfiltered", {}),
+        ("by pet", {"pets": pet.pk}),
+        ("by user", {"users": user.pk}),
+        ("by status", {"status": status.pk}),
+    ]
+    shapes = []
+    for view_class, extra in [
+        (ActivityListView, []),
+        (HealthEventListView, [("by priority", {"priority": priority.pk})]),
+    ]:
+        for name, params in filters + extra:
+            view = view_class()
+            view.setup(factory.get("/", params))
+            queryset = view.get_queryset().order_by(*view.cursor_ordering)
+            shapes.append((f"{view_class.__name__} {name}", queryset[:view.paginate_by + 1]))
+    return shapes
+
+
+def best_of(queryset, repeat=5):
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        list(queryset.all())
+        timings.append(time.perf_counter() - start)
+    return min(timings)
+
+
+def analyze(connection):
+    # Autovacuum keeps planner statistics current on PostgreSQL. SQLite
+    # databases are never analyzed in practice, so they are left as they are.
+    if connection.vendor == "postgresql":
+        with connection.cursor() as cursor:
+            cursor.execute("ANALYZE")
+
+
+def report(title, shapes):
+    print(f"\n=== {title} ===")
+    for name, queryset in shapes:
+        print(f"\n-- {name}: {best_of(queryset) * 1000:.2f} ms")
+        print(queryset.explain())
+
+
+def drop_composite_indexes(connection):
+    from core.models import Activity, HealthEvent
+
+    with connection.schema_editor() as editor:
+        for model in (Activity, HealthEvent):
+            for index in model._meta.indexes:
+                editor.remove_index(model, index)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--rows", type=int, default=100_000)
+    args = parser.parse_args()
+
+    setup_django()
+    with scratch_database() as connection:
+        users, pets, statuses, priorities = seed(args.rows)
+        analyze(connection)
+        shapes = list_queries(users[0], pets[0], statuses[0], priorities[-1])
+
+        report("with composite indexes", shapes)
+        drop_composite_indexes(connection)
+        analyze(connection)
+        report("without composite indexes", shapes)
+
+
+if __name__ == "__main__":
+    main()
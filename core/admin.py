@@ -2,7 +2,9 @@ from django.contrib import admin
 from django.contrib.auth.admin import UserAdmin
 from django.contrib.auth import get_user_model
 
-from core.models import Pet, Activity, HealthEvent, Species, Status, Priority
+from core.models import (
+    Pet, Activity, ActivityRule, ArchivedActivity, HealthEvent, ArchivedHealthEvent, Species, Status, Priority
+)
 
 
 User = get_user_model()
@@ -24,12 +26,33 @@ class ActivityAdmin(admin.ModelAdmin):
     list_filter = ["scheduled_date", "user", "pet", "status"]
 
 
+@admin.register(ActivityRule)
+class ActivityRuleAdmin(admin.ModelAdmin):
+    list_display = ("title", "frequency", "interval", "start_date", "end_date", "user", "pet")
+    search_fields = ["title", "pet__name"]
+    list_filter = ["frequency", "user", "pet", "status"]
+
+
 @admin.register(HealthEvent)
 class HealthEventAdmin(admin.ModelAdmin):
     list_display = ("title", "scheduled_date", "priority", "user", "pet", "status")
     search_fields = ["title", "pet__name", "priority__name"]
     list_filter = ["scheduled_date", "priority", "user", "pet", "status"]
 
+
+@admin.register(ArchivedActivity)
+class ArchivedActivityAdmin(admin.ModelAdmin):
+    list_display = ("title", "scheduled_date", "user", "pet", "status", "archived_at")
+    search_fields = ["title", "pet__name"]
+    list_filter = ["scheduled_date", "status"]
+
+
+@admin.register(ArchivedHealthEvent)
+class ArchivedHealthEventAdmin(admin.ModelAdmin):
+    list_display = ("title", "scheduled_date", "priority", "user", "pet", "status", "archived_at")
+    search_fields = ["title", "pet__name"]
+    list_filter = ["scheduled_date", "priority", "status"]
+
 admin.site.register(Status)
 admin.site.register(Priority)
 admin.site.register(Species)
@@ -0,0 +1,37 @@
+from django.db.models import Aggregate, JSONField, Subquery
+from django.db.models.functions import JSONObject
+
+
+class JSONArrayAgg(Aggregate):
+    """The aggregated values as a JSON array."""
+
+    function = "JSON_GROUP_ARRAY"
+    output_field = JSONField()
+
+    def as_postgresql(self, compiler, connection, **extra_context):
+        return self.as_sql(compiler, connection, function="JSONB_AGG", **extra_context)
+
+
+def json_rows(queryset, group_by, **fields):
+    """
+    Correlated subquery returning queryset's rows as a JSON array of
+    objects with the given fields ({name: lookup}), or None if there are no
+    rows. queryset is filtered on OuterRef() through group_by.
+    """
+    rows = (
+        queryset.order_by()
+        .values(group_by)
+        .annotate(rows=JSONArrayAgg(JSONObject(**fields)))
+        .values("rows")
+    )
+    return Subquery(rows, output_field=JSONField())
+
+
+def from_json(model, row, using=None):
+    """An instance of model loaded from a row of json_rows(), by attname."""
+    fields = [field for field in model._meta.concrete_fields if field.attname in row]
+    return model.from_db(
+        using,
+        [field.attname for field in fields],
+        [field.to_python(row[field.attname]) for field in fields],
+    )
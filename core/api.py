@@ -0,0 +1,263 @@
+import base64
+import json
+
+from django.conf import settings
+from django.contrib.auth import authenticate
+from django.core.exceptions import PermissionDenied
+from django.db import IntegrityError, transaction
+from django.db.models import prefetch_related_objects
+from django.http import JsonResponse
+from django.middleware.csrf import CsrfViewMiddleware
+from django.utils.decorators import method_decorator
+from django.views import View
+from django.views.decorators.csrf import csrf_exempt
+
+from core import counters
+from core.bulk import (
+    BulkFormMixin, prefetch_choices, validate_batch, bulk_create, bulk_update, bulk_save_m2m
+)
+from core.forms import PetForm, ActivityForm, HealthEventForm
+from core.models import Pet, Activity, HealthEvent
+from core.pagination import CursorPaginator, InvalidCursor
+
+
+class ApiError(Exception):
+    def __init__(self, status, message, **extra):
+        super().__init__(message)
+        self.status = status
+        self.body = {"error": message, **extra}
+
+
+def enforce_csrf(request):
+    check = CsrfViewMiddleware(lambda request: None)
+    check.process_request(request)
+    if check.process_view(request, None, (), {}) is not None:
+        raise PermissionDenied("CSRF verification failed.")
+
+
+def authenticate_api_request(request):
+    """
+    Accept HTTP Basic credentials from integrations, or the session of a
+    logged in user. Session requests are CSRF checked, Basic ones cannot be
+    forged by a browser since the API never asks for them.
+    """
+    scheme, _, credentials = request.META.get("HTTP_AUTHORIZATION", "").partition(" ")
+    if scheme.lower() == "basic":
+        try:
+            username, _, password = base64.b64decode(credentials).decode().partition(":")
+        except (ValueError, UnicodeDecodeError):
+            return None
+        return authenticate(request, username=username, password=password)
+    if request.user.is_authenticated:
+        enforce_csrf(request)
+        return request.user
+    return None
+
+
+def serialize(obj, fields):
+    data = {"id": obj.pk}
+    for name in fields:
+        field = obj._meta.get_field(name)
+        if field.many_to_many:
+            data[name] = [related.pk for related in getattr(obj, name).all()]
+        else:
+            data[name] = field.value_from_object(obj)
+    return data
+
+
+@method_decorator(csrf_exempt, name="dispatch")
+class ApiView(View):
+    model = None
+    form_class = None
+
+    def dispatch(self, request, *args, **kwargs):
+        try:
+            user = authenticate_api_request(request)
+        except PermissionDenied as e:
+            return JsonResponse({"error": str(e)}, status=403)
+        if user is None:
+            return JsonResponse({"error": "Authentication required."}, status=401)
+        request.user = user
+        try:
+            return super().dispatch(request, *args, **kwargs)
+        except ApiError as e:
+            return JsonResponse(e.body, status=e.status)
+
+    def get_queryset(self):
+        return self.model._default_manager.all()
+
+    def get_fields(self):
+        return list(self.form_class.base_fields)
+
+    def serialize(self, obj):
+        return serialize(obj, self.get_fields())
+
+    def serialize_many(self, objects):
+        many_to_many = [
+            field.name for field in self.model._meta.many_to_many
+            if field.name in self.get_fields()
+        ]
+        prefetch_related_objects(objects, *many_to_many)
+        return [self.serialize(obj) for obj in objects]
+
+
+class BulkApiView(ApiView):
+    """
+    GET lists objects by id with cursor pagination. POST creates, PATCH
+    updates and DELETE deletes a JSON list of objects (ids for DELETE) in
+    one transaction: either every row is valid and saved, or nothing is.
+    Rows are validated by the model's form with their related objects and
+    unique values checked for the whole batch at once.
+    """
+
+    per_page = 100
+
+    def get_form_class(self):
+        return type(f"Bulk{self.form_class.__name__}", (BulkFormMixin, self.form_class), {})
+
+    def parse_rows(self, request):
+        try:
+            rows = json.loads(request.body)
+        except ValueError:
+            raise ApiError(400, "Request body must be JSON.")
+        if not isinstance(rows, list):
+            raise ApiError(400, "Request body must be a JSON list.")
+        if len(rows) > settings.API_MAX_BATCH_SIZE:
+            raise ApiError(400, f"At most {settings.API_MAX_BATCH_SIZE} rows can be sent at once.")
+        return rows
+
+    def require_objects(self, rows):
+        if not all(isinstance(row, dict) for row in rows):
+            raise ApiError(400, "Every row must be a JSON object.")
+        return rows
+
+    def parse_ids(self, rows):
+        try:
+            ids = [int(row["id"] if isinstance(row, dict) else row) for row in rows]
+        except (KeyError, TypeError, ValueError):
+            raise ApiError(400, "Every row must have an integer id.")
+        if len(set(ids)) != len(ids):
+            raise ApiError(400, "Ids must be unique.")
+        return ids
+
+    def validate(self, forms):
+        if not validate_batch(forms):
+            raise ApiError(400, "Validation failed.", errors=[
+                {"index": index, "errors": form.errors.get_json_data()}
+                for index, form in enumerate(forms) if form.errors
+            ])
+
+    def save(self, forms, write):
+        try:
+            with transaction.atomic():
+                objects = write([form.save(commit=False) for form in forms])
+                bulk_save_m2m(forms)
+        except IntegrityError as e:
+            raise ApiError(409, f"Conflict: {e}")
+        return objects
+
+    def get(self, request, *args, **kwargs):
+        paginator = CursorPaginator(self.get_queryset(), self.per_page, ("id",))
+        try:
+            page = paginator.page(request.GET.get("cursor"))
+        except InvalidCursor:
+            raise ApiError(400, "Invalid cursor.")
+        return JsonResponse({
+            "results": self.serialize_many(page.object_list),
+            "next": page.next_cursor if page.has_next() else None,
+        })
+
+    def post(self, request, *args, **kwargs):
+        rows = self.require_objects(self.parse_rows(request))
+        form_class = self.get_form_class()
+        choices = prefetch_choices(form_class, rows)
+        forms = [form_class(data=row, choices=choices) for row in rows]
+        self.validate(forms)
+        objects = self.save(forms, lambda objects: bulk_create(self.model, objects))
+        return JsonResponse({"results": self.serialize_many(objects)}, status=201)
+
+    def patch(self, request, *args, **kwargs):
+        rows = self.require_objects(self.parse_rows(request))
+        ids = self.parse_ids(rows)
+        instances = self.get_queryset().in_bulk(ids)
+        missing = [pk for pk in ids if pk not in instances]
+        if missing:
+            raise ApiError(404, "Objects not found.", ids=missing)
+
+        rows = [{**self.serialize(instances[pk]), **row} for pk, row in zip(ids, rows)]
+        form_class = self.get_form_class()
+        choices = prefetch_choices(form_class, rows)
+        forms = [
+            form_class(data=row, instance=instances[pk], choices=choices)
+            for pk, row in zip(ids, rows)
+        ]
+        self.validate(forms)
+        fields = [
+            field.name for field in self.model._meta.concrete_fields
+            if field.name in form_class.base_fields
+        ]
+        objects = self.save(forms, lambda objects: bulk_update(self.model, objects, fields))
+        return JsonResponse({"results": self.serialize_many(objects)})
+
+    def delete(self, request, *args, **kwargs):
+        ids = self.parse_ids(self.parse_rows(request))
+        with transaction.atomic():
+            queryset = self.get_queryset().filter(pk__in=ids)
+            found = set(queryset.values_list("pk", flat=True))
+            missing = [pk for pk in ids if pk not in found]
+            if missing:
+                raise ApiError(404, "Objects not found.", ids=missing)
+            with counters.deferred():
+                queryset.delete()
+        return JsonResponse({"deleted": ids})
+
+
+class DetailApiView(ApiView):
+    def get(self, request, *args, **kwargs):
+        try:
+            obj = self.get_queryset().get(pk=kwargs["pk"])
+        except self.model.DoesNotExist:
+            raise ApiError(404, "Object not found.")
+        return JsonResponse(self.serialize(obj))
+
+
+class PetApiMixin:
+    model = Pet
+    form_class = PetForm
+
+    def get_queryset(self):
+        return Pet.objects.prefetch_related("owners")
+
+
+class ActivityApiMixin:
+    model = Activity
+    form_class = ActivityForm
+
+
+class HealthEventApiMixin:
+    model = HealthEvent
+    form_class = HealthEventForm
+
+
+class PetBulkApiView(PetApiMixin, BulkApiView):
+    pass
+
+
+class PetDetailApiView(PetApiMixin, DetailApiView):
+    pass
+
+
+class ActivityBulkApiView(ActivityApiMixin, BulkApiView):
+    pass
+
+
+class ActivityDetailApiView(ActivityApiMixin, DetailApiView):
+    pass
+
+
+class HealthEventBulkApiView(HealthEventApiMixin, BulkApiView):
+    pass
+
+
+class HealthEventDetailApiView(HealthEventApiMixin, DetailApiView):
+    pass
@@ -0,0 +1,109 @@
+from collections import Counter
+from functools import partial
+
+from django.contrib.auth import get_user_model
+from django.db import DEFAULT_DB_ALIAS, connections, transaction
+from django.utils import timezone
+from django.utils.functional import cached_property
+
+from core import conditional, counters, feeds, schedule, stats
+from core.models import Pet, Activity, ArchivedActivity, HealthEvent, ArchivedHealthEvent
+
+User = get_user_model()
+
+# Model: archive model with the same columns, plus archived_at.
+ARCHIVES = {
+    Activity: ArchivedActivity,
+    HealthEvent: ArchivedHealthEvent,
+}
+
+
+def archivable(model, cutoff):
+    """Rows scheduled before cutoff with a terminal status."""
+    queryset = model._default_manager.filter(scheduled_date__lt=cutoff, status__is_terminal=True)
+    if model is Activity:
+        # Without its activity, a rule occurrence would be listed as to do again.
+        queryset = queryset.filter(rule__isnull=True)
+    return queryset
+
+
+def _move(model, pks, using):
+    """Copy rows into the archive table and delete them, in two statements."""
+    archive = ARCHIVES[model]
+    connection = connections[using]
+    quote = connection.ops.quote_name
+    columns = ", ".join(
+        quote(field.column) for field in archive._meta.concrete_fields if field.name != "archived_at"
+    )
+    table = quote(model._meta.db_table)
+    where = f"{quote(model._meta.pk.column)} IN ({', '.join(['%s'] * len(pks))})"
+    archived_at = connection.ops.adapt_datetimefield_value(timezone.now())
+    with connection.cursor() as cursor:
+        cursor.execute(
+            f"INSERT INTO {quote(archive._meta.db_table)} ({columns}, {quote('archived_at')}) "
+            f"SELECT {columns}, %s FROM {table} WHERE {where}",
+            [archived_at, *pks],
+        )
+        cursor.execute(f"DELETE FROM {table} WHERE {where}", pks)
+
+
+def _after_move(model, rows, using):
+    """Once for the chunk, what the delete signals do for every row."""
+    for name, (counter_model, field) in counters.FOREIGN_KEY_COUNTERS[model].items():
+        moved = Counter(row[name] for row in rows)
+        counters.adjust(counter_model, field, {pk: -n for pk, n in moved.items()}, using)
+    user_ids = {row["user_id"] for row in rows}
+    conditional.touch(Pet, {row["pet_id"] for row in rows}, using=using)
+    conditional.touch(User, user_ids, using=using)
+    transaction.on_commit(partial(stats.adjust, model, -len(rows)), using=using)
+    transaction.on_commit(schedule.touch, using=using)
+    for user_id in user_ids:
+        transaction.on_commit(partial(feeds.touch, user_id), using=using)
+
+
+def archive(model, cutoff, chunk_size, using=DEFAULT_DB_ALIAS):
+    """
+    Move the archivable rows of model to its archive table, oldest first,
+    chunk_size rows per transaction so no lock is held for long. Returns
+    the number of rows moved.
+    """
+    chunks = (
+        archivable(model, cutoff)
+        .using(using)
+        .select_for_update(of=("self",))
+        .order_by("scheduled_date", "id")
+        .values("pk", "pet_id", "user_id")
+    )
+    moved = 0
+    while True:
+        with transaction.atomic(using=using):
+            rows = list(chunks[:chunk_size])
+            if not rows:
+                return moved
+            _move(model, [row["pk"] for row in rows], using)
+            _after_move(model, rows, using)
+        moved += len(rows)
+
+
+class IncludeArchivedMixin:
+    """
+    List views whose search form has an include_archived option. When it
+    is set, the rows of archive_queryset that pass the list's filters are
+    merged into its cursor pages and exports.
+    """
+
+    archive_queryset = None
+    search_form_class = None
+
+    @cached_property
+    def search_data(self):
+        form = self.search_form_class(self.request.GET)
+        return form.cleaned_data if form.is_valid() else {}
+
+    def filter_queryset(self, queryset):
+        return queryset
+
+    def get_merged_querysets(self):
+        if not self.search_data.get("include_archived"):
+            return ()
+        return (self.filter_queryset(self.archive_queryset.all()),)
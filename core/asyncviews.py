@@ -0,0 +1,100 @@
+from django.contrib.auth.mixins import LoginRequiredMixin
+from django.core.paginator import InvalidPage
+from django.http import Http404
+from django.utils.translation import gettext as _
+
+
+class AsyncLoginRequiredMixin(LoginRequiredMixin):
+    """
+    LoginRequiredMixin for views with async handlers, which load the user
+    with the async ORM. Views with sync handlers, such as exports built on
+    an async list view, are checked as usual.
+    """
+
+    def dispatch(self, request, *args, **kwargs):
+        if self.view_is_async:
+            return self.adispatch(request, *args, **kwargs)
+        return super().dispatch(request, *args, **kwargs)
+
+    async def adispatch(self, request, *args, **kwargs):
+        # Replacing the lazy request.user keeps templates, rendered in a
+        # worker thread, from loading the user a second time.
+        request.user = await request.auser()
+        if not request.user.is_authenticated:
+            return self.handle_no_permission()
+        return await super(LoginRequiredMixin, self).dispatch(request, *args, **kwargs)
+
+
+class AsyncListMixin:
+    """
+    Async get() for ListView. The page is fetched with the async ORM before
+    the context is built, and the TemplateResponse is rendered by the
+    handler in a worker thread, so the event loop never waits on the
+    database. Under WSGI the view runs as usual, one request per thread.
+    """
+
+    paginated = None
+
+    async def aget_queryset(self):
+        return self.get_queryset()
+
+    async def apaginate_queryset(self, queryset, page_size):
+        paginator = self.get_paginator(
+            queryset,
+            page_size,
+            orphans=self.get_paginate_orphans(),
+            allow_empty_first_page=self.get_allow_empty(),
+        )
+        paginator.count = await queryset.acount()
+        page_kwarg = self.page_kwarg
+        page = self.kwargs.get(page_kwarg) or self.request.GET.get(page_kwarg) or 1
+        try:
+            page_number = int(page)
+        except ValueError:
+            if page == "last":
+                page_number = paginator.num_pages
+            else:
+                raise Http404(_("Page is not “last”, nor can it be converted to an int."))
+        try:
+            page = paginator.page(page_number)
+        except InvalidPage as e:
+            raise Http404(
+                _("Invalid page (%(page_number)s): %(message)s")
+                % {"page_number": page_number, "message": str(e)}
+            )
+        # Iterating a queryset asynchronously fills its result cache.
+        page.object_list = [obj async for obj in page.object_list]
+        return paginator, page, page.object_list, page.has_other_pages()
+
+    async def aprepare_object_list(self, objects):
+        """Hook for mixins to load what the rows need before rendering."""
+
+    def get_paginate_by(self, queryset):
+        if self.paginated is not None:
+            return None
+        return super().get_paginate_by(queryset)
+
+    def get_context_data(self, **kwargs):
+        if self.paginated is None:
+            return super().get_context_data(**kwargs)
+        paginator, page, objects, is_paginated = self.paginated
+        context = super().get_context_data(**kwargs)
+        context.update(paginator=paginator, page_obj=page, is_paginated=is_paginated, object_list=objects)
+        context_object_name = self.get_context_object_name(self.object_list)
+        if context_object_name is not None:
+            context[context_object_name] = objects
+        return context
+
+    async def get(self, request, *args, **kwargs):
+        self.object_list = await self.aget_queryset()
+        page_size = self.get_paginate_by(self.object_list)
+        if page_size:
+            self.paginated = await self.apaginate_queryset(self.object_list, page_size)
+        else:
+            self.paginated = (None, None, [obj async for obj in self.object_list], False)
+        if not self.get_allow_empty() and not self.paginated[2]:
+            raise Http404(_("Empty list and “%(class_name)s.allow_empty” is False.") % {
+                "class_name": self.__class__.__name__,
+            })
+        await self.aprepare_object_list(self.paginated[2])
+        return self.render_to_response(self.get_context_data())
@@ -0,0 +1,230 @@
+from collections import defaultdict
+from functools import reduce
+from operator import or_
+
+from django import forms
+from django.core.exceptions import ValidationError
+from django.db import router
+from django.db.models import Q
+from django.db.models.signals import m2m_changed, post_save
+
+from core import counters
+
+
+class BulkFormMixin:
+    """
+    ModelForm mixin for validating many rows at once. Model choice fields
+    look objects up in choices, a dict per field mapping the values rows
+    use (primary keys from prefetch_choices(), or any other key) to
+    objects fetched once for the whole batch. Unique fields are checked by
+    validate_batch() instead of one query per form.
+    """
+
+    def __init__(self, *args, choices=None, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.batch_choices = choices or {}
+        for name, objects in self.batch_choices.items():
+            field = self.fields[name]
+            if isinstance(field, forms.ModelMultipleChoiceField):
+                field.clean = _multiple_choice_cleaner(field, objects)
+            else:
+                field.to_python = _choice_cleaner(field, objects)
+
+    def _get_validation_exclusions(self):
+        # The model would check each related object exists again, one query
+        # per row, but they all came out of the batch's choices.
+        exclude = super()._get_validation_exclusions()
+        exclude.update(self.batch_choices)
+        return exclude
+
+    def validate_unique(self):
+        pass
+
+
+def _lookup(field, objects, value):
+    try:
+        if value not in objects:
+            value = field.queryset.model._meta.pk.to_python(value)
+        return objects[value]
+    except (KeyError, TypeError, ValidationError):
+        raise ValidationError(
+            field.error_messages["invalid_choice"],
+            code="invalid_choice",
+            params={"value": value},
+        )
+
+
+def _choice_cleaner(field, objects):
+    def to_python(value):
+        if value in field.empty_values:
+            return None
+        return _lookup(field, objects, value)
+    return to_python
+
+
+def _multiple_choice_cleaner(field, objects):
+    def clean(value):
+        if not value:
+            if field.required:
+                raise ValidationError(field.error_messages["required"], code="required")
+            return []
+        if not isinstance(value, (list, tuple)):
+            raise ValidationError(field.error_messages["invalid_list"], code="invalid_list")
+        return [_lookup(field, objects, pk) for pk in value]
+    return clean
+
+
+def _choice_keys(field, values):
+    keys = set()
+    pk = field.queryset.model._meta.pk
+    for value in values:
+        try:
+            keys.add(pk.to_python(value))
+        except (TypeError, ValidationError):
+            pass
+    return keys
+
+
+def prefetch_choices(form_class, rows):
+    """Fetch every object the rows refer to, one query per model choice field."""
+    choices = {}
+    for name, field in form_class.base_fields.items():
+        if isinstance(field, forms.ModelMultipleChoiceField):
+            values = [
+                value
+                for row in rows if isinstance(row.get(name), (list, tuple))
+                for value in row[name]
+            ]
+        elif isinstance(field, forms.ModelChoiceField):
+            values = [row[name] for row in rows if row.get(name) not in field.empty_values]
+        else:
+            continue
+        choices[name] = field.queryset.in_bulk(_choice_keys(field, values))
+    return choices
+
+
+def validate_batch(forms_list):
+    """
+    Validate the forms, then check the model's unique fields across the
+    batch and against the database with one query per field.
+    """
+    for form in forms_list:
+        form.is_valid()
+    if not forms_list:
+        return True
+    model = forms_list[0]._meta.model
+    for field in model._meta.fields:
+        if not field.unique or field.primary_key:
+            continue
+        seen = dict()
+        for form in forms_list:
+            value = form.cleaned_data.get(field.name)
+            if value is None or field.name in form.errors:
+                continue
+            if value in seen:
+                form.add_error(field.name, form.instance.unique_error_message(model, (field.name,)))
+            else:
+                seen[value] = form
+        taken = model._default_manager.filter(
+            **{f"{field.name}__in": seen}
+        ).values_list(field.name, "pk")
+        for value, pk in taken:
+            form = seen[value]
+            if form.instance.pk != pk:
+                form.add_error(field.name, form.instance.unique_error_message(model, (field.name,)))
+    return not any(form.errors for form in forms_list)
+
+
+def bulk_create(model, objects, batch_size=None):
+    """bulk_create() that sends post_save so signal receivers stay current."""
+    using = router.db_for_write(model)
+    objects = model._default_manager.using(using).bulk_create(objects, batch_size=batch_size)
+    with counters.deferred():
+        for obj in objects:
+            post_save.send(
+                sender=model, instance=obj, created=True, update_fields=None, raw=False, using=using
+            )
+    return objects
+
+
+def bulk_update(model, objects, fields, batch_size=None):
+    """
+    bulk_update() that sends post_save so signal receivers stay current and
+    sets auto_now fields, which bulk_update() alone leaves untouched.
+    """
+    using = router.db_for_write(model)
+    for field in model._meta.concrete_fields:
+        if getattr(field, "auto_now", False) and field.name not in fields:
+            for obj in objects:
+                field.pre_save(obj, add=False)
+            fields = [*fields, field.name]
+    model._default_manager.using(using).bulk_update(objects, fields, batch_size=batch_size)
+    with counters.deferred():
+        for obj in objects:
+            post_save.send(
+                sender=model, instance=obj, created=False, update_fields=frozenset(fields),
+                raw=False, using=using,
+            )
+    return objects
+
+
+def _set_relations(field, instances, targets, using):
+    """
+    Make the relations of instances through field be targets ({pk: set of
+    related pks}), with one query to read them, one to delete and one to
+    insert for the whole batch.
+    """
+    through = field.remote_field.through
+    source = through._meta.get_field(field.m2m_field_name()).attname
+    target = through._meta.get_field(field.m2m_reverse_field_name()).attname
+    current = defaultdict(set)
+    rows = through._default_manager.using(using).filter(**{f"{source}__in": targets})
+    for source_id, target_id in rows.values_list(source, target):
+        current[source_id].add(target_id)
+    removed = {pk: current[pk] - wanted for pk, wanted in targets.items() if current[pk] - wanted}
+    added = {pk: wanted - current[pk] for pk, wanted in targets.items() if wanted - current[pk]}
+
+    def send(action, changes):
+        for pk, pk_set in changes.items():
+            # As the related manager does, drop relations prefetched before the change.
+            getattr(instances[pk], "_prefetched_objects_cache", {}).pop(field.name, None)
+            m2m_changed.send(
+                sender=through, instance=instances[pk], action=action, reverse=False,
+                model=field.related_model, pk_set=pk_set, using=using,
+            )
+
+    if removed:
+        send("pre_remove", removed)
+        through._default_manager.using(using).filter(reduce(or_, (
+            Q(**{source: pk, f"{target}__in": pk_set}) for pk, pk_set in removed.items()
+        ))).delete()
+        send("post_remove", removed)
+    if added:
+        send("pre_add", added)
+        through._default_manager.using(using).bulk_create([
+            through(**{source: pk, target: target_pk})
+            for pk, pk_set in added.items() for target_pk in pk_set
+        ])
+        send("post_add", added)
+
+
+def bulk_save_m2m(forms_list):
+    """
+    save_m2m() for a batch of forms whose instances were saved. Relations
+    are written with a fixed number of queries per many to many field, and
+    m2m_changed is sent per object inside counters.deferred(), so receivers
+    recount each counter once for the batch.
+    """
+    if not forms_list:
+        return
+    model = forms_list[0]._meta.model
+    using = router.db_for_write(model)
+    instances = {form.instance.pk: form.instance for form in forms_list}
+    with counters.deferred():
+        for field in model._meta.many_to_many:
+            targets = {
+                form.instance.pk: {obj.pk for obj in form.cleaned_data[field.name]}
+                for form in forms_list if field.name in form.cleaned_data
+            }
+            if targets:
+                _set_relations(field, instances, targets, using)
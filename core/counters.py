@@ -0,0 +1,127 @@
+from collections import Counter, defaultdict
+from contextlib import contextmanager
+from contextvars import ContextVar
+from functools import partial
+
+from django.contrib.auth import get_user_model
+from django.db import transaction
+from django.db.models import Case, Count, F, OuterRef, Subquery, Value, When
+from django.db.models.functions import Coalesce, Greatest
+
+from core import fragments
+from core.models import Pet, Activity, HealthEvent
+
+User = get_user_model()
+
+# Counter column: (counted model, its foreign key to the counter's model).
+COUNTERS = {
+    (Pet, "owner_count"): (Pet.owners.through, "pet"),
+    (Pet, "activity_count"): (Activity, "pet"),
+    (Pet, "health_event_count"): (HealthEvent, "pet"),
+    (User, "pet_count"): (Pet.owners.through, "user"),
+    (User, "activity_count"): (Activity, "user"),
+    (User, "health_event_count"): (HealthEvent, "user"),
+}
+
+# Counters kept by adjusting them as rows of the counted model come and go.
+FOREIGN_KEY_COUNTERS = {
+    Activity: {"pet_id": (Pet, "activity_count"), "user_id": (User, "activity_count")},
+    HealthEvent: {"pet_id": (Pet, "health_event_count"), "user_id": (User, "health_event_count")},
+}
+
+_deferred = ContextVar("deferred_counters", default=None)
+
+
+class _Pending:
+    def __init__(self):
+        self.deltas = defaultdict(Counter)
+        self.recounts = defaultdict(set)
+
+
+def count_expression(model, field):
+    """Correlated subquery counting the rows behind a counter."""
+    counted, foreign_key = COUNTERS[(model, field)]
+    counts = (
+        counted._default_manager.filter(**{foreign_key: OuterRef("pk")})
+        .order_by()
+        .values(foreign_key)
+        .annotate(count=Count("*"))
+        .values("count")
+    )
+    return Coalesce(Subquery(counts), 0)
+
+
+def recount(model, field, pks=None, using=None):
+    """
+    Recompute a counter from the database, for pks or for every row.
+    Inside deferred() the pks are collected instead and recounted with one
+    UPDATE per counter when the block exits.
+    """
+    pending = _deferred.get()
+    if pending is not None and pks is not None:
+        pending.recounts[(model, field, using)].update(pks)
+        return 0
+    return _recount(model, field, pks, using)
+
+
+def _recount(model, field, pks, using):
+    queryset = model._default_manager.using(using)
+    if pks is not None:
+        if not pks:
+            return 0
+        queryset = queryset.filter(pk__in=pks)
+        # List rows show counters, and update() sends no signal to retire them.
+        for pk in pks:
+            transaction.on_commit(partial(fragments.touch, model, pk), using=using)
+    return queryset.update(**{field: count_expression(model, field)})
+
+
+def _apply(model, field, deltas, using):
+    deltas = {pk: delta for pk, delta in deltas.items() if delta}
+    if not deltas:
+        return
+    if len(deltas) == 1:
+        change = Value(next(iter(deltas.values())))
+    else:
+        change = Case(*(When(pk=pk, then=Value(delta)) for pk, delta in deltas.items()), default=Value(0))
+    # A counter that drifted low must not go negative, which the column
+    # rejects, and fail the write that decrements it.
+    model._default_manager.using(using).filter(pk__in=deltas).update(
+        **{field: Greatest(F(field) + change, Value(0))}
+    )
+
+
+def adjust(model, field, deltas, using=None):
+    """
+    Add deltas ({pk: n}) to a counter with an F() expression, in the
+    caller's transaction. Inside deferred() the deltas are summed instead
+    and written when the block exits.
+    """
+    pending = _deferred.get()
+    if pending is not None:
+        pending.deltas[(model, field, using)].update(deltas)
+    else:
+        _apply(model, field, deltas, using)
+
+
+@contextmanager
+def deferred():
+    """
+    Sum counter changes and collect recounts made inside the block and
+    write them with one UPDATE per counter on exit, for bulk writes and
+    cascading deletes that would otherwise update the same rows once per
+    object. Use it inside the transaction of the write.
+    """
+    if _deferred.get() is not None:
+        yield
+        return
+    pending = _Pending()
+    token = _deferred.set(pending)
+    try:
+        yield
+    finally:
+        _deferred.reset(token)
+    for (model, field, using), deltas in pending.deltas.items():
+        _apply(model, field, deltas, using)
+    for (model, field, using), pks in pending.recounts.items():
+        _recount(model, field, pks, using)
@@ -0,0 +1,103 @@
+from collections import defaultdict
+from datetime import timedelta
+from itertools import islice
+
+from django.conf import settings
+from django.contrib.auth import get_user_model
+from django.core import mail
+from django.template.loader import get_template
+from django.utils import timezone
+
+from core.models import Activity, ActivityRule, HealthEvent
+from core.recurrence import expand
+from core.schedule import fetch_entries
+
+User = get_user_model()
+
+# Columns of the agenda UNION query, in order.
+AGENDA_FIELDS = ("user_id", "scheduled_date", "kind", "id", "title", "pet__name", "status__name")
+
+KIND_LABELS = {
+    "activity": "Activity",
+    "healthevent": "Health event",
+    "recurring": "Recurring activity",
+}
+
+
+def fetch_agendas(user_ids, start, end):
+    """
+    Activities, health events and unmaterialized recurring activities of
+    the users from start to end, as {user id: [{"date", "entries"}]} in
+    date order. At most three queries whatever the number of users: one UNION ALL
+    of activities and health events, the rules, and their materialized
+    occurrences.
+    """
+    days = defaultdict(lambda: defaultdict(list))
+    querysets = {
+        "activity": Activity.objects.filter(user_id__in=user_ids),
+        "healthevent": HealthEvent.objects.filter(user_id__in=user_ids),
+    }
+    for user_id, scheduled_date, kind, pk, title, pet, status in fetch_entries(
+        querysets, start, end, fields=AGENDA_FIELDS
+    ):
+        days[user_id][scheduled_date].append(
+            {"kind": KIND_LABELS[kind], "title": title, "pet": pet, "status": status}
+        )
+    rules = ActivityRule.objects.filter(user_id__in=user_ids).select_related("pet", "status")
+    for occurrence in expand(rules, start, end):
+        if occurrence.is_materialized:
+            continue
+        days[occurrence.rule.user_id][occurrence.date].append({
+            "kind": KIND_LABELS["recurring"],
+            "title": occurrence.title,
+            "pet": occurrence.rule.pet.name,
+            "status": occurrence.status.name if occurrence.status else None,
+        })
+    return {
+        user_id: [{"date": day, "entries": by_date[day]} for day in sorted(by_date)]
+        for user_id, by_date in days.items()
+    }
+
+
+def recipients():
+    return (
+        User.objects.filter(is_active=True)
+        .exclude(email="")
+        .order_by("pk")
+        .only("pk", "username", "first_name", "email")
+    )
+
+
+def send_digests(days=None, batch_size=None):
+    """
+    Email every active user with an email address and anything scheduled
+    their agenda for the next days days. Users are read batch_size at a
+    time, each batch's agendas in three queries and its emails over one
+    mail connection. Returns the number of digests sent.
+    """
+    if days is None:
+        days = settings.DIGEST_DAYS
+    if batch_size is None:
+        batch_size = settings.DIGEST_BATCH_SIZE
+    start = timezone.localdate()
+    end = start + timedelta(days=days - 1)
+    # Compiled once, rendered for every user.
+    template = get_template("core/digest.txt")
+
+    sent = 0
+    users = recipients().iterator(chunk_size=batch_size)
+    while batch := list(islice(users, batch_size)):
+        agendas = fetch_agendas([user.pk for user in batch], start, end)
+        messages = [
+            mail.EmailMessage(
+                subject=f"Your PetCare agenda from {start:%b %d}",
+                body=template.render({"user": user, "agenda": agendas[user.pk], "end": end}),
+                to=[user.email],
+            )
+            for user in batch
+            if user.pk in agendas
+        ]
+        if messages:
+            with mail.get_connection() as connection:
+                sent += connection.send_messages(messages)
+    return sent
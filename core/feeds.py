@@ -0,0 +1,181 @@
+import hashlib
+from datetime import timezone as dt_timezone
+
+from django.core import signing
+from django.core.cache import cache
+from django.utils import timezone
+
+from core.models import Activity, ActivityRule, HealthEvent
+
+SALT = "core.feeds"
+
+WATERMARK_KEY_PREFIX = "feed_watermark"
+
+# Lines longer than this many octets are folded (RFC 5545 3.1).
+LINE_LENGTH = 75
+
+RULE_FREQUENCIES = {
+    ActivityRule.Frequency.DAILY: "DAILY",
+    ActivityRule.Frequency.WEEKLY: "WEEKLY",
+    ActivityRule.Frequency.MONTHLY: "MONTHLY",
+    ActivityRule.Frequency.YEARLY: "YEARLY",
+}
+
+
+def feed_token(user):
+    return signing.Signer(salt=SALT).sign(str(user.pk))
+
+
+def feed_user_id(token):
+    """Primary key the token was issued for, None if it is not genuine."""
+    try:
+        return int(signing.Signer(salt=SALT).unsign(token))
+    except (signing.BadSignature, ValueError):
+        return None
+
+
+def _watermark_key(user_id):
+    return f"{WATERMARK_KEY_PREFIX}:{user_id if user_id is not None else 'all'}"
+
+
+def touch(user_id=None):
+    """
+    Move a user's feed watermark to now, or every user's when user_id is
+    None (a pet, whose name every feed may show, changed).
+    """
+    cache.set(_watermark_key(user_id), timezone.now(), None)
+
+
+def get_watermark(user_id):
+    """
+    When the user's feed last changed, from the cache alone. A watermark
+    missing from the cache starts at now, which costs each client one full
+    download but never hides a change.
+    """
+    keys = [_watermark_key(user_id), _watermark_key(None)]
+    watermarks = cache.get_many(keys)
+    for key in set(keys) - watermarks.keys():
+        now = timezone.now()
+        watermarks[key] = now if cache.add(key, now, None) else cache.get(key, now)
+    return max(watermarks.values())
+
+
+def feed_etag(request, token):
+    user_id = feed_user_id(token)
+    if user_id is None:
+        return None
+    watermark = get_watermark(user_id)
+    return hashlib.md5(f"{user_id}:{watermark.isoformat()}".encode()).hexdigest()
+
+
+def feed_last_modified(request, token):
+    user_id = feed_user_id(token)
+    if user_id is None:
+        return None
+    return get_watermark(user_id)
+
+
+def escape(text):
+    return (
+        text.replace("\\", "\\\\")
+        .replace(";", "\\;")
+        .replace(",", "\\,")
+        .replace("\r\n", "\\n")
+        .replace("\n", "\\n")
+    )
+
+
+def fold(line):
+    """Split a content line into CRLF terminated lines of at most 75 octets."""
+    encoded = line.encode()
+    if len(encoded) <= LINE_LENGTH:
+        return line + "\r\n"
+    parts = []
+    limit = LINE_LENGTH
+    while encoded:
+        cut = min(limit, len(encoded))
+        # Never split a multi-byte character.
+        while cut < len(encoded) and encoded[cut] & 0xC0 == 0x80:
+            cut -= 1
+        parts.append(encoded[:cut].decode())
+        encoded = encoded[cut:]
+        # Continuation lines start with a space, which counts towards the limit.
+        limit = LINE_LENGTH - 1
+    return "\r\n ".join(parts) + "\r\n"
+
+
+def format_date(day):
+    return day.strftime("%Y%m%d")
+
+
+def event(uid, stamp, day, summary, description="", categories="", extra=()):
+    lines = [
+        "BEGIN:VEVENT",
+        f"UID:{uid}",
+        f"DTSTAMP:{stamp}",
+        f"DTSTART;VALUE=DATE:{format_date(day)}",
+        f"SUMMARY:{escape(summary)}",
+    ]
+    if description:
+        lines.append(f"DESCRIPTION:{escape(description)}")
+    if categories:
+        lines.append(f"CATEGORIES:{escape(categories)}")
+    lines.extend(extra)
+    lines.append("END:VEVENT")
+    return "".join(fold(line) for line in lines)
+
+
+def rule_lines(rule, exdates):
+    rrule = f"RRULE:FREQ={RULE_FREQUENCIES[rule.frequency]};INTERVAL={rule.interval}"
+    if rule.end_date:
+        rrule += f";UNTIL={format_date(rule.end_date)}"
+    lines = [rrule]
+    if exdates:
+        lines.append(f"EXDATE;VALUE=DATE:{','.join(format_date(day) for day in sorted(exdates))}")
+    return lines
+
+
+def stream_feed(user_id, watermark, chunk_size=2000):
+    """
+    Yield the user's activities, health events and recurring activities as
+    an iCalendar document. Recurring activities become RRULE events, with
+    their materialized occurrences excluded since those are listed as
+    activities of their own.
+    """
+    stamp = watermark.astimezone(dt_timezone.utc).strftime("%Y%m%dT%H%M%SZ")
+    yield fold("BEGIN:VCALENDAR")
+    yield fold("VERSION:2.0")
+    yield fold("PRODID:-//PetCare//Activity feed//EN")
+    yield fold("CALSCALE:GREGORIAN")
+    yield fold("X-WR-CALNAME:PetCare")
+
+    sources = (
+        ("activity", "Activity", Activity.objects.filter(user_id=user_id)),
+        ("healthevent", "Health event", HealthEvent.objects.filter(user_id=user_id)),
+    )
+    for kind, category, queryset in sources:
+        rows = (
+            queryset.order_by("scheduled_date", "id")
+            .values_list("id", "title", "description", "scheduled_date", "pet__name")
+            .iterator(chunk_size=chunk_size)
+        )
+        for pk, title, description, scheduled_date, pet in rows:
+            yield event(
+                f"{kind}-{pk}@petcare", stamp, scheduled_date, f"{title} ({pet})",
+                description, category,
+            )
+
+    rules = list(ActivityRule.objects.filter(user_id=user_id).select_related("pet"))
+    exdates = {rule.pk: [] for rule in rules}
+    for rule_id, occurrence_date in Activity.objects.filter(rule__in=rules).values_list(
+        "rule_id", "occurrence_date"
+    ):
+        exdates[rule_id].append(occurrence_date)
+    for rule in rules:
+        yield event(
+            f"activityrule-{rule.pk}@petcare", stamp, rule.start_date,
+            f"{rule.title} ({rule.pet.name})", rule.description, "Activity",
+            rule_lines(rule, exdates[rule.pk]),
+        )
+
+    yield fold("END:VCALENDAR")
@@ -2,7 +2,8 @@ from django.contrib.auth.forms import UserCreationForm
 from django.contrib.auth import get_user_model
 from django import forms
 
-from core.models import Pet, Activity, HealthEvent, Status, Priority
+from core.models import Pet, Activity, ActivityRule, HealthEvent, Status, Priority
+from core.widgets import AutocompleteSelect
 
 User = get_user_model()
 
@@ -43,21 +44,59 @@ class ActivityForm(forms.ModelForm):
         model = Activity
         fields = "__all__"
 
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.fields["pet"].queryset = self.fields["pet"].queryset.select_related("species")
+
+
+class ActivityRuleForm(forms.ModelForm):
+    class Meta:
+        model = ActivityRule
+        fields = "__all__"
+        widgets = {
+            "start_date": forms.DateInput(attrs={"type": "date"}),
+            "end_date": forms.DateInput(attrs={"type": "date"}),
+        }
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.fields["pet"].queryset = self.fields["pet"].queryset.select_related("species")
+
 
 class ActivitySearchForm(forms.Form):
     title = forms.CharField(required=False)
     status = forms.ModelChoiceField(
         queryset=Status.objects.all(),
-        required=False
+        required=False,
+        empty_label="All Statuses",
+        widget=AutocompleteSelect(
+            "core:status-autocomplete",
+            attrs={"class": "form-select form-select-sm"},
+        ),
     )
     pets = forms.ModelChoiceField(
         queryset=Pet.objects.all(),
-        required=False
+        required=False,
+        empty_label="All Pets",
+        widget=AutocompleteSelect(
+            "core:pet-autocomplete",
+            attrs={"class": "form-select form-select-sm"},
+        ),
     )
     users = forms.ModelChoiceField(
         queryset=User.objects.all(),
-        required=False
+        required=False,
+        empty_label="All Users",
+        widget=AutocompleteSelect(
+            "core:user-autocomplete",
+            attrs={"class": "form-select form-select-sm"},
+        ),
     )
+    include_archived = forms.BooleanField(required=False)
+
+
+class ActivityRuleSearchForm(forms.Form):
+    title = forms.CharField(required=False)
 
 
 class HealthEventForm(forms.ModelForm):
@@ -65,25 +104,50 @@ class HealthEventForm(forms.ModelForm):
         model = HealthEvent
         fields = "__all__"
 
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.fields["pet"].queryset = self.fields["pet"].queryset.select_related("species")
+
 
 class HealthEventSearchForm(forms.Form):
     title = forms.CharField(required=False)
     status = forms.ModelChoiceField(
         queryset=Status.objects.all(),
-        required=False
+        required=False,
+        empty_label="All Statuses",
+        widget=AutocompleteSelect(
+            "core:status-autocomplete",
+            attrs={"class": "form-select form-select-sm"},
+        ),
     )
     priority = forms.ModelChoiceField(
         queryset=Priority.objects.all(),
-        required=False
+        required=False,
+        empty_label="All Priorities",
+        widget=AutocompleteSelect(
+            "core:priority-autocomplete",
+            attrs={"class": "form-select form-select-sm"},
+        ),
     )
     pets = forms.ModelChoiceField(
         queryset=Pet.objects.all(),
-        required=False
+        required=False,
+        empty_label="All Pets",
+        widget=AutocompleteSelect(
+            "core:pet-autocomplete",
+            attrs={"class": "form-select form-select-sm"},
+        ),
     )
     users = forms.ModelChoiceField(
         queryset=User.objects.all(),
-        required=False
+        required=False,
+        empty_label="All Users",
+        widget=AutocompleteSelect(
+            "core:user-autocomplete",
+            attrs={"class": "form-select form-select-sm"},
+        ),
     )
+    include_archived = forms.BooleanField(required=False)
 
 
 class SpeciesSearchForm(forms.Form):
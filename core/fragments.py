@@ -0,0 +1,105 @@
+import hashlib
+from uuid import uuid4
+
+from django.conf import settings
+from django.core.cache import cache
+
+from core.routers import reads_from_replica
+
+
+def version_key(model, pk):
+    return f"fragment_version:{model._meta.label_lower}:{pk}"
+
+
+def touch(model, pk):
+    """Give an object a new version stamp, retiring every fragment that shows it."""
+    cache.set(version_key(model, pk), uuid4().hex, None)
+
+
+def get_versions(keys):
+    versions = cache.get_many(keys)
+    for key in set(keys) - versions.keys():
+        stamp = uuid4().hex
+        if not cache.add(key, stamp, None):
+            stamp = cache.get(key, stamp)
+        versions[key] = stamp
+    return versions
+
+
+async def aget_versions(keys):
+    versions = await cache.aget_many(keys)
+    for key in set(keys) - versions.keys():
+        stamp = uuid4().hex
+        if not await cache.aadd(key, stamp, None):
+            stamp = await cache.aget(key, stamp)
+        versions[key] = stamp
+    return versions
+
+
+def fragment_key(name, dependencies, versions):
+    stamps = ",".join(f"{key}={versions[key]}" for key in dependencies)
+    return f"fragment:{name}:{hashlib.md5(stamps.encode()).hexdigest()}"
+
+
+def row_dependencies(obj, fields):
+    keys = [version_key(type(obj), obj.pk)]
+    for name in fields:
+        field = obj._meta.get_field(name)
+        pk = getattr(obj, field.attname)
+        if pk is not None:
+            keys.append(version_key(field.related_model, pk))
+    return keys
+
+
+def attach_row_fragments(name, objects, fields=()):
+    """
+    Look up the cached fragment of every row in two cache round trips and
+    store (key, html) on each object for the rowfragment template tag.
+    html is None for rows that still have to be rendered.
+    """
+    dependencies = {obj.pk: row_dependencies(obj, fields) for obj in objects}
+    versions = get_versions(list({key for keys in dependencies.values() for key in keys}))
+    keys = {pk: fragment_key(name, deps, versions) for pk, deps in dependencies.items()}
+    fragments = cache.get_many(list(keys.values()))
+    for obj in objects:
+        key = keys[obj.pk]
+        obj.row_fragment = (key, fragments.get(key))
+
+
+async def aattach_row_fragments(name, objects, fields=()):
+    dependencies = {obj.pk: row_dependencies(obj, fields) for obj in objects}
+    versions = await aget_versions(list({key for keys in dependencies.values() for key in keys}))
+    keys = {pk: fragment_key(name, deps, versions) for pk, deps in dependencies.items()}
+    fragments = await cache.aget_many(list(keys.values()))
+    for obj in objects:
+        key = keys[obj.pk]
+        obj.row_fragment = (key, fragments.get(key))
+
+
+def store_fragment(key, html):
+    # A row read from a lagging replica can predate the versions in its key.
+    if reads_from_replica():
+        return
+    cache.set(key, html, settings.ROW_FRAGMENT_TIMEOUT)
+
+
+class RowFragmentMixin:
+    """
+    Serve list rows from the fragment cache. A row's key is built from the
+    version stamps of the object and of the related objects named in
+    row_fragment_dependencies, so saving any of them retires the row.
+    """
+
+    row_fragment = None
+    row_fragment_dependencies = ()
+
+    def get_context_data(self, **kwargs):
+        context = super().get_context_data(**kwargs)
+        # Async views have attached the fragments already.
+        objects = [obj for obj in context["object_list"] if not hasattr(obj, "row_fragment")]
+        attach_row_fragments(self.row_fragment, objects, self.row_fragment_dependencies)
+        return context
+
+    async def aprepare_object_list(self, objects):
+        await aattach_row_fragments(self.row_fragment, objects, self.row_fragment_dependencies)
+        await super().aprepare_object_list(objects)
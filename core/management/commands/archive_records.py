@@ -0,0 +1,45 @@
+from datetime import date, timedelta
+
+from django.conf import settings
+from django.core.management.base import BaseCommand
+from django.utils import timezone
+
+from core.archive import ARCHIVES, archivable, archive
+
+
+class Command(BaseCommand):
+    help = (
+        "Move activities and health events with a terminal status that were "
+        "scheduled before the cutoff to the archive tables, in chunks of one "
+        "transaction each. List views show archived rows on request only."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--before",
+            type=date.fromisoformat,
+            help="Archive rows scheduled before this date (default ARCHIVE_AFTER_DAYS days ago).",
+        )
+        parser.add_argument(
+            "--chunk-size",
+            type=int,
+            default=settings.ARCHIVE_CHUNK_SIZE,
+            help="Rows moved per transaction.",
+        )
+        parser.add_argument(
+            "--dry-run",
+            action="store_true",
+            help="Count the rows that would be archived without moving them.",
+        )
+
+    def handle(self, *args, before, chunk_size, dry_run, **options):
+        cutoff = before or timezone.localdate() - timedelta(days=settings.ARCHIVE_AFTER_DAYS)
+        for model in ARCHIVES:
+            if dry_run:
+                count = archivable(model, cutoff).count()
+            else:
+                count = archive(model, cutoff, chunk_size)
+            self.stdout.write(
+                f"{model._meta.verbose_name_plural}: {count} "
+                f"{'to archive' if dry_run else 'archived'} (scheduled before {cutoff})"
+            )
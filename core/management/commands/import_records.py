@@ -0,0 +1,171 @@
+import csv
+import json
+import sys
+import time
+from itertools import islice
+
+from django import forms
+from django.core.management.base import BaseCommand, CommandError
+from django.db import IntegrityError, transaction
+
+from core.bulk import BulkFormMixin, validate_batch, bulk_create, bulk_save_m2m
+from core.forms import PetForm, ActivityForm, HealthEventForm
+
+# Resource: (form, {related field: attribute rows refer to it by}).
+RESOURCES = {
+    "pets": (PetForm, {"species": "name", "owners": "username"}),
+    "activities": (ActivityForm, {"user": "username", "pet": "name", "status": "name"}),
+    "healthevents": (
+        HealthEventForm,
+        {"user": "username", "pet": "name", "status": "name", "priority": "name"},
+    ),
+}
+
+# Separator of the values of a many-to-many column in CSV files.
+MULTIPLE_SEPARATOR = ";"
+
+
+def read_csv(file):
+    reader = csv.DictReader(file)
+    for row in reader:
+        yield reader.line_num, row
+
+
+def read_jsonl(file):
+    for line_num, line in enumerate(file, 1):
+        if not line.strip():
+            continue
+        try:
+            row = json.loads(line)
+        except ValueError as e:
+            raise CommandError(f"line {line_num}: invalid JSON: {e}")
+        if not isinstance(row, dict):
+            raise CommandError(f"line {line_num}: expected a JSON object")
+        yield line_num, row
+
+
+READERS = {"csv": read_csv, "jsonl": read_jsonl}
+
+
+class Command(BaseCommand):
+    help = (
+        "Import pets, activities or health events from a CSV or JSON Lines file. "
+        "Related objects are referred to by name (usernames for users), and pet "
+        f"owners in CSV files are separated by '{MULTIPLE_SEPARATOR}'. Rows are read "
+        "as a stream and validated and inserted one chunk at a time, each chunk "
+        "in its own transaction. Invalid rows are reported and skipped."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("resource", choices=RESOURCES)
+        parser.add_argument("path", help="File to import, '-' for standard input.")
+        parser.add_argument(
+            "--format",
+            dest="input_format",
+            choices=READERS,
+            help="Defaults to the file extension.",
+        )
+        parser.add_argument("--chunk-size", type=int, default=1000)
+        parser.add_argument(
+            "--dry-run",
+            action="store_true",
+            help="Validate and insert every chunk, then roll it back.",
+        )
+
+    def handle(self, *args, resource, path, input_format, chunk_size, dry_run, **options):
+        if input_format is None:
+            if path == "-":
+                raise CommandError("--format is required when reading standard input.")
+            input_format = "jsonl" if path.endswith((".jsonl", ".ndjson")) else "csv"
+
+        form_class, lookups = RESOURCES[resource]
+        form_class = type(f"Import{form_class.__name__}", (BulkFormMixin, form_class), {})
+        choices = self.build_choices(form_class, lookups)
+
+        file = sys.stdin if path == "-" else open(path, newline="", encoding="utf-8")
+        try:
+            rows = READERS[input_format](file)
+            self.imported = self.invalid = 0
+            self.start = time.perf_counter()
+            while chunk := list(islice(rows, chunk_size)):
+                self.import_chunk(form_class, choices, chunk, dry_run)
+                self.report_progress()
+        finally:
+            if file is not sys.stdin:
+                file.close()
+
+        self.stdout.write(self.style.SUCCESS(
+            f"{'Validated' if dry_run else 'Imported'} {self.imported} rows, "
+            f"skipped {self.invalid} invalid rows."
+        ))
+
+    def build_choices(self, form_class, lookups):
+        """Load every object rows can refer to once, keyed by the attribute they use."""
+        choices = {}
+        for name, attribute in lookups.items():
+            queryset = form_class.base_fields[name].queryset
+            choices[name] = {getattr(obj, attribute): obj for obj in queryset.iterator()}
+        return choices
+
+    def prepare(self, form_class, row):
+        for name, field in form_class.base_fields.items():
+            value = row.get(name)
+            if value == "":
+                row[name] = None
+            elif isinstance(field, forms.ModelMultipleChoiceField) and isinstance(value, str):
+                row[name] = [item.strip() for item in value.split(MULTIPLE_SEPARATOR) if item.strip()]
+        return row
+
+    def import_chunk(self, form_class, choices, chunk, dry_run):
+        line_nums = [line_num for line_num, row in chunk]
+        forms_list = [
+            form_class(data=self.prepare(form_class, row), choices=choices) for line_num, row in chunk
+        ]
+        validate_batch(forms_list)
+
+        valid = list()
+        for line_num, form in zip(line_nums, forms_list):
+            if form.errors:
+                self.invalid += 1
+                for field, errors in form.errors.items():
+                    self.stderr.write(f"line {line_num}: {field}: {' '.join(errors)}")
+            else:
+                valid.append((line_num, form))
+
+        with transaction.atomic():
+            self.insert(form_class, valid)
+            transaction.set_rollback(dry_run)
+
+    def insert(self, form_class, rows):
+        """
+        Insert rows ((line number, form)) under a savepoint. If the database
+        rejects one of them, insert each half under its own savepoint, down
+        to the rows at fault, so the other rows are kept.
+        """
+        if not rows:
+            return
+        try:
+            with transaction.atomic():
+                bulk_create(form_class._meta.model, [form.save(commit=False) for line_num, form in rows])
+                bulk_save_m2m([form for line_num, form in rows])
+        except IntegrityError as e:
+            for line_num, form in rows:
+                form.instance.pk = None
+                form.instance._state.adding = True
+            if len(rows) == 1:
+                self.invalid += 1
+                self.stderr.write(f"line {rows[0][0]}: {e}")
+                return
+            middle = len(rows) // 2
+            self.insert(form_class, rows[:middle])
+            self.insert(form_class, rows[middle:])
+        else:
+            self.imported += len(rows)
+
+    def report_progress(self):
+        elapsed = time.perf_counter() - self.start
+        rate = (self.imported + self.invalid) / elapsed if elapsed else 0
+        self.stdout.write(
+            f"{self.imported + self.invalid} rows processed, {self.invalid} invalid, "
+            f"{rate:.0f} rows/s"
+        )
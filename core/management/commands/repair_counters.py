@@ -0,0 +1,43 @@
+from django.core.management.base import BaseCommand
+from django.db import transaction
+from django.db.models import F
+
+from core.counters import COUNTERS, count_expression, recount
+
+
+class Command(BaseCommand):
+    help = (
+        "Compare the relationship counters of pets and users with the rows they "
+        "count, report the rows that drifted and recount them, one UPDATE per "
+        "counter. Counters only drift when rows are written around the ORM."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--dry-run",
+            action="store_true",
+            help="Report drifted counters without repairing them.",
+        )
+
+    def handle(self, *args, dry_run, **options):
+        repaired = 0
+        with transaction.atomic():
+            for model, field in COUNTERS:
+                drifted = dict(
+                    model._default_manager.annotate(actual=count_expression(model, field))
+                    .exclude(**{field: F("actual")})
+                    .values_list("pk", "actual")
+                )
+                if not drifted:
+                    continue
+                self.stdout.write(
+                    f"{model._meta.verbose_name} {field}: {len(drifted)} drifted "
+                    f"({', '.join(map(str, drifted))})"
+                )
+                if not dry_run:
+                    recount(model, field, drifted)
+                repaired += len(drifted)
+
+        self.stdout.write(self.style.SUCCESS(
+            f"{'Found' if dry_run else 'Repaired'} {repaired} drifted counters."
+        ))
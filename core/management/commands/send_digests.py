@@ -0,0 +1,26 @@
+from django.core.management.base import BaseCommand
+
+from core.digest import send_digests
+
+
+class Command(BaseCommand):
+    help = (
+        "Email every user their activities and health events of the coming "
+        "days, a batch of users at a time over one mail connection per batch."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--days",
+            type=int,
+            help="Days covered by the digest, starting today (default DIGEST_DAYS).",
+        )
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            help="Users whose digests are built and sent together (default DIGEST_BATCH_SIZE).",
+        )
+
+    def handle(self, *args, days, batch_size, **options):
+        sent = send_digests(days=days, batch_size=batch_size)
+        self.stdout.write(f"Sent {sent} digests.")
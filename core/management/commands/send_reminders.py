@@ -0,0 +1,40 @@
+import time
+
+from django.core.management.base import BaseCommand
+from django.db import close_old_connections
+
+from core.reminders import send_reminders
+
+
+class Command(BaseCommand):
+    help = (
+        "Email the users of health events that became due since the last run, "
+        "highest ranked priority first. Run it from cron, or with --interval "
+        "as a long-running worker."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--lead-days",
+            type=int,
+            help="Remind events due in this many days (default REMINDER_LEAD_DAYS).",
+        )
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            help="Emails sent per mail connection (default REMINDER_BATCH_SIZE).",
+        )
+        parser.add_argument(
+            "--interval",
+            type=float,
+            help="Keep running, sending new reminders every this many seconds.",
+        )
+
+    def handle(self, *args, lead_days, batch_size, interval, **options):
+        while True:
+            sent = send_reminders(lead_days=lead_days, batch_size=batch_size)
+            self.stdout.write(f"Sent {sent} reminders.")
+            if not interval:
+                return
+            close_old_connections()
+            time.sleep(interval)
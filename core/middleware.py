@@ -0,0 +1,259 @@
+import json
+import logging
+import random
+from contextlib import ExitStack
+from time import perf_counter
+
+from asgiref.sync import iscoroutinefunction, markcoroutinefunction, sync_to_async
+from django.conf import settings
+from django.core.exceptions import MiddlewareNotUsed
+from django.db import connections
+from django.views.generic import DetailView, ListView
+from whitenoise.middleware import WhiteNoiseMiddleware
+
+from core.routers import STICKY_COOKIE, ReplicaState, replica_state
+
+logger = logging.getLogger("core.timing")
+
+
+class RequestTiming:
+    def __init__(self):
+        self.start = perf_counter()
+        self.queries = 0
+        self.db_time = 0.0
+        self.view_start = None
+        self.view_time = None
+        self.template_start = None
+        self.template_time = None
+
+    def __call__(self, execute, sql, params, many, context):
+        start = perf_counter()
+        try:
+            return execute(sql, params, many, context)
+        finally:
+            self.queries += 1
+            self.db_time += perf_counter() - start
+
+    def view_started(self):
+        self.view_start = perf_counter()
+
+    def view_finished(self):
+        if self.view_start is not None and self.view_time is None:
+            self.view_time = perf_counter() - self.view_start
+
+    def template_started(self):
+        self.template_start = perf_counter()
+
+    def template_finished(self, response):
+        self.template_time = perf_counter() - self.template_start
+
+    def metrics(self):
+        total = perf_counter() - self.start
+        metrics = {
+            "total": total,
+            "db": self.db_time,
+            "view": self.view_time,
+            "template": self.template_time,
+        }
+        return {name: round(value * 1000, 2) for name, value in metrics.items() if value is not None}
+
+    def server_timing(self, metrics):
+        entries = list()
+        for name, duration in metrics.items():
+            entry = f"{name};dur={duration}"
+            if name == "db":
+                entry += f';desc="{self.queries} queries"'
+            entries.append(entry)
+        return ", ".join(entries)
+
+
+class RequestTimingMiddleware:
+    """
+    Record query count, database, view and template time for a sampled
+    fraction of requests and log requests slower than
+    REQUEST_TIMING_SLOW_MS. The measurements are reported in a
+    Server-Timing header to staff users only, or to everyone with DEBUG.
+    Unsampled requests go straight through.
+    """
+
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+        self.sample_rate = settings.REQUEST_TIMING_SAMPLE_RATE
+        self.slow_ms = settings.REQUEST_TIMING_SLOW_MS
+        self.debug = settings.DEBUG
+        if iscoroutinefunction(self.get_response):
+            markcoroutinefunction(self)
+
+    def sample(self, request):
+        if self.sample_rate <= 0 or random.random() >= self.sample_rate:
+            return None
+        timing = request._timing = RequestTiming()
+        return timing
+
+    def wrap_connections(self, timing):
+        stack = ExitStack()
+        for alias in connections:
+            stack.enter_context(connections[alias].execute_wrapper(timing))
+        return stack
+
+    def __call__(self, request):
+        if iscoroutinefunction(self):
+            return self.__acall__(request)
+        timing = self.sample(request)
+        if timing is None:
+            return self.get_response(request)
+        with self.wrap_connections(timing):
+            response = self.get_response(request)
+        return self.report(request, response, timing)
+
+    async def __acall__(self, request):
+        timing = self.sample(request)
+        if timing is None:
+            return await self.get_response(request)
+        # Connections belong to threads: wrap the ones of the thread the
+        # async ORM runs this request's queries in.
+        stack = await sync_to_async(self.wrap_connections)(timing)
+        try:
+            response = await self.get_response(request)
+        finally:
+            await sync_to_async(stack.close)()
+        return self.report(request, response, timing)
+
+    def loaded_user(self, request):
+        # The user AuthenticationMiddleware loaded for the view, if it did.
+        # Views that never look at the user, such as the calendar feed,
+        # do not pay for loading it here.
+        return getattr(request, "_cached_user", None) or getattr(request, "_acached_user", None)
+
+    def report(self, request, response, timing):
+        timing.view_finished()
+
+        metrics = timing.metrics()
+        # Query counts and timings tell about the internals of the site.
+        user = self.loaded_user(request)
+        if self.debug or (user is not None and user.is_staff):
+            response["Server-Timing"] = timing.server_timing(metrics)
+        if metrics["total"] >= self.slow_ms:
+            logger.warning("Slow request %s", json.dumps({
+                "method": request.method,
+                "path": request.path,
+                "status": response.status_code,
+                "queries": timing.queries,
+                **{f"{name}_ms": duration for name, duration in metrics.items()},
+            }))
+        return response
+
+    def process_view(self, request, view_func, view_args, view_kwargs):
+        timing = getattr(request, "_timing", None)
+        if timing is not None:
+            timing.view_started()
+
+    def process_template_response(self, request, response):
+        timing = getattr(request, "_timing", None)
+        if timing is not None:
+            timing.view_finished()
+            timing.template_started()
+            response.add_post_render_callback(timing.template_finished)
+        return response
+
+
+class AsyncWhiteNoiseMiddleware(WhiteNoiseMiddleware):
+    """
+    WhiteNoiseMiddleware that can also run in an async middleware chain.
+    The stock middleware is sync only, and one sync middleware makes
+    Django hold a thread for every request under ASGI, async views
+    included.
+    """
+
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response=None, *args, **kwargs):
+        super().__init__(get_response, *args, **kwargs)
+        if iscoroutinefunction(self.get_response):
+            markcoroutinefunction(self)
+
+    def find_static_file(self, request):
+        if self.autorefresh:
+            return self.find_file(request.path_info)
+        return self.files.get(request.path_info)
+
+    def __call__(self, request):
+        if iscoroutinefunction(self):
+            return self.__acall__(request)
+        static_file = self.find_static_file(request)
+        if static_file is not None:
+            return self.serve(static_file, request)
+        return self.get_response(request)
+
+    async def __acall__(self, request):
+        static_file = self.find_static_file(request)
+        if static_file is not None:
+            return self.serve(static_file, request)
+        return await self.get_response(request)
+
+
+class ReplicaMiddleware:
+    """
+    Pick a replica for the reads of GET and HEAD requests to list and
+    detail views and views marked with replica_reads. Requests that write
+    set a cookie that keeps the browser's reads on the primary for
+    REPLICA_STICKY_SECONDS, so users see their own changes before the
+    replicas catch up.
+    """
+
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response):
+        if not settings.REPLICA_DATABASES:
+            raise MiddlewareNotUsed
+        self.get_response = get_response
+        self.replicas = list(settings.REPLICA_DATABASES)
+        self.sticky_seconds = settings.REPLICA_STICKY_SECONDS
+        if iscoroutinefunction(self.get_response):
+            markcoroutinefunction(self)
+
+    def __call__(self, request):
+        if iscoroutinefunction(self):
+            return self.__acall__(request)
+        state = ReplicaState()
+        token = replica_state.set(state)
+        try:
+            response = self.get_response(request)
+        finally:
+            replica_state.reset(token)
+        return self.stick(state, response)
+
+    async def __acall__(self, request):
+        # The async ORM copies the context into the threads it runs queries
+        # in, the state object is shared with them.
+        state = ReplicaState()
+        token = replica_state.set(state)
+        try:
+            response = await self.get_response(request)
+        finally:
+            replica_state.reset(token)
+        return self.stick(state, response)
+
+    def stick(self, state, response):
+        if state.wrote:
+            response.set_cookie(
+                STICKY_COOKIE, "1", max_age=self.sticky_seconds, httponly=True, samesite="Lax"
+            )
+        return response
+
+    def reads_from_replica(self, view_func):
+        view_class = getattr(view_func, "view_class", None)
+        if view_class is not None:
+            return issubclass(view_class, (ListView, DetailView))
+        return getattr(view_func, "replica_reads", False)
+
+    def process_view(self, request, view_func, view_args, view_kwargs):
+        if request.method not in ("GET", "HEAD") or STICKY_COOKIE in request.COOKIES:
+            return None
+        if self.reads_from_replica(view_func):
+            replica_state.get().alias = random.choice(self.replicas)
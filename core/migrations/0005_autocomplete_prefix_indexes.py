@@ -0,0 +1,46 @@
+from django.db import migrations
+
+# Case-insensitive prefix lookups compile to UPPER("column"::text) LIKE 'X%'
+# on PostgreSQL. A text_pattern_ops index on that expression serves them
+# without scanning the table.
+PREFIX_INDEXES = [
+    ("core_pet", "name"),
+    ("core_user", "username"),
+    ("core_status", "name"),
+    ("core_priority", "name"),
+]
+
+
+def index_name(table, column):
+    return f"{table}_{column}_upper_prefix"
+
+
+def create_prefix_indexes(apps, schema_editor):
+    if schema_editor.connection.vendor != "postgresql":
+        return
+    quote_name = schema_editor.quote_name
+    for table, column in PREFIX_INDEXES:
+        schema_editor.execute(
+            f"CREATE INDEX IF NOT EXISTS {quote_name(index_name(table, column))} "
+            f"ON {quote_name(table)} (UPPER({quote_name(column)}::text) text_pattern_ops)"
+        )
+
+
+def drop_prefix_indexes(apps, schema_editor):
+    if schema_editor.connection.vendor != "postgresql":
+        return
+    for table, column in PREFIX_INDEXES:
+        schema_editor.execute(
+            f"DROP INDEX IF EXISTS {schema_editor.quote_name(index_name(table, column))}"
+        )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0004_alter_pet_species'),
+    ]
+
+    operations = [
+        migrations.RunPython(create_prefix_indexes, drop_prefix_indexes),
+    ]
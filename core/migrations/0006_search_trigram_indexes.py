@@ -0,0 +1,51 @@
+from django.db import migrations
+
+# icontains compiles to UPPER("column"::text) LIKE UPPER('%term%') on
+# PostgreSQL, so the trigram indexes are built on that expression. SQLite
+# uses FTS5 shadow tables instead, installed after migrate by
+# core.search.install_fts5.
+TRIGRAM_INDEXES = [
+    ("core_user", "username"),
+    ("core_pet", "name"),
+    ("core_activity", "title"),
+    ("core_healthevent", "title"),
+    ("core_species", "name"),
+    ("core_status", "name"),
+    ("core_priority", "name"),
+]
+
+
+def index_name(table, column):
+    return f"{table}_{column}_trgm"
+
+
+def create_trigram_indexes(apps, schema_editor):
+    if schema_editor.connection.vendor != "postgresql":
+        return
+    quote_name = schema_editor.quote_name
+    schema_editor.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+    for table, column in TRIGRAM_INDEXES:
+        schema_editor.execute(
+            f"CREATE INDEX IF NOT EXISTS {quote_name(index_name(table, column))} "
+            f"ON {quote_name(table)} USING gin (UPPER({quote_name(column)}::text) gin_trgm_ops)"
+        )
+
+
+def drop_trigram_indexes(apps, schema_editor):
+    if schema_editor.connection.vendor != "postgresql":
+        return
+    for table, column in TRIGRAM_INDEXES:
+        schema_editor.execute(
+            f"DROP INDEX IF EXISTS {schema_editor.quote_name(index_name(table, column))}"
+        )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0005_autocomplete_prefix_indexes'),
+    ]
+
+    operations = [
+        migrations.RunPython(create_trigram_indexes, drop_trigram_indexes),
+    ]
@@ -0,0 +1,52 @@
+# Generated by Django 6.0 on 2026-10-18 04:03
+
+from django.db import migrations, models
+
+from core.operations import AddIndexConcurrently
+
+
+class Migration(migrations.Migration):
+    atomic = False
+
+    dependencies = [
+        ('core', '0006_search_trigram_indexes'),
+    ]
+
+    operations = [
+        AddIndexConcurrently(
+            model_name='activity',
+            index=models.Index(fields=['scheduled_date', 'id'], name='activity_date_idx'),
+        ),
+        AddIndexConcurrently(
+            model_name='activity',
+            index=models.Index(fields=['pet', 'scheduled_date', 'id'], name='activity_pet_date_idx'),
+        ),
+        AddIndexConcurrently(
+            model_name='activity',
+            index=models.Index(fields=['user', 'scheduled_date', 'id'], name='activity_user_date_idx'),
+        ),
+        AddIndexConcurrently(
+            model_name='activity',
+            index=models.Index(fields=['status', 'scheduled_date', 'id'], name='activity_status_date_idx'),
+        ),
+        AddIndexConcurrently(
+            model_name='healthevent',
+            index=models.Index(fields=['scheduled_date', 'id'], name='healthevent_date_idx'),
+        ),
+        AddIndexConcurrently(
+            model_name='healthevent',
+            index=models.Index(fields=['pet', 'scheduled_date', 'id'], name='healthevent_pet_date_idx'),
+        ),
+        AddIndexConcurrently(
+            model_name='healthevent',
+            index=models.Index(fields=['user', 'scheduled_date', 'id'], name='healthevent_user_date_idx'),
+        ),
+        AddIndexConcurrently(
+            model_name='healthevent',
+            index=models.Index(fields=['status', 'scheduled_date', 'id'], name='healthevent_status_date_idx'),
+        ),
+        AddIndexConcurrently(
+            model_name='healthevent',
+            index=models.Index(fields=['priority', 'scheduled_date', 'id'], name='healthevent_priority_date_idx'),
+        ),
+    ]
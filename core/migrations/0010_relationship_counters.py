@@ -0,0 +1,74 @@
+# Generated by Django 6.0 on 2026-10-18 04:31
+
+from django.db import migrations, models
+from django.db.models import Count, OuterRef, Subquery
+from django.db.models.functions import Coalesce
+
+
+def count(model, foreign_key):
+    counts = (
+        model.objects.filter(**{foreign_key: OuterRef("pk")})
+        .order_by()
+        .values(foreign_key)
+        .annotate(count=Count("*"))
+        .values("count")
+    )
+    return Coalesce(Subquery(counts), 0)
+
+
+def fill_counters(apps, schema_editor):
+    Pet = apps.get_model("core", "Pet")
+    User = apps.get_model("core", "User")
+    Activity = apps.get_model("core", "Activity")
+    HealthEvent = apps.get_model("core", "HealthEvent")
+    Pet.objects.update(
+        owner_count=count(Pet.owners.through, "pet"),
+        activity_count=count(Activity, "pet"),
+        health_event_count=count(HealthEvent, "pet"),
+    )
+    User.objects.update(
+        pet_count=count(Pet.owners.through, "user"),
+        activity_count=count(Activity, "user"),
+        health_event_count=count(HealthEvent, "user"),
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0009_updated_at'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='pet',
+            name='activity_count',
+            field=models.PositiveIntegerField(default=0, editable=False),
+        ),
+        migrations.AddField(
+            model_name='pet',
+            name='health_event_count',
+            field=models.PositiveIntegerField(default=0, editable=False),
+        ),
+        migrations.AddField(
+            model_name='pet',
+            name='owner_count',
+            field=models.PositiveIntegerField(default=0, editable=False),
+        ),
+        migrations.AddField(
+            model_name='user',
+            name='activity_count',
+            field=models.PositiveIntegerField(default=0, editable=False),
+        ),
+        migrations.AddField(
+            model_name='user',
+            name='health_event_count',
+            field=models.PositiveIntegerField(default=0, editable=False),
+        ),
+        migrations.AddField(
+            model_name='user',
+            name='pet_count',
+            field=models.PositiveIntegerField(default=0, editable=False),
+        ),
+        migrations.RunPython(fill_counters, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,26 @@
+# Generated by Django 6.0 on 2026-10-18 04:49
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0010_relationship_counters'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='ReminderMark',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('due_through', models.DateField()),
+                ('changed_through', models.DateTimeField()),
+            ],
+        ),
+        migrations.AddField(
+            model_name='priority',
+            name='rank',
+            field=models.PositiveSmallIntegerField(default=0, help_text='Reminders for higher ranked priorities are sent first.'),
+        ),
+    ]
@@ -0,0 +1,67 @@
+# Generated by Django 6.0 on 2026-10-18 04:55
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+
+
+def mark_terminal_statuses(apps, schema_editor):
+    Status = apps.get_model("core", "Status")
+    Status.objects.filter(name__in=["completed", "cancelled"]).update(is_terminal=True)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0011_reminders'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='status',
+            name='is_terminal',
+            field=models.BooleanField(default=False, help_text='Activities and health events with this status are archived once they are old enough.'),
+        ),
+        migrations.CreateModel(
+            name='ArchivedActivity',
+            fields=[
+                ('id', models.BigIntegerField(primary_key=True, serialize=False)),
+                ('title', models.CharField(max_length=150)),
+                ('description', models.TextField(blank=True)),
+                ('scheduled_date', models.DateField()),
+                ('updated_at', models.DateTimeField()),
+                ('archived_at', models.DateTimeField()),
+                ('pet', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='archived_activities', to='core.pet')),
+                ('status', models.ForeignKey(null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='archived_activities', to='core.status')),
+                ('user', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='archived_activities', to=settings.AUTH_USER_MODEL)),
+            ],
+            options={
+                'verbose_name': 'Archived Activity',
+                'verbose_name_plural': 'Archived Activities',
+                'ordering': ['scheduled_date'],
+                'indexes': [models.Index(fields=['scheduled_date', 'id'], name='archivedactivity_date_idx')],
+            },
+        ),
+        migrations.CreateModel(
+            name='ArchivedHealthEvent',
+            fields=[
+                ('id', models.BigIntegerField(primary_key=True, serialize=False)),
+                ('title', models.CharField(max_length=150)),
+                ('description', models.TextField(blank=True)),
+                ('scheduled_date', models.DateField()),
+                ('updated_at', models.DateTimeField()),
+                ('archived_at', models.DateTimeField()),
+                ('pet', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='archived_health_events', to='core.pet')),
+                ('priority', models.ForeignKey(null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='archived_health_events', to='core.priority')),
+                ('status', models.ForeignKey(null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='archived_health_events', to='core.status')),
+                ('user', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='archived_health_events', to=settings.AUTH_USER_MODEL)),
+            ],
+            options={
+                'verbose_name': 'Archived Health Event',
+                'verbose_name_plural': 'Archived Health Events',
+                'ordering': ['scheduled_date'],
+                'indexes': [models.Index(fields=['scheduled_date', 'id'], name='archivedhealthevent_date_idx')],
+            },
+        ),
+        migrations.RunPython(mark_terminal_statuses, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,37 @@
+# Generated by Django 6.0 on 2026-10-18 12:00
+
+from django.db import migrations, models
+from django.db.models import F
+from django.utils import timezone
+
+
+def mark_reminded_events(apps, schema_editor):
+    # Events up to the mark were reminded before the column existed, only
+    # those from today on can be read by a run again.
+    ReminderMark = apps.get_model("core", "ReminderMark")
+    HealthEvent = apps.get_model("core", "HealthEvent")
+    mark = ReminderMark.objects.filter(pk=1).first()
+    if mark is not None:
+        HealthEvent.objects.filter(
+            scheduled_date__range=(timezone.localdate(), mark.due_through)
+        ).update(reminded_for=F("scheduled_date"))
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0012_archive'),
+    ]
+
+    operations = [
+        migrations.RemoveField(
+            model_name='remindermark',
+            name='changed_through',
+        ),
+        migrations.AddField(
+            model_name='healthevent',
+            name='reminded_for',
+            field=models.DateField(editable=False, null=True),
+        ),
+        migrations.RunPython(mark_reminded_events, migrations.RunPython.noop),
+    ]
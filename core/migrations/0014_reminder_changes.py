@@ -0,0 +1,27 @@
+# Generated by Django 6.0 on 2026-10-18 14:00
+
+import django.utils.timezone
+from django.db import migrations, models
+
+from core.operations import AddIndexConcurrently
+
+
+class Migration(migrations.Migration):
+    atomic = False
+
+    dependencies = [
+        ('core', '0013_reminded_for'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='remindermark',
+            name='changed_through',
+            field=models.DateTimeField(default=django.utils.timezone.now),
+            preserve_default=False,
+        ),
+        AddIndexConcurrently(
+            model_name='healthevent',
+            index=models.Index(fields=['updated_at'], name='healthevent_updated_idx'),
+        ),
+    ]
@@ -1,14 +1,20 @@
 from django.contrib.auth.models import AbstractUser
 from django.db import models
+from django.core.exceptions import ValidationError
 from django.core.validators import MinValueValidator, MaxLengthValidator
 
 
 class User(AbstractUser):
-    pass
+    updated_at = models.DateTimeField(auto_now=True)
+    # Maintained by core.counters, repaired by the repair_counters command.
+    pet_count = models.PositiveIntegerField(default=0, editable=False)
+    activity_count = models.PositiveIntegerField(default=0, editable=False)
+    health_event_count = models.PositiveIntegerField(default=0, editable=False)
 
 
 class Species(models.Model):
     name = models.CharField(max_length=200)
+    updated_at = models.DateTimeField(auto_now=True)
 
     class Meta:
         verbose_name_plural = "Species"
@@ -41,6 +47,11 @@ class Pet(models.Model):
         validators=[MinValueValidator(0)]
     )
     birth_date = models.DateField()
+    updated_at = models.DateTimeField(auto_now=True)
+    # Maintained by core.counters, repaired by the repair_counters command.
+    owner_count = models.PositiveIntegerField(default=0, editable=False)
+    activity_count = models.PositiveIntegerField(default=0, editable=False)
+    health_event_count = models.PositiveIntegerField(default=0, editable=False)
 
     def __str__(self):
         return f"{self.name} (species: {self.species})"
@@ -48,6 +59,11 @@ class Pet(models.Model):
 
 class Status(models.Model):
     name = models.CharField(max_length=150, unique=True)
+    is_terminal = models.BooleanField(
+        default=False,
+        help_text="Activities and health events with this status are archived once they are old enough.",
+    )
+    updated_at = models.DateTimeField(auto_now=True)
 
     class Meta:
         verbose_name_plural = "Statuses"
@@ -57,6 +73,56 @@ class Status(models.Model):
         return self.name
 
 
+class ActivityRule(models.Model):
+    class Frequency(models.TextChoices):
+        DAILY = "daily", "Daily"
+        WEEKLY = "weekly", "Weekly"
+        MONTHLY = "monthly", "Monthly"
+        YEARLY = "yearly", "Yearly"
+
+    title = models.CharField(max_length=150)
+    description = models.TextField(
+        blank=True,
+        validators=[MaxLengthValidator(500)]
+    )
+    frequency = models.CharField(max_length=10, choices=Frequency.choices)
+    interval = models.PositiveSmallIntegerField(
+        default=1,
+        validators=[MinValueValidator(1)],
+        help_text="Repeat every this many days, weeks, months or years.",
+    )
+    start_date = models.DateField()
+    end_date = models.DateField(null=True, blank=True)
+    user = models.ForeignKey(
+        User,
+        on_delete=models.CASCADE,
+        related_name="activity_rules"
+    )
+    pet = models.ForeignKey(
+        Pet,
+        on_delete=models.CASCADE,
+        related_name="activity_rules"
+    )
+    status = models.ForeignKey(
+        Status,
+        on_delete=models.SET_NULL,
+        related_name="activity_rules",
+        null=True,
+        blank=True,
+    )
+
+    class Meta:
+        verbose_name_plural = "Recurring Activities"
+        verbose_name = "Recurring Activity"
+
+    def clean(self):
+        if self.end_date and self.start_date and self.end_date < self.start_date:
+            raise ValidationError({"end_date": "End date must not be before the start date."})
+
+    def __str__(self):
+        return f"{self.title} ({self.get_frequency_display().lower()})"
+
+
 class Activity(models.Model):
     title = models.CharField(max_length=150, unique=True)
     description = models.TextField(
@@ -80,17 +146,43 @@ class Activity(models.Model):
         related_name="activities",
         null=True,
     )
+    rule = models.ForeignKey(
+        ActivityRule,
+        on_delete=models.SET_NULL,
+        related_name="activities",
+        null=True,
+        editable=False,
+    )
+    occurrence_date = models.DateField(null=True, editable=False)
+    updated_at = models.DateTimeField(auto_now=True)
 
     class Meta:
         ordering = ["scheduled_date"]
         verbose_name_plural = "Activities"
         verbose_name = "Activity"
+        constraints = [
+            models.UniqueConstraint(
+                fields=["rule", "occurrence_date"],
+                name="activity_rule_occurrence_unique",
+            ),
+        ]
+        indexes = [
+            models.Index(fields=["scheduled_date", "id"], name="activity_date_idx"),
+            models.Index(fields=["pet", "scheduled_date", "id"], name="activity_pet_date_idx"),
+            models.Index(fields=["user", "scheduled_date", "id"], name="activity_user_date_idx"),
+            models.Index(fields=["status", "scheduled_date", "id"], name="activity_status_date_idx"),
+        ]
 
     def __str__(self):
         return f"{self.title} (date: {self.scheduled_date})"
 
 class Priority(models.Model):
     name = models.CharField(max_length=150, unique=True)
+    rank = models.PositiveSmallIntegerField(
+        default=0,
+        help_text="Reminders for higher ranked priorities are sent first.",
+    )
+    updated_at = models.DateTimeField(auto_now=True)
 
     class Meta:
         verbose_name_plural = "Priorities"
@@ -128,11 +220,118 @@ class HealthEvent(models.Model):
         related_name="health_events",
         null=True,
     )
+    # The scheduled date send_reminders last reminded the user of, so a
+    # rescheduled event is reminded again and an edited one is not.
+    reminded_for = models.DateField(null=True, editable=False)
+    updated_at = models.DateTimeField(auto_now=True)
 
     class Meta:
         ordering = ["scheduled_date"]
         verbose_name_plural = "Health_Events"
         verbose_name = "Health_Event"
+        indexes = [
+            models.Index(fields=["scheduled_date", "id"], name="healthevent_date_idx"),
+            models.Index(fields=["pet", "scheduled_date", "id"], name="healthevent_pet_date_idx"),
+            models.Index(fields=["user", "scheduled_date", "id"], name="healthevent_user_date_idx"),
+            models.Index(fields=["status", "scheduled_date", "id"], name="healthevent_status_date_idx"),
+            models.Index(fields=["priority", "scheduled_date", "id"], name="healthevent_priority_date_idx"),
+            # Events send_reminders has to read again after they changed.
+            models.Index(fields=["updated_at"], name="healthevent_updated_idx"),
+        ]
 
     def __str__(self):
-        return f"{self.title} (date: {self.scheduled_date})"
\ No newline at end of file
+        return f"{self.title} (date: {self.scheduled_date})"
+
+
+class ArchivedActivity(models.Model):
+    """An activity moved out of Activity by archive_records, keeping its primary key."""
+    is_archived = True
+
+    id = models.BigIntegerField(primary_key=True)
+    title = models.CharField(max_length=150)
+    description = models.TextField(blank=True)
+    scheduled_date = models.DateField()
+    user = models.ForeignKey(
+        User,
+        on_delete=models.CASCADE,
+        related_name="archived_activities"
+    )
+    pet = models.ForeignKey(
+        Pet,
+        on_delete=models.CASCADE,
+        related_name="archived_activities"
+    )
+    status = models.ForeignKey(
+        Status,
+        on_delete=models.SET_NULL,
+        related_name="archived_activities",
+        null=True,
+    )
+    updated_at = models.DateTimeField()
+    archived_at = models.DateTimeField()
+
+    class Meta:
+        ordering = ["scheduled_date"]
+        verbose_name_plural = "Archived Activities"
+        verbose_name = "Archived Activity"
+        indexes = [
+            models.Index(fields=["scheduled_date", "id"], name="archivedactivity_date_idx"),
+        ]
+
+    def __str__(self):
+        return f"{self.title} (date: {self.scheduled_date})"
+
+
+class ArchivedHealthEvent(models.Model):
+    """A health event moved out of HealthEvent by archive_records, keeping its primary key."""
+    is_archived = True
+
+    id = models.BigIntegerField(primary_key=True)
+    title = models.CharField(max_length=150)
+    description = models.TextField(blank=True)
+    scheduled_date = models.DateField()
+    priority = models.ForeignKey(
+        Priority,
+        on_delete=models.SET_NULL,
+        related_name="archived_health_events",
+        null=True,
+    )
+    user = models.ForeignKey(
+        User,
+        on_delete=models.CASCADE,
+        related_name="archived_health_events"
+    )
+    pet = models.ForeignKey(
+        Pet,
+        on_delete=models.CASCADE,
+        related_name="archived_health_events"
+    )
+    status = models.ForeignKey(
+        Status,
+        on_delete=models.SET_NULL,
+        related_name="archived_health_events",
+        null=True,
+    )
+    updated_at = models.DateTimeField()
+    archived_at = models.DateTimeField()
+
+    class Meta:
+        ordering = ["scheduled_date"]
+        verbose_name_plural = "Archived Health Events"
+        verbose_name = "Archived Health Event"
+        indexes = [
+            models.Index(fields=["scheduled_date", "id"], name="archivedhealthevent_date_idx"),
+        ]
+
+    def __str__(self):
+        return f"{self.title} (date: {self.scheduled_date})"
+
+
+class ReminderMark(models.Model):
+    """
+    High-water marks of the send_reminders command: health events due up
+    to due_through have been reminded, and events changed up to
+    changed_through have been read again. There is a single row.
+    """
+    due_through = models.DateField()
+    changed_through = models.DateTimeField()
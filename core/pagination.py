@@ -0,0 +1,184 @@
+import json
+
+from django.core.exceptions import ValidationError
+from django.core.serializers.json import DjangoJSONEncoder
+from django.db.models import Q
+from django.http import Http404
+from django.utils.http import urlsafe_base64_encode, urlsafe_base64_decode
+
+
+class InvalidCursor(Exception):
+    pass
+
+
+class CursorPage:
+    def __init__(self, object_list, paginator, has_next, has_previous):
+        self.object_list = object_list
+        self.paginator = paginator
+        self._has_next = has_next
+        self._has_previous = has_previous
+
+    def __iter__(self):
+        return iter(self.object_list)
+
+    def __len__(self):
+        return len(self.object_list)
+
+    def has_next(self):
+        return self._has_next
+
+    def has_previous(self):
+        return self._has_previous
+
+    def has_other_pages(self):
+        return self._has_next or self._has_previous
+
+    @property
+    def next_cursor(self):
+        if not self._has_next:
+            return None
+        return self.paginator.encode_cursor(self.object_list[-1], reverse=False)
+
+    @property
+    def previous_cursor(self):
+        if not self._has_previous:
+            return None
+        return self.paginator.encode_cursor(self.object_list[0], reverse=True)
+
+
+class CursorPaginator:
+    """
+    Keyset paginator: every page is a range scan starting at the row the
+    cursor points to, so deep pages cost the same as the first one.
+
+    Rows of the merged querysets, of models with the same ordering fields
+    and unique values for them, are interleaved with the queryset's, one
+    range scan per queryset and page.
+    """
+
+    def __init__(self, queryset, per_page, ordering, merged=()):
+        self.queryset = queryset
+        self.merged = tuple(merged)
+        self.per_page = int(per_page)
+        self.ordering = tuple(ordering)
+        self.fields = [
+            queryset.model._meta.get_field(name.lstrip("-")) for name in self.ordering
+        ]
+
+    def encode_cursor(self, obj, reverse):
+        values = [field.value_from_object(obj) for field in self.fields]
+        payload = json.dumps({"v": values, "r": reverse}, cls=DjangoJSONEncoder)
+        return urlsafe_base64_encode(payload.encode())
+
+    def decode_cursor(self, cursor):
+        try:
+            payload = json.loads(urlsafe_base64_decode(cursor))
+            values = [
+                field.to_python(value) for field, value in zip(self.fields, payload["v"], strict=True)
+            ]
+            return values, bool(payload["r"])
+        except (ValueError, TypeError, KeyError, ValidationError) as exc:
+            raise InvalidCursor(cursor) from exc
+
+    def _ordering(self, reverse):
+        if not reverse:
+            return self.ordering
+        return tuple(name[1:] if name.startswith("-") else f"-{name}" for name in self.ordering)
+
+    def _seek(self, values, reverse):
+        ordering = self._ordering(reverse)
+        lookups = [
+            (name.lstrip("-"), "lt" if name.startswith("-") else "gt") for name in ordering
+        ]
+
+        after = Q()
+        for i, (name, lookup) in enumerate(lookups):
+            equal = {lookups[j][0]: values[j] for j in range(i)}
+            after |= Q(**equal, **{f"{name}__{lookup}": values[i]})
+
+        # The redundant bound on the leading column lets the database turn
+        # the OR chain into a single index range scan.
+        leading, lookup = lookups[0]
+        return Q(**{f"{leading}__{lookup}e": values[0]}) & after
+
+    def _page_querysets(self, cursor):
+        reverse = False
+        seek = Q()
+        if cursor:
+            values, reverse = self.decode_cursor(cursor)
+            seek = self._seek(values, reverse)
+        ordering = self._ordering(reverse)
+        querysets = [
+            queryset.filter(seek).order_by(*ordering)[:self.per_page + 1]
+            for queryset in (self.queryset, *self.merged)
+        ]
+        return querysets, reverse
+
+    def _merge(self, results, reverse):
+        if len(results) == 1:
+            return results[0]
+        rows = [row for rows in results for row in rows]
+        # Stable sorts from the last ordering column to the first.
+        for name, field in reversed(list(zip(self._ordering(reverse), self.fields))):
+            rows.sort(key=field.value_from_object, reverse=name.startswith("-"))
+        return rows
+
+    def _make_page(self, rows, cursor, reverse):
+        has_more = len(rows) > self.per_page
+        rows = rows[:self.per_page]
+
+        if reverse:
+            rows.reverse()
+            return CursorPage(rows, self, has_next=True, has_previous=has_more)
+        return CursorPage(rows, self, has_next=has_more, has_previous=bool(cursor))
+
+    def page(self, cursor=None):
+        querysets, reverse = self._page_querysets(cursor)
+        rows = self._merge([list(queryset) for queryset in querysets], reverse)
+        return self._make_page(rows, cursor, reverse)
+
+    async def apage(self, cursor=None):
+        querysets, reverse = self._page_querysets(cursor)
+        rows = self._merge([[row async for row in queryset] for queryset in querysets], reverse)
+        return self._make_page(rows, cursor, reverse)
+
+
+class CursorPaginationMixin:
+    pagination_mode = "cursor"
+    cursor_kwarg = "cursor"
+    cursor_ordering = ("scheduled_date", "id")
+
+    def get_merged_querysets(self):
+        """Querysets whose rows are merged into the pages of the view's own."""
+        return ()
+
+    def paginate_queryset(self, queryset, page_size):
+        if self.pagination_mode != "cursor":
+            return super().paginate_queryset(queryset, page_size)
+
+        paginator = CursorPaginator(
+            queryset, page_size, self.cursor_ordering, merged=self.get_merged_querysets()
+        )
+        try:
+            page = paginator.page(self.request.GET.get(self.cursor_kwarg))
+        except InvalidCursor:
+            raise Http404("Invalid cursor")
+        return paginator, page, page.object_list, page.has_other_pages()
+
+    async def apaginate_queryset(self, queryset, page_size):
+        if self.pagination_mode != "cursor":
+            return await super().apaginate_queryset(queryset, page_size)
+
+        paginator = CursorPaginator(
+            queryset, page_size, self.cursor_ordering, merged=self.get_merged_querysets()
+        )
+        try:
+            page = await paginator.apage(self.request.GET.get(self.cursor_kwarg))
+        except InvalidCursor:
+            raise Http404("Invalid cursor")
+        return paginator, page, page.object_list, page.has_other_pages()
+
+    def get_context_data(self, **kwargs):
+        context = super().get_context_data(**kwargs)
+        context["cursor_pagination"] = self.pagination_mode == "cursor"
+        return context
@@ -0,0 +1,139 @@
+from calendar import monthrange
+from datetime import date, timedelta
+
+from django.db import IntegrityError
+
+from core.models import ActivityRule, Activity
+
+Frequency = ActivityRule.Frequency
+
+
+def _month_occurrences(rule, first, last):
+    step = rule.interval * (12 if rule.frequency == Frequency.YEARLY else 1)
+    start = rule.start_date
+    months = (first.year - start.year) * 12 + first.month - start.month
+    period = max(0, months // step)
+    while True:
+        month_index = start.month - 1 + period * step
+        year, month = start.year + month_index // 12, month_index % 12 + 1
+        if date(year, month, 1) > last:
+            return
+        # Like RRULE, months without the start date's day (the 31st, or
+        # February 29th in common years) have no occurrence.
+        if start.day <= monthrange(year, month)[1]:
+            day = date(year, month, start.day)
+            if first <= day <= last:
+                yield day
+        period += 1
+
+
+def occurrence_dates(rule, start, end):
+    """
+    Dates of the rule's occurrences from start to end inclusive. The first
+    occurrence in the window is computed directly, so the cost depends on
+    the size of the window and not on how long ago the rule started.
+    """
+    first = max(start, rule.start_date)
+    last = min(end, rule.end_date) if rule.end_date else end
+    if first > last:
+        return
+    if rule.frequency in (Frequency.MONTHLY, Frequency.YEARLY):
+        yield from _month_occurrences(rule, first, last)
+        return
+
+    step = rule.interval * (7 if rule.frequency == Frequency.WEEKLY else 1)
+    periods = -(-(first - rule.start_date).days // step)
+    day = rule.start_date + timedelta(days=periods * step)
+    while day <= last:
+        yield day
+        day += timedelta(days=step)
+
+
+def is_occurrence(rule, day):
+    return next(occurrence_dates(rule, day, day), None) == day
+
+
+class Occurrence:
+    """One occurrence of a rule, backed by an Activity once materialized."""
+
+    def __init__(self, rule, date, activity=None):
+        self.rule = rule
+        self.occurrence_date = date
+        self.activity = activity
+
+    @property
+    def is_materialized(self):
+        return self.activity is not None
+
+    @property
+    def date(self):
+        return self.activity.scheduled_date if self.activity else self.occurrence_date
+
+    @property
+    def title(self):
+        return self.activity.title if self.activity else self.rule.title
+
+    @property
+    def status(self):
+        return self.activity.status if self.activity else self.rule.status
+
+
+def expand(rules, start, end):
+    """
+    Occurrences of the rules from start to end, in date order. Occurrences
+    that were completed or edited are represented by their Activity, which
+    is fetched for all rules in one query.
+    """
+    rules = list(rules)
+    materialized = {
+        (activity.rule_id, activity.occurrence_date): activity
+        for activity in Activity.objects.filter(
+            rule__in=rules, occurrence_date__range=(start, end)
+        ).select_related("status")
+    }
+    occurrences = [
+        Occurrence(rule, day, materialized.get((rule.pk, day)))
+        for rule in rules
+        for day in occurrence_dates(rule, start, end)
+    ]
+    occurrences.sort(key=lambda occurrence: (occurrence.date, occurrence.rule.pk))
+    return occurrences
+
+
+def occurrence_title(rule, day, disambiguate=False):
+    """
+    Title of an occurrence's Activity. The rule's title is cut so the date,
+    and the rule's id when disambiguating from another rule with the same
+    title, fit in the title's max_length.
+    """
+    suffix = f" ({day.isoformat()}, rule {rule.pk})" if disambiguate else f" ({day.isoformat()})"
+    max_length = Activity._meta.get_field("title").max_length
+    return rule.title[:max_length - len(suffix)] + suffix
+
+
+def materialize(rule, day):
+    """
+    Return the Activity of an occurrence, creating it on first use. Raises
+    IntegrityError if neither title is free.
+    """
+    if not is_occurrence(rule, day):
+        raise ValueError(f"{day} is not an occurrence of {rule}")
+    defaults = {
+        "description": rule.description,
+        "scheduled_date": day,
+        "user_id": rule.user_id,
+        "pet_id": rule.pet_id,
+        "status_id": rule.status_id,
+    }
+    # Rule titles are not unique, activity titles are.
+    try:
+        activity, created = Activity.objects.get_or_create(
+            rule=rule, occurrence_date=day, defaults={**defaults, "title": occurrence_title(rule, day)}
+        )
+    except IntegrityError:
+        activity, created = Activity.objects.get_or_create(
+            rule=rule,
+            occurrence_date=day,
+            defaults={**defaults, "title": occurrence_title(rule, day, disambiguate=True)},
+        )
+    return activity
@@ -0,0 +1,104 @@
+from collections import defaultdict
+from datetime import timedelta
+
+from django.conf import settings
+from django.core import mail
+from django.db import transaction
+from django.db.models import F, Q, Value
+from django.db.models.functions import Greatest
+from django.template.loader import render_to_string
+from django.utils import timezone
+
+from core.models import HealthEvent, ReminderMark
+
+
+def get_mark(now):
+    """The high-water marks. A first run starts with the events due today."""
+    mark, _ = ReminderMark.objects.get_or_create(
+        pk=1,
+        defaults={
+            "due_through": timezone.localdate(now) - timedelta(days=1),
+            "changed_through": now,
+        },
+    )
+    return mark
+
+
+def due_events(mark, today, horizon):
+    """
+    Unfinished health events not reminded for their scheduled date yet:
+    due after mark.due_through up to horizon, or due in the window earlier
+    runs covered and created or changed since mark.changed_through. The
+    first are read with a range scan over scheduled_date starting at the
+    mark, the second with one over updated_at. Highest ranked priority
+    first.
+    """
+    newly_due = Q(scheduled_date__gt=mark.due_through, scheduled_date__lte=horizon)
+    changed = Q(updated_at__gt=mark.changed_through, scheduled_date__range=(today, mark.due_through))
+    return (
+        HealthEvent.objects.filter(newly_due | changed)
+        .exclude(reminded_for=F("scheduled_date"))
+        .exclude(status__is_terminal=True)
+        .exclude(user__email="")
+        .select_related("user", "pet", "priority")
+        .order_by(F("priority__rank").desc(nulls_last=True), "scheduled_date", "id")
+    )
+
+
+def mark_reminded(events):
+    """Record the date events were reminded for, unless they were rescheduled since."""
+    by_date = defaultdict(list)
+    for event in events:
+        by_date[event.scheduled_date].append(event.pk)
+    for day, pks in by_date.items():
+        HealthEvent.objects.filter(pk__in=pks, scheduled_date=day).update(reminded_for=day)
+
+
+def reminder_message(event):
+    return mail.EmailMessage(
+        subject=f"Reminder: {event.title} on {event.scheduled_date:%b %d}",
+        body=render_to_string("core/health_event_reminder.txt", {"event": event}),
+        to=[event.user.email],
+    )
+
+
+def send_reminders(now=None, lead_days=None, batch_size=None):
+    """
+    Email the users of health events due in the next lead_days days that
+    earlier runs have not reminded, batch_size messages per mail connection,
+    then advance the marks. Returns the number of reminders sent.
+
+    Each batch is locked, sent and marked reminded in its own transaction,
+    so a failing batch leaves the batches sent before it marked, and a
+    concurrent run skips the events of batches being sent. The marks only
+    advance once every batch is sent.
+    """
+    now = now or timezone.now()
+    if lead_days is None:
+        lead_days = settings.REMINDER_LEAD_DAYS
+    if batch_size is None:
+        batch_size = settings.REMINDER_BATCH_SIZE
+    today = timezone.localdate(now)
+    horizon = today + timedelta(days=lead_days)
+
+    mark = get_mark(now)
+    events = due_events(mark, today, horizon)
+    pks = list(events.values_list("pk", flat=True))
+    sent = 0
+    for start in range(0, len(pks), batch_size):
+        with transaction.atomic():
+            batch = list(
+                events.filter(pk__in=pks[start:start + batch_size])
+                .select_for_update(skip_locked=True, of=("self",))
+            )
+            if not batch:
+                continue
+            with mail.get_connection() as connection:
+                sent += connection.send_messages([reminder_message(event) for event in batch])
+            mark_reminded(batch)
+
+    ReminderMark.objects.filter(pk=mark.pk).update(
+        due_through=Greatest(F("due_through"), Value(horizon)),
+        changed_through=Greatest(F("changed_through"), Value(now)),
+    )
+    return sent
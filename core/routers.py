@@ -0,0 +1,73 @@
+from contextvars import ContextVar
+
+from django.conf import settings
+from django.db import DEFAULT_DB_ALIAS, connections
+
+# Set on responses to requests that wrote, the browser's next requests read
+# from the primary until it expires.
+STICKY_COOKIE = "primary_reads"
+
+# Apps whose rows are read right after being written within one request.
+PRIMARY_APPS = {"sessions", "django_cache"}
+
+replica_state = ContextVar("replica_state", default=None)
+
+
+class ReplicaState:
+    """The replica a request reads from, if any, and whether it wrote."""
+
+    def __init__(self):
+        self.alias = None
+        self.wrote = False
+
+
+def reads_from_replica():
+    """
+    Whether the current request reads from a replica, whose rows can lag
+    behind the primary. What it reads must not fill caches shared with
+    other requests.
+    """
+    state = replica_state.get()
+    return state is not None and state.alias is not None and not state.wrote
+
+
+def replica_reads(view_func):
+    """Let the reads of a function view go to a replica."""
+    view_func.replica_reads = True
+    return view_func
+
+
+class ReplicaRouter:
+    """
+    Send the reads of the requests ReplicaMiddleware picked a replica for to
+    that replica, everything else to the primary.
+    """
+
+    def db_for_read(self, model, **hints):
+        state = replica_state.get()
+        if state is None or state.alias is None or state.wrote:
+            return DEFAULT_DB_ALIAS
+        if model._meta.app_label in PRIMARY_APPS:
+            return DEFAULT_DB_ALIAS
+        # Reads in a transaction must see its writes.
+        if connections[DEFAULT_DB_ALIAS].in_atomic_block:
+            return DEFAULT_DB_ALIAS
+        return state.alias
+
+    def db_for_write(self, model, **hints):
+        state = replica_state.get()
+        if state is not None and model._meta.app_label not in PRIMARY_APPS:
+            state.wrote = True
+        return DEFAULT_DB_ALIAS
+
+    def allow_relation(self, obj1, obj2, **hints):
+        aliases = {DEFAULT_DB_ALIAS, *settings.REPLICA_DATABASES}
+        if obj1._state.db in aliases and obj2._state.db in aliases:
+            return True
+        return None
+
+    def allow_migrate(self, db, app_label, model_name=None, **hints):
+        if db in settings.REPLICA_DATABASES:
+            return False
+        return None
+
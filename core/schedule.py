@@ -0,0 +1,106 @@
+import calendar
+import hashlib
+from datetime import timedelta
+from uuid import uuid4
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db.models import CharField, Value
+
+from core.recurrence import expand
+
+VERSION_KEY = "schedule_version"
+
+# Columns of the UNION query, in order.
+ENTRY_FIELDS = ("scheduled_date", "kind", "id", "title", "pet__name", "status__name")
+
+KINDS = ("activity", "healthevent", "recurring")
+
+
+def touch():
+    """Retire every cached calendar after a change to anything it shows."""
+    cache.set(VERSION_KEY, uuid4().hex, None)
+
+
+def get_version():
+    stamp = uuid4().hex
+    if cache.add(VERSION_KEY, stamp, None):
+        return stamp
+    return cache.get(VERSION_KEY, stamp)
+
+
+def month_weeks(day):
+    """Monday to Sunday weeks covering the month of day."""
+    return calendar.Calendar().monthdatescalendar(day.year, day.month)
+
+
+def week_days(day):
+    monday = day - timedelta(days=day.weekday())
+    return [[monday + timedelta(days=i) for i in range(7)]]
+
+
+def fetch_entries(querysets, start, end, fields=ENTRY_FIELDS):
+    """
+    Rows of every queryset (kind: queryset) scheduled from start to end, as
+    tuples of fields ordered by date, in a single UNION ALL query. fields
+    must include scheduled_date, kind and id.
+    """
+    combined = None
+    for kind, queryset in querysets.items():
+        rows = (
+            queryset.filter(scheduled_date__range=(start, end))
+            .order_by()
+            .annotate(kind=Value(kind, output_field=CharField()))
+            .values_list(*fields)
+        )
+        combined = rows if combined is None else combined.union(rows, all=True)
+    return combined.order_by("scheduled_date", "kind", "id")
+
+
+def build_weeks(weeks, entries, occurrences):
+    """
+    Group entries and occurrences of unmaterialized recurring activities by
+    day. Every day is a dict with the per-kind counts and row summaries.
+    Only plain data is stored so the result can be cached.
+    """
+    days = {
+        day: {"date": day, "counts": dict.fromkeys(KINDS, 0), "total": 0, "entries": []}
+        for week in weeks for day in week
+    }
+    for scheduled_date, kind, pk, title, pet, status in entries:
+        days[scheduled_date]["entries"].append(
+            {"kind": kind, "id": pk, "title": title, "pet": pet, "status": status}
+        )
+    for occurrence in occurrences:
+        if occurrence.is_materialized:
+            continue
+        days[occurrence.date]["entries"].append({
+            "kind": "recurring",
+            "id": occurrence.rule.pk,
+            "date": occurrence.date.isoformat(),
+            "title": occurrence.title,
+            "pet": occurrence.rule.pet.name,
+            "status": occurrence.status.name if occurrence.status else None,
+        })
+    for day in days.values():
+        for entry in day["entries"]:
+            day["counts"][entry["kind"]] += 1
+        day["total"] = len(day["entries"])
+    return [[days[day] for day in week] for week in weeks]
+
+
+def get_weeks(user, weeks, querysets, rules, filters):
+    """
+    Calendar days for weeks, cached per user, period and filters. The key
+    includes a version stamp that model signals replace on every change.
+    """
+    start, end = weeks[0][0], weeks[-1][-1]
+    digest = hashlib.md5(repr(sorted(filters.items())).encode()).hexdigest()
+    key = f"schedule:{get_version()}:{user.pk}:{start}:{end}:{digest}"
+    result = cache.get(key)
+    if result is None:
+        result = build_weeks(
+            weeks, fetch_entries(querysets, start, end), expand(rules, start, end)
+        )
+        cache.set(key, result, settings.CALENDAR_CACHE_TIMEOUT)
+    return result
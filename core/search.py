@@ -0,0 +1,137 @@
+from django.conf import settings
+from django.db.models import FloatField
+from django.db.models.expressions import RawSQL
+from django.utils.module_loading import import_string
+
+# (model label, field) pairs searched by the list views. Each one gets a
+# trigram GIN index on PostgreSQL and an FTS5 shadow table on SQLite.
+SEARCH_FIELDS = [
+    ("core.user", "username"),
+    ("core.pet", "name"),
+    ("core.activity", "title"),
+    ("core.healthevent", "title"),
+    ("core.species", "name"),
+    ("core.status", "name"),
+    ("core.priority", "name"),
+]
+
+
+def fts_table_name(model):
+    return f"{model._meta.db_table}_fts"
+
+
+class ContainsSearchBackend:
+    def filter(self, queryset, field, term):
+        return queryset.filter(**{f"{field}__icontains": term})
+
+    def rank(self, queryset, field, term):
+        return None
+
+    def search(self, queryset, field, term, ranked=True):
+        queryset = self.filter(queryset, field, term)
+        rank = self.rank(queryset, field, term) if ranked else None
+        if rank is None:
+            return queryset
+        return queryset.annotate(search_rank=rank).order_by("-search_rank", "pk")
+
+
+class TrigramSearchBackend(ContainsSearchBackend):
+    """
+    PostgreSQL backend. icontains compiles to UPPER(col::text) LIKE
+    UPPER('%term%'), which the pg_trgm GIN index on that same expression
+    serves, and similarity() ranks the matches.
+    """
+
+    def rank(self, queryset, field, term):
+        from django.contrib.postgres.search import TrigramSimilarity
+
+        return TrigramSimilarity(field, term)
+
+
+class FTS5SearchBackend(ContainsSearchBackend):
+    """
+    SQLite backend matching against trigram-tokenized FTS5 tables kept in
+    sync with their content tables by triggers. Terms shorter than a
+    trigram fall back to a plain scan.
+    """
+
+    min_length = 3
+
+    def _fts_table(self, queryset, field, term):
+        if len(term) < self.min_length:
+            return None
+        if (queryset.model._meta.label_lower, field) not in SEARCH_FIELDS:
+            return None
+        return fts_table_name(queryset.model)
+
+    def _match(self, term):
+        return '"%s"' % term.replace('"', '""')
+
+    def filter(self, queryset, field, term):
+        fts = self._fts_table(queryset, field, term)
+        if fts is None:
+            return super().filter(queryset, field, term)
+        return queryset.filter(
+            pk__in=RawSQL(f"SELECT rowid FROM {fts} WHERE {fts} MATCH %s", [self._match(term)])
+        )
+
+    def rank(self, queryset, field, term):
+        fts = self._fts_table(queryset, field, term)
+        if fts is None:
+            return None
+        opts = queryset.model._meta
+        return RawSQL(
+            f"(SELECT -rank FROM {fts} WHERE {fts} MATCH %s "
+            f"AND rowid = {opts.db_table}.{opts.pk.column})",
+            [self._match(term)],
+            output_field=FloatField(),
+        )
+
+
+def get_search_backend():
+    return import_string(settings.SEARCH_BACKEND)()
+
+
+def search(queryset, field, term, ranked=True):
+    return get_search_backend().search(queryset, field, term, ranked=ranked)
+
+
+def install_fts5(connection):
+    """
+    Create the FTS5 tables and their sync triggers. SQLite drops a table's
+    triggers whenever Django rebuilds it during a migration, so this runs
+    after every migrate and rebuilds any index whose triggers went missing.
+    """
+    from django.apps import apps
+
+    with connection.cursor() as cursor:
+        cursor.execute("SELECT name FROM sqlite_master WHERE type = 'trigger'")
+        triggers = {row[0] for row in cursor.fetchall()}
+
+        for label, field in SEARCH_FIELDS:
+            model = apps.get_model(label)
+            table = model._meta.db_table
+            column = model._meta.get_field(field).column
+            pk = model._meta.pk.column
+            fts = fts_table_name(model)
+            if {f"{fts}_ai", f"{fts}_ad", f"{fts}_au"} <= triggers:
+                continue
+
+            cursor.execute(
+                f"CREATE VIRTUAL TABLE IF NOT EXISTS {fts} USING fts5("
+                f"{column}, content='{table}', content_rowid='{pk}', tokenize='trigram')"
+            )
+            cursor.execute(
+                f"CREATE TRIGGER IF NOT EXISTS {fts}_ai AFTER INSERT ON {table} BEGIN "
+                f"INSERT INTO {fts}(rowid, {column}) VALUES (new.{pk}, new.{column}); END"
+            )
+            cursor.execute(
+                f"CREATE TRIGGER IF NOT EXISTS {fts}_ad AFTER DELETE ON {table} BEGIN "
+                f"INSERT INTO {fts}({fts}, rowid, {column}) VALUES ('delete', old.{pk}, old.{column}); END"
+            )
+            cursor.execute(
+                f"CREATE TRIGGER IF NOT EXISTS {fts}_au AFTER UPDATE ON {table} BEGIN "
+                f"INSERT INTO {fts}({fts}, rowid, {column}) VALUES ('delete', old.{pk}, old.{column}); "
+                f"INSERT INTO {fts}(rowid, {column}) VALUES (new.{pk}, new.{column}); END"
+            )
+            cursor.execute(f"INSERT INTO {fts}({fts}) VALUES ('rebuild')")
@@ -0,0 +1,273 @@
+from functools import partial
+
+from django.db import connections, transaction
+from django.contrib.auth import get_user_model
+from django.db.models.signals import post_init, post_save, pre_delete, post_delete, m2m_changed
+
+from core import conditional, counters, feeds, fragments, schedule, stats
+from core.models import Species, Pet, Status, Priority, Activity, ActivityRule, HealthEvent
+from core.search import install_fts5
+
+
+def update_dashboard_stats_on_save(sender, instance, created, using, **kwargs):
+    if created:
+        transaction.on_commit(partial(stats.adjust, sender, 1), using=using)
+
+
+def update_dashboard_stats_on_delete(sender, instance, using, **kwargs):
+    transaction.on_commit(partial(stats.adjust, sender, -1), using=using)
+
+
+def touch_row_fragments_on_save(sender, instance, using, update_fields=None, **kwargs):
+    # Logging in only updates last_login, which no list row shows.
+    if update_fields is not None and set(update_fields) == {"last_login"}:
+        return
+    transaction.on_commit(partial(fragments.touch, sender, instance.pk), using=using)
+
+
+def touch_row_fragments_on_delete(sender, instance, using, **kwargs):
+    transaction.on_commit(partial(fragments.touch, sender, instance.pk), using=using)
+
+
+def touch_owner_row_fragments(sender, instance, action, model, pk_set, using, **kwargs):
+    # Pet rows show their owner count and user rows their pet count.
+    if action == "pre_clear":
+        related = instance.owners if isinstance(instance, Pet) else instance.pets
+        pk_set = set(related.values_list("pk", flat=True))
+    elif action not in ("post_add", "post_remove"):
+        return
+    touched = [(type(instance), instance.pk)] + [(model, pk) for pk in pk_set]
+    for touched_model, pk in touched:
+        transaction.on_commit(partial(fragments.touch, touched_model, pk), using=using)
+
+
+def touch_schedule_on_save(sender, instance, using, **kwargs):
+    transaction.on_commit(schedule.touch, using=using)
+
+
+def touch_schedule_on_delete(sender, instance, using, **kwargs):
+    transaction.on_commit(schedule.touch, using=using)
+
+
+# Foreign keys whose loaded values receivers need to also update the user
+# or pet an object was moved away from.
+PARENT_FIELDS = ("user_id", "pet_id")
+
+
+def remember_parents(sender, instance, **kwargs):
+    # Deferred fields are left alone rather than loaded.
+    instance._loaded_parents = {name: instance.__dict__.get(name) for name in PARENT_FIELDS}
+
+
+def forget_parents(sender, instance, **kwargs):
+    # Connected last, once every receiver has seen the loaded values.
+    remember_parents(sender, instance)
+
+
+def parent_ids(instance, name):
+    """Current and loaded value of a foreign key, without None."""
+    ids = {getattr(instance, name, None), getattr(instance, "_loaded_parents", {}).get(name)}
+    ids.discard(None)
+    return ids
+
+
+def touch_feed(sender, instance, using, **kwargs):
+    # Pet names appear in every feed, everything else in its user's feed.
+    if sender is Pet:
+        transaction.on_commit(feeds.touch, using=using)
+        return
+    for user_id in parent_ids(instance, "user_id"):
+        transaction.on_commit(partial(feeds.touch, user_id), using=using)
+
+
+def touch_detail_pages(sender, instance, using, **kwargs):
+    # Pet and user pages count their activities and health events, and
+    # pet pages list upcoming recurring activities.
+    conditional.touch(Pet, parent_ids(instance, "pet_id"), using=using)
+    if sender is not ActivityRule:
+        conditional.touch(get_user_model(), parent_ids(instance, "user_id"), using=using)
+
+
+def touch_owner_detail_pages(sender, instance, action, model, pk_set, using, **kwargs):
+    # Pet pages list owners and user pages list pets.
+    if action == "pre_clear":
+        related = instance.owners if isinstance(instance, Pet) else instance.pets
+        pk_set = set(related.values_list("pk", flat=True))
+    elif action not in ("post_add", "post_remove"):
+        return
+    conditional.touch(type(instance), [instance.pk], using=using)
+    conditional.touch(model, pk_set, using=using)
+
+
+def touch_owner_detail_pages_on_delete(sender, instance, using, **kwargs):
+    # Deleting a pet or user removes its ownerships without m2m_changed,
+    # remember_owners collected the other side.
+    model = get_user_model() if isinstance(instance, Pet) else Pet
+    conditional.touch(model, getattr(instance, "_counted_owners", set()), using=using)
+
+
+def adjust_counters_on_save(sender, instance, created, using, **kwargs):
+    loaded = getattr(instance, "_loaded_parents", {})
+    for name, (model, field) in counters.FOREIGN_KEY_COUNTERS[sender].items():
+        current = getattr(instance, name)
+        if created:
+            counters.adjust(model, field, {current: 1}, using)
+        elif loaded.get(name) is not None and loaded[name] != current:
+            counters.adjust(model, field, {loaded[name]: -1, current: 1}, using)
+
+
+def adjust_counters_on_delete(sender, instance, using, **kwargs):
+    for name, (model, field) in counters.FOREIGN_KEY_COUNTERS[sender].items():
+        counters.adjust(model, field, {getattr(instance, name): -1}, using)
+
+
+def recount_owner_counters(sender, instance, action, model, pk_set, using, **kwargs):
+    # Recounting rather than adjusting, since remove() reports every pk it
+    # was given, whether or not it was related.
+    related = instance.owners if isinstance(instance, Pet) else instance.pets
+    if action == "pre_clear":
+        instance._cleared_pks = set(related.values_list("pk", flat=True))
+        return
+    if action == "post_clear":
+        pk_set = instance.__dict__.pop("_cleared_pks", set())
+    elif action not in ("post_add", "post_remove"):
+        return
+    if not pk_set:
+        return
+    pets, users = ({instance.pk}, pk_set) if isinstance(instance, Pet) else (pk_set, {instance.pk})
+    counters.recount(Pet, "owner_count", pets, using=using)
+    counters.recount(get_user_model(), "pet_count", users, using=using)
+
+
+def remember_owners(sender, instance, **kwargs):
+    # Deleting a pet or user removes its ownerships without m2m_changed.
+    related = instance.owners if isinstance(instance, Pet) else instance.pets
+    instance._counted_owners = set(related.values_list("pk", flat=True))
+
+
+def recount_owners_on_delete(sender, instance, using, **kwargs):
+    if isinstance(instance, Pet):
+        model, field = get_user_model(), "pet_count"
+    else:
+        model, field = Pet, "owner_count"
+    counters.recount(model, field, getattr(instance, "_counted_owners", set()), using=using)
+
+
+def install_search_tables(sender, using, **kwargs):
+    connection = connections[using]
+    if connection.vendor == "sqlite":
+        install_fts5(connection)
+
+
+for model in stats.COUNTED_MODELS.values():
+    post_save.connect(
+        update_dashboard_stats_on_save,
+        sender=model,
+        dispatch_uid=f"dashboard_stats_save_{model._meta.label_lower}",
+    )
+    post_delete.connect(
+        update_dashboard_stats_on_delete,
+        sender=model,
+        dispatch_uid=f"dashboard_stats_delete_{model._meta.label_lower}",
+    )
+
+for model in (get_user_model(), Species, Pet, Status, Priority, Activity, HealthEvent):
+    post_save.connect(
+        touch_row_fragments_on_save,
+        sender=model,
+        dispatch_uid=f"row_fragments_save_{model._meta.label_lower}",
+    )
+    post_delete.connect(
+        touch_row_fragments_on_delete,
+        sender=model,
+        dispatch_uid=f"row_fragments_delete_{model._meta.label_lower}",
+    )
+
+# Calendars show the titles of activities and health events and the names
+# of their pets and statuses.
+for model in (Pet, Status, Activity, ActivityRule, HealthEvent):
+    post_save.connect(
+        touch_schedule_on_save,
+        sender=model,
+        dispatch_uid=f"schedule_save_{model._meta.label_lower}",
+    )
+    post_delete.connect(
+        touch_schedule_on_delete,
+        sender=model,
+        dispatch_uid=f"schedule_delete_{model._meta.label_lower}",
+    )
+
+for model in (Activity, ActivityRule, HealthEvent):
+    post_init.connect(
+        remember_parents,
+        sender=model,
+        dispatch_uid=f"remember_parents_{model._meta.label_lower}",
+    )
+    for signal, action in ((post_save, "save"), (post_delete, "delete")):
+        signal.connect(
+            touch_detail_pages,
+            sender=model,
+            dispatch_uid=f"detail_pages_{action}_{model._meta.label_lower}",
+        )
+
+for model in counters.FOREIGN_KEY_COUNTERS:
+    post_save.connect(
+        adjust_counters_on_save,
+        sender=model,
+        dispatch_uid=f"counters_save_{model._meta.label_lower}",
+    )
+    post_delete.connect(
+        adjust_counters_on_delete,
+        sender=model,
+        dispatch_uid=f"counters_delete_{model._meta.label_lower}",
+    )
+
+for model in (Pet, get_user_model()):
+    pre_delete.connect(
+        remember_owners,
+        sender=model,
+        dispatch_uid=f"counters_owners_{model._meta.label_lower}",
+    )
+    post_delete.connect(
+        recount_owners_on_delete,
+        sender=model,
+        dispatch_uid=f"counters_owners_delete_{model._meta.label_lower}",
+    )
+    post_delete.connect(
+        touch_owner_detail_pages_on_delete,
+        sender=model,
+        dispatch_uid=f"detail_pages_owners_delete_{model._meta.label_lower}",
+    )
+
+m2m_changed.connect(
+    recount_owner_counters,
+    sender=Pet.owners.through,
+    dispatch_uid="counters_pet_owners",
+)
+
+for model in (Pet, Activity, ActivityRule, HealthEvent):
+    for signal, action in ((post_save, "save"), (post_delete, "delete")):
+        signal.connect(
+            touch_feed,
+            sender=model,
+            dispatch_uid=f"feed_{action}_{model._meta.label_lower}",
+        )
+
+m2m_changed.connect(
+    touch_owner_row_fragments,
+    sender=Pet.owners.through,
+    dispatch_uid="row_fragments_pet_owners",
+)
+
+m2m_changed.connect(
+    touch_owner_detail_pages,
+    sender=Pet.owners.through,
+    dispatch_uid="detail_pages_pet_owners",
+)
+
+for model in (Activity, ActivityRule, HealthEvent):
+    post_save.connect(
+        forget_parents,
+        sender=model,
+        dispatch_uid=f"forget_parents_{model._meta.label_lower}",
+    )
@@ -0,0 +1,95 @@
+from asgiref.sync import sync_to_async
+from django.conf import settings
+from django.contrib.auth import get_user_model
+from django.core.cache import cache, caches
+from django.core.cache.backends.db import DatabaseCache
+from django.core.cache.backends.filebased import FileBasedCache
+from django.db import connection
+
+from core.models import Pet, Activity, HealthEvent
+
+User = get_user_model()
+
+CACHE_KEY_PREFIX = "dashboard_stats"
+
+COUNTED_MODELS = {
+    "num_users": User,
+    "num_pets": Pet,
+    "num_activities": Activity,
+    "num_health_events": HealthEvent,
+}
+
+
+def _cache_key(name):
+    return f"{CACHE_KEY_PREFIX}:{name}"
+
+
+def count_all():
+    """
+    Count every dashboard model in a single round trip, on the primary:
+    counts read from a lagging replica would be cached for every user.
+    """
+    subqueries = ", ".join(
+        f"(SELECT COUNT(*) FROM {connection.ops.quote_name(model._meta.db_table)})"
+        for model in COUNTED_MODELS.values()
+    )
+    with connection.cursor() as cursor:
+        cursor.execute(f"SELECT {subqueries}")
+        row = cursor.fetchone()
+    return dict(zip(COUNTED_MODELS, row))
+
+
+def get_dashboard_stats():
+    keys = {name: _cache_key(name) for name in COUNTED_MODELS}
+    cached = cache.get_many(keys.values())
+    if len(cached) == len(keys):
+        return {name: cached[key] for name, key in keys.items()}
+
+    stats = count_all()
+    cache.set_many(
+        {keys[name]: value for name, value in stats.items()},
+        settings.DASHBOARD_STATS_TIMEOUT,
+    )
+    return stats
+
+
+async def aget_dashboard_stats():
+    keys = {name: _cache_key(name) for name in COUNTED_MODELS}
+    cached = await cache.aget_many(keys.values())
+    if len(cached) == len(keys):
+        return {name: cached[key] for name, key in keys.items()}
+
+    # Raw cursors have no async API, so the count runs in a worker thread.
+    stats = await sync_to_async(count_all)()
+    await cache.aset_many(
+        {keys[name]: value for name, value in stats.items()},
+        settings.DASHBOARD_STATS_TIMEOUT,
+    )
+    return stats
+
+
+def incr_is_atomic():
+    # These backends read the value and write it back, so concurrent
+    # increments would lose updates and the counts drift until they expire.
+    return not isinstance(caches["default"], (DatabaseCache, FileBasedCache))
+
+
+def adjust(model, delta):
+    keys = [
+        _cache_key(name) for name, counted_model in COUNTED_MODELS.items()
+        if model is counted_model
+    ]
+    if not incr_is_atomic():
+        # The next read recounts from the database instead.
+        cache.delete_many(keys)
+        return
+    for key in keys:
+        try:
+            cache.incr(key, delta)
+        except ValueError:
+            # Nothing cached yet, the next read recounts from the database.
+            pass
+
+
+def invalidate():
+    cache.delete_many([_cache_key(name) for name in COUNTED_MODELS])
@@ -0,0 +1,39 @@
+from django import template
+
+from core.fragments import store_fragment
+
+register = template.Library()
+
+
+class RowFragmentNode(template.Node):
+    def __init__(self, nodelist, obj):
+        self.nodelist = nodelist
+        self.obj = obj
+
+    def render(self, context):
+        fragment = getattr(self.obj.resolve(context), "row_fragment", None)
+        if fragment is None:
+            return self.nodelist.render(context)
+        key, html = fragment
+        if html is None:
+            html = self.nodelist.render(context)
+            store_fragment(key, html)
+        return html
+
+
+@register.tag
+def rowfragment(parser, token):
+    """
+    Render a list row from the fragment cache when the view attached one:
+
+        {% rowfragment pet %}<tr>...</tr>{% endrowfragment %}
+
+    Rows of views without RowFragmentMixin are rendered as usual.
+    """
+    try:
+        tag_name, obj = token.split_contents()
+    except ValueError:
+        raise template.TemplateSyntaxError(f"{token.contents.split()[0]!r} tag requires one argument")
+    nodelist = parser.parse(("endrowfragment",))
+    parser.delete_first_token()
+    return RowFragmentNode(nodelist, parser.compile_filter(obj))
@@ -0,0 +1,241 @@
+import base64
+import json
+from datetime import date
+from decimal import Decimal
+from unittest import mock
+
+from django.contrib.auth import get_user_model
+from django.db import connection
+from django.test import TestCase, Client
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+
+from core.api import ActivityBulkApiView
+from core.models import Species, Pet, Status, Activity
+
+User = get_user_model()
+
+USERNAME = "username"
+PASSWORD = "password"
+
+
+class ApiTestCase(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = User.objects.create_user(
+            username=USERNAME,
+            password=PASSWORD,
+        )
+        cls.species = Species.objects.create(name="dog")
+        cls.status = Status.objects.create(name="pending")
+        cls.other_status = Status.objects.create(name="done")
+        cls.pet = Pet.objects.create(
+            name="Rex",
+            species=cls.species,
+            breed="test",
+            weight=Decimal("10.3"),
+            height=Decimal("20.5"),
+            birth_date=date(2020, 1, 1),
+        )
+
+    def setUp(self):
+        self.client.force_login(self.user)
+
+    def send(self, method, name, data, **kwargs):
+        return getattr(self.client, method)(
+            reverse(f"core:{name}"),
+            data=json.dumps(data),
+            content_type="application/json",
+            **kwargs,
+        )
+
+    def activity_row(self, title, **kwargs):
+        return {
+            "title": title,
+            "scheduled_date": "2024-03-01",
+            "user": self.user.pk,
+            "pet": self.pet.pk,
+            "status": self.status.pk,
+            **kwargs,
+        }
+
+
+class ApiAuthenticationTests(ApiTestCase):
+    def test_anonymous_request_is_rejected(self):
+        self.client.logout()
+        res = self.client.get(reverse("core:api-activity-list"))
+        self.assertEqual(res.status_code, 401)
+
+    def test_basic_auth(self):
+        credentials = base64.b64encode(f"{USERNAME}:{PASSWORD}".encode()).decode()
+        res = Client().get(
+            reverse("core:api-activity-list"), HTTP_AUTHORIZATION=f"Basic {credentials}"
+        )
+        self.assertEqual(res.status_code, 200)
+
+    def test_session_writes_require_csrf_token(self):
+        self.client = Client(enforce_csrf_checks=True)
+        self.client.force_login(self.user)
+        res = self.send("post", "api-activity-list", [self.activity_row("Walk")])
+        self.assertEqual(res.status_code, 403)
+        self.assertFalse(Activity.objects.exists())
+
+
+class BulkApiTests(ApiTestCase):
+    def test_bulk_create(self):
+        rows = [self.activity_row(f"Checkup {i}") for i in range(3)]
+        res = self.send("post", "api-activity-list", rows)
+        self.assertEqual(res.status_code, 201)
+        results = res.json()["results"]
+        self.assertEqual([row["title"] for row in results], ["Checkup 0", "Checkup 1", "Checkup 2"])
+        self.assertEqual(Activity.objects.count(), 3)
+
+    def test_bulk_create_query_count_does_not_grow(self):
+        counts = list()
+        for size in (1, 10):
+            rows = [self.activity_row(f"Batch {size} row {i}") for i in range(size)]
+            with CaptureQueriesContext(connection) as queries:
+                res = self.send("post", "api-activity-list", rows)
+            self.assertEqual(res.status_code, 201)
+            counts.append(len(queries))
+        self.assertEqual(counts[0], counts[1])
+
+    def test_bulk_create_is_all_or_nothing(self):
+        rows = [self.activity_row("Walk"), self.activity_row("Feed", pet=0)]
+        res = self.send("post", "api-activity-list", rows)
+        self.assertEqual(res.status_code, 400)
+        errors = res.json()["errors"]
+        self.assertEqual(errors[0]["index"], 1)
+        self.assertEqual(errors[0]["errors"]["pet"][0]["code"], "invalid_choice")
+        self.assertFalse(Activity.objects.exists())
+
+    def test_unique_fields_are_checked_in_batch_and_database(self):
+        Activity.objects.create(
+            title="Walk",
+            scheduled_date=date(2024, 1, 1),
+            user=self.user,
+            pet=self.pet,
+        )
+        rows = [self.activity_row("Walk"), self.activity_row("Feed"), self.activity_row("Feed")]
+        res = self.send("post", "api-activity-list", rows)
+        self.assertEqual(res.status_code, 400)
+        self.assertEqual([error["index"] for error in res.json()["errors"]], [0, 2])
+
+    def test_bulk_create_pets_with_owners(self):
+        rows = [
+            {
+                "name": f"Pet {i}",
+                "species": self.species.pk,
+                "breed": "mixed",
+                "weight": "4.50",
+                "height": "20.00",
+                "birth_date": "2021-05-01",
+                "owners": [self.user.pk],
+            }
+            for i in range(2)
+        ]
+        res = self.send("post", "api-pet-list", rows)
+        self.assertEqual(res.status_code, 201)
+        self.assertEqual([row["owners"] for row in res.json()["results"]], [[self.user.pk]] * 2)
+        self.assertEqual(self.user.pets.count(), 2)
+
+    def pet_row(self, name, **kwargs):
+        return {
+            "name": name,
+            "species": self.species.pk,
+            "breed": "mixed",
+            "weight": "4.50",
+            "height": "20.00",
+            "birth_date": "2021-05-01",
+            **kwargs,
+        }
+
+    def test_bulk_create_pets_with_owners_query_count_does_not_grow(self):
+        other = User.objects.create_user(username="other", password=PASSWORD)
+        counts = list()
+        for size in (2, 10):
+            rows = [self.pet_row(f"Batch {size} pet {i}", owners=[self.user.pk, other.pk]) for i in range(size)]
+            with CaptureQueriesContext(connection) as queries:
+                res = self.send("post", "api-pet-list", rows)
+            self.assertEqual(res.status_code, 201)
+            counts.append(len(queries))
+        self.assertEqual(counts[0], counts[1])
+        self.user.refresh_from_db()
+        self.assertEqual(self.user.pet_count, 12)
+        self.assertEqual(
+            set(Pet.objects.filter(name__startswith="Batch").values_list("owner_count", flat=True)), {2}
+        )
+
+    def test_bulk_update_pet_owners(self):
+        other = User.objects.create_user(username="other", password=PASSWORD)
+        self.pet.owners.set([self.user])
+        res = self.send("patch", "api-pet-list", [{"id": self.pet.pk, "owners": [other.pk]}])
+        self.assertEqual(res.status_code, 200)
+        self.assertEqual(res.json()["results"][0]["owners"], [other.pk])
+        self.user.refresh_from_db()
+        other.refresh_from_db()
+        self.pet.refresh_from_db()
+        self.assertEqual((self.user.pet_count, other.pet_count, self.pet.owner_count), (0, 1, 1))
+
+    def test_bulk_partial_update(self):
+        first, second = (
+            Activity.objects.create(
+                title=title,
+                scheduled_date=date(2024, 1, 1),
+                user=self.user,
+                pet=self.pet,
+                status=self.status,
+            )
+            for title in ("Walk", "Feed")
+        )
+        rows = [
+            {"id": first.pk, "status": self.other_status.pk},
+            {"id": second.pk, "title": "Brush"},
+        ]
+        res = self.send("patch", "api-activity-list", rows)
+        self.assertEqual(res.status_code, 200)
+        first.refresh_from_db()
+        second.refresh_from_db()
+        self.assertEqual((first.title, first.status), ("Walk", self.other_status))
+        self.assertEqual((second.title, second.status), ("Brush", self.status))
+
+    def test_update_unknown_id(self):
+        res = self.send("patch", "api-activity-list", [{"id": 999, "title": "Walk"}])
+        self.assertEqual(res.status_code, 404)
+        self.assertEqual(res.json()["ids"], [999])
+
+    def test_bulk_delete(self):
+        activities = [
+            Activity.objects.create(
+                title=f"Walk {i}",
+                scheduled_date=date(2024, 1, 1),
+                user=self.user,
+                pet=self.pet,
+            )
+            for i in range(3)
+        ]
+        res = self.send("delete", "api-activity-list", [activities[0].pk, activities[2].pk])
+        self.assertEqual(res.status_code, 200)
+        self.assertQuerySetEqual(Activity.objects.all(), [activities[1]])
+
+    def test_list_is_cursor_paginated(self):
+        for i in range(3):
+            Activity.objects.create(
+                title=f"Walk {i}",
+                scheduled_date=date(2024, 1, 1),
+                user=self.user,
+                pet=self.pet,
+            )
+        url = reverse("core:api-activity-list")
+        with mock.patch.object(ActivityBulkApiView, "per_page", 2):
+            first = self.client.get(url).json()
+            second = self.client.get(url, {"cursor": first["next"]}).json()
+        self.assertEqual(len(first["results"]), 2)
+        self.assertEqual([row["title"] for row in second["results"]], ["Walk 2"])
+        self.assertIsNone(second["next"])
+
+    def test_detail(self):
+        res = self.client.get(reverse("core:api-pet-detail", kwargs={"pk": self.pet.pk}))
+        self.assertEqual(res.json()["name"], "Rex")
+        res = self.client.get(reverse("core:api-pet-detail", kwargs={"pk": 999}))
+        self.assertEqual(res.status_code, 404)
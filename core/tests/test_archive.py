@@ -0,0 +1,112 @@
+from datetime import date
+from io import StringIO
+
+from django.contrib.auth import get_user_model
+from django.core.management import call_command
+from django.test import TestCase
+from django.urls import reverse
+
+from core.archive import archive
+from core.models import (
+    Pet,
+    Activity,
+    ActivityRule,
+    ArchivedActivity,
+    HealthEvent,
+    ArchivedHealthEvent,
+    Status,
+)
+
+User = get_user_model()
+
+
+class ArchiveTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = User.objects.create_user(username="username", password="password")
+        cls.pet = Pet.objects.create(
+            name="Rex", breed="test", weight=10, height=20, birth_date=date(2020, 1, 1)
+        )
+        cls.completed = Status.objects.create(name="done", is_terminal=True)
+        cls.pending = Status.objects.create(name="open")
+        cls.rule = ActivityRule.objects.create(
+            title="Feeding",
+            frequency=ActivityRule.Frequency.DAILY,
+            start_date=date(2020, 1, 1),
+            user=cls.user,
+            pet=cls.pet,
+        )
+
+    def create_activity(self, title, scheduled_date, status, **kwargs):
+        return Activity.objects.create(
+            title=title, scheduled_date=scheduled_date, status=status, user=self.user, pet=self.pet, **kwargs
+        )
+
+    def test_moves_old_rows_with_a_terminal_status(self):
+        old = self.create_activity("Walk 1", date(2020, 3, 1), self.completed)
+        self.create_activity("Walk 2", date(2020, 3, 2), self.pending)
+        self.create_activity("Walk 3", date(2024, 3, 1), self.completed)
+        self.create_activity("Walk 4", date(2020, 3, 3), self.completed, rule=self.rule, occurrence_date=date(2020, 3, 3))
+        HealthEvent.objects.create(
+            title="Checkup", scheduled_date=date(2020, 3, 1), status=self.completed, user=self.user, pet=self.pet
+        )
+
+        self.assertEqual(archive(Activity, date(2021, 1, 1), chunk_size=10), 1)
+        self.assertEqual(archive(HealthEvent, date(2021, 1, 1), chunk_size=10), 1)
+
+        self.assertFalse(Activity.objects.filter(pk=old.pk).exists())
+        archived = ArchivedActivity.objects.get()
+        self.assertEqual((archived.pk, archived.title, archived.status), (old.pk, "Walk 1", self.completed))
+        self.assertIsNotNone(archived.archived_at)
+        self.assertEqual(ArchivedHealthEvent.objects.get().title, "Checkup")
+        self.pet.refresh_from_db()
+        self.assertEqual((self.pet.activity_count, self.pet.health_event_count), (3, 0))
+
+    def test_moves_in_chunks(self):
+        for day in range(1, 6):
+            self.create_activity(f"Walk {day}", date(2020, 3, day), self.completed)
+        # Per chunk: a savepoint, the chunk, INSERT, DELETE, two counter
+        # updates and the release, and the final empty chunk.
+        with self.assertNumQueries(3 * 7 + 3):
+            self.assertEqual(archive(Activity, date(2021, 1, 1), chunk_size=2), 5)
+        self.assertEqual(ArchivedActivity.objects.count(), 5)
+
+    def test_list_includes_archived_rows_on_request(self):
+        self.client.force_login(self.user)
+        for day in range(1, 5):
+            self.create_activity(f"Walk {day}", date(2020, 3, day), self.completed if day % 2 else self.pending)
+        archive(Activity, date(2021, 1, 1), chunk_size=10)
+
+        res = self.client.get(reverse("core:activity-list"))
+        self.assertEqual([activity.title for activity in res.context["activity_list"]], ["Walk 2", "Walk 4"])
+
+        url = reverse("core:activity-list")
+        res = self.client.get(url, {"include_archived": "on"})
+        page = res.context["page_obj"]
+        self.assertEqual([activity.title for activity in page], ["Walk 1", "Walk 2"])
+        self.assertContains(res, "Archived")
+        res = self.client.get(url, {"include_archived": "on", "cursor": page.next_cursor})
+        self.assertEqual([activity.title for activity in res.context["activity_list"]], ["Walk 3", "Walk 4"])
+
+        res = self.client.get(url, {"include_archived": "on", "title": "Walk 3"})
+        self.assertEqual([activity.title for activity in res.context["activity_list"]], ["Walk 3"])
+
+    def test_export_includes_archived_rows_on_request(self):
+        self.client.force_login(self.user)
+        self.create_activity("Walk 1", date(2020, 3, 1), self.completed)
+        self.create_activity("Walk 2", date(2020, 3, 2), self.pending)
+        archive(Activity, date(2021, 1, 1), chunk_size=10)
+
+        res = self.client.get(reverse("core:activity-export"), {"include_archived": "on"})
+        lines = b"".join(res.streaming_content).decode().splitlines()
+        self.assertEqual([line.split(",")[1] for line in lines[1:]], ["Walk 1", "Walk 2"])
+
+    def test_command(self):
+        self.create_activity("Walk 1", date(2020, 3, 1), self.completed)
+        out = StringIO()
+        call_command("archive_records", "--dry-run", stdout=out)
+        self.assertIn("Activities: 1 to archive", out.getvalue())
+        self.assertEqual(ArchivedActivity.objects.count(), 0)
+        call_command("archive_records", "--before", "2021-01-01", stdout=out)
+        self.assertIn("Activities: 1 archived (scheduled before 2021-01-01)", out.getvalue())
+        self.assertEqual(ArchivedActivity.objects.count(), 1)
@@ -0,0 +1,107 @@
+from datetime import date
+from decimal import Decimal
+
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.test import TestCase, override_settings
+from django.urls import reverse
+
+from core.models import Species, Pet, Status, Activity
+
+User = get_user_model()
+
+ASYNC_PAGES = (
+    "index",
+    "user-list",
+    "pet-list",
+    "activity-list",
+    "activityrule-list",
+    "healthevent-list",
+    "status-list",
+    "priority-list",
+    "species-list",
+)
+
+
+# Rows read from a replica are not cached.
+@override_settings(REPLICA_DATABASES=[])
+class AsyncViewTests(TestCase):
+    """Requests through the ASGI handler, with the middleware chain in async mode."""
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = User.objects.create_user(username="username", password="password")
+        cls.status = Status.objects.create(name="pending")
+        cls.pet = Pet.objects.create(
+            name="Rex",
+            species=Species.objects.create(name="dog"),
+            breed="test",
+            weight=Decimal("10.3"),
+            height=Decimal("20.5"),
+            birth_date=date(2020, 1, 1),
+        )
+        for i in range(3):
+            Activity.objects.create(
+                title=f"Walk {i}",
+                scheduled_date=date(2020, 1, 1 + i),
+                user=cls.user,
+                pet=cls.pet,
+                status=cls.status if i else None,
+            )
+
+    def setUp(self):
+        cache.clear()
+        self.async_client.force_login(self.user)
+
+    async def test_pages(self):
+        for name in ASYNC_PAGES:
+            with self.subTest(name=name):
+                res = await self.async_client.get(reverse(f"core:{name}"))
+                self.assertEqual(res.status_code, 200)
+
+    async def test_offset_pagination(self):
+        res = await self.async_client.get(reverse("core:user-list"))
+        self.assertEqual(list(res.context["user_list"]), [self.user])
+        self.assertEqual(res.context["paginator"].count, 1)
+        self.assertFalse(res.context["is_paginated"])
+
+        res = await self.async_client.get(reverse("core:user-list"), {"page": "last"})
+        self.assertEqual(res.status_code, 200)
+        res = await self.async_client.get(reverse("core:user-list"), {"page": 2})
+        self.assertEqual(res.status_code, 404)
+
+    async def test_cursor_pagination_and_filters(self):
+        res = await self.async_client.get(reverse("core:activity-list"))
+        page = res.context["page_obj"]
+        self.assertEqual([activity.title for activity in page], ["Walk 0", "Walk 1"])
+        self.assertTrue(page.has_next())
+
+        res = await self.async_client.get(reverse("core:activity-list"), {"cursor": page.next_cursor})
+        self.assertEqual([activity.title for activity in res.context["activity_list"]], ["Walk 2"])
+
+        res = await self.async_client.get(reverse("core:activity-list"), {"status": self.status.pk})
+        self.assertEqual(
+            [activity.title for activity in res.context["activity_list"]], ["Walk 1", "Walk 2"]
+        )
+
+    async def test_rows_come_from_the_fragment_cache(self):
+        url = reverse("core:activity-list")
+        await self.async_client.get(url)
+        res = await self.async_client.get(url)
+        self.assertTrue(all(activity.row_fragment[1] for activity in res.context["activity_list"]))
+
+    async def test_autocomplete(self):
+        res = await self.async_client.get(reverse("core:pet-autocomplete"), {"q": "re"})
+        self.assertEqual(res.json(), {"results": [{"id": self.pet.pk, "text": str(self.pet)}], "more": False})
+
+    async def test_login_required(self):
+        await self.async_client.alogout()
+        for name in ("index", "pet-list", "pet-autocomplete"):
+            with self.subTest(name=name):
+                res = await self.async_client.get(reverse(f"core:{name}"))
+                self.assertEqual(res.status_code, 302)
+
+    async def test_export_of_an_async_list_stays_sync(self):
+        res = await self.async_client.get(reverse("core:activity-export"))
+        self.assertEqual(res.status_code, 200)
+        self.assertEqual(res["Content-Type"], "text/csv")
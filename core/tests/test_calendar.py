@@ -0,0 +1,123 @@
+from datetime import date
+from decimal import Decimal
+
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.test import TestCase
+from django.urls import reverse
+
+from core.models import Species, Pet, Status, Priority, Activity, ActivityRule, HealthEvent
+from core.recurrence import materialize
+
+User = get_user_model()
+
+
+class CalendarViewTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = User.objects.create_user(username="username", password="password")
+        cls.status = Status.objects.create(name="pending")
+        species = Species.objects.create(name="dog")
+        cls.pet, cls.other_pet = (
+            Pet.objects.create(
+                name=name,
+                species=species,
+                breed="test",
+                weight=Decimal("10.3"),
+                height=Decimal("20.5"),
+                birth_date=date(2020, 1, 1),
+            )
+            for name in ("Rex", "Fido")
+        )
+        for i, pet in enumerate((cls.pet, cls.pet, cls.other_pet)):
+            Activity.objects.create(
+                title=f"Walk {i}",
+                scheduled_date=date(2024, 3, 5),
+                user=cls.user,
+                pet=pet,
+                status=cls.status,
+            )
+        HealthEvent.objects.create(
+            title="Vaccination",
+            scheduled_date=date(2024, 3, 5),
+            user=cls.user,
+            pet=cls.pet,
+            priority=Priority.objects.create(name="high"),
+        )
+        cls.rule = ActivityRule.objects.create(
+            title="Medication",
+            frequency=ActivityRule.Frequency.WEEKLY,
+            start_date=date(2024, 3, 1),
+            user=cls.user,
+            pet=cls.pet,
+        )
+
+    def setUp(self):
+        cache.clear()
+        self.client.force_login(self.user)
+
+    def get_day(self, res, day):
+        for week in res.context["weeks"]:
+            for calendar_day in week:
+                if calendar_day["date"] == day:
+                    return calendar_day
+        self.fail(f"{day} is not in the calendar")
+
+    def test_month_groups_entries_by_day(self):
+        res = self.client.get(reverse("core:calendar"), {"date": "2024-03-20"})
+        self.assertEqual(res.status_code, 200)
+        weeks = res.context["weeks"]
+        self.assertEqual(weeks[0][0]["date"], date(2024, 2, 26))
+        self.assertEqual(weeks[-1][-1]["date"], date(2024, 3, 31))
+
+        day = self.get_day(res, date(2024, 3, 5))
+        self.assertEqual(day["counts"], {"activity": 3, "healthevent": 1, "recurring": 0})
+        self.assertEqual(day["total"], 4)
+        self.assertEqual(day["more"], 1)
+        self.assertEqual(len(day["entries"]), 3)
+        recurring = [self.get_day(res, date(2024, 3, n))["counts"]["recurring"] for n in (1, 8, 9)]
+        self.assertEqual(recurring, [1, 1, 0])
+
+    def test_week_shows_every_entry(self):
+        res = self.client.get(reverse("core:calendar"), {"period": "week", "date": "2024-03-07"})
+        self.assertEqual([day["date"].day for day in res.context["weeks"][0]], list(range(4, 11)))
+        self.assertEqual(len(self.get_day(res, date(2024, 3, 5))["entries"]), 4)
+
+    def test_filters(self):
+        res = self.client.get(
+            reverse("core:calendar"), {"date": "2024-03-05", "pets": self.other_pet.pk}
+        )
+        day = self.get_day(res, date(2024, 3, 5))
+        self.assertEqual([entry["title"] for entry in day["entries"]], ["Walk 2"])
+        self.assertEqual(self.get_day(res, date(2024, 3, 8))["total"], 0)
+
+    def test_materialized_occurrence_is_shown_once(self):
+        materialize(self.rule, date(2024, 3, 8))
+        res = self.client.get(reverse("core:calendar"), {"date": "2024-03-05"})
+        day = self.get_day(res, date(2024, 3, 8))
+        self.assertEqual(day["counts"], {"activity": 1, "healthevent": 0, "recurring": 0})
+
+    def test_cached_until_something_changes(self):
+        url = reverse("core:calendar")
+        params = {"period": "week", "date": "2024-03-05"}
+        self.client.get(url, params)
+        with self.assertNumQueries(2):
+            res = self.client.get(url, params)
+        self.assertEqual(self.get_day(res, date(2024, 3, 5))["total"], 4)
+
+        with self.captureOnCommitCallbacks(execute=True):
+            Activity.objects.create(
+                title="Feed",
+                scheduled_date=date(2024, 3, 5),
+                user=self.user,
+                pet=self.pet,
+            )
+        res = self.client.get(url, params)
+        self.assertEqual(self.get_day(res, date(2024, 3, 5))["total"], 5)
+
+    def test_ignored_filters_share_the_cache(self):
+        url = reverse("core:calendar")
+        params = {"period": "week", "date": "2024-03-05"}
+        self.client.get(url, params)
+        with self.assertNumQueries(2):
+            self.client.get(url, {**params, "include_archived": "on"})
@@ -0,0 +1,140 @@
+from datetime import date
+from decimal import Decimal
+
+from django.contrib.auth import get_user_model
+from django.test import TestCase
+from django.urls import reverse
+
+from core.bulk import bulk_update
+from core.models import Species, Pet, Status, Priority, Activity, ActivityRule, HealthEvent
+
+User = get_user_model()
+
+
+class ConditionalDetailTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = User.objects.create_user(username="username", password="password")
+        cls.other_user = User.objects.create_user(username="other", password="password")
+        cls.status = Status.objects.create(name="pending")
+        cls.pet = Pet.objects.create(
+            name="Rex",
+            species=Species.objects.create(name="dog"),
+            breed="test",
+            weight=Decimal("10.3"),
+            height=Decimal("20.5"),
+            birth_date=date(2020, 1, 1),
+        )
+        cls.pet.owners.add(cls.user)
+        cls.activity = Activity.objects.create(
+            title="Walk",
+            scheduled_date=date(2024, 3, 5),
+            user=cls.user,
+            pet=cls.pet,
+            status=cls.status,
+        )
+        cls.health_event = HealthEvent.objects.create(
+            title="Vaccination",
+            scheduled_date=date(2024, 3, 6),
+            user=cls.user,
+            pet=cls.pet,
+            priority=Priority.objects.create(name="high"),
+        )
+
+    def setUp(self):
+        self.client.force_login(self.user)
+
+    def assertRevalidates(self, url, change, modified=True):
+        """Check a page is a 304 until change() runs, then a 200 if modified."""
+        res = self.client.get(url)
+        self.assertEqual(res.status_code, 200)
+        etag = res["ETag"]
+        # Session, user and version lookups only: nothing is rendered.
+        with self.assertNumQueries(3):
+            res = self.client.get(url, headers={"if-none-match": etag})
+        self.assertEqual(res.status_code, 304)
+        with self.captureOnCommitCallbacks(execute=True):
+            change()
+        res = self.client.get(url, headers={"if-none-match": etag})
+        self.assertEqual(res.status_code, 200 if modified else 304)
+
+    def test_activity_changes(self):
+        url = reverse("core:activity-detail", args=[self.activity.pk])
+        self.assertRevalidates(url, lambda: Activity.objects.get(pk=self.activity.pk).save())
+        self.assertRevalidates(url, lambda: Status.objects.get(pk=self.status.pk).save())
+        self.assertRevalidates(url, lambda: self.status.delete())
+
+    def test_health_event_priority_change(self):
+        url = reverse("core:healthevent-detail", args=[self.health_event.pk])
+        priority = self.health_event.priority
+        self.assertRevalidates(url, lambda: Priority.objects.get(pk=priority.pk).save())
+
+    def test_pet_counts_and_owners(self):
+        url = reverse("core:pet-detail", args=[self.pet.pk])
+        self.assertRevalidates(url, lambda: Activity.objects.create(
+            title="Feed", scheduled_date=date(2024, 3, 5), user=self.other_user, pet=self.pet,
+        ))
+        self.assertRevalidates(url, lambda: self.pet.owners.add(self.other_user))
+        self.assertRevalidates(url, lambda: User.objects.get(pk=self.other_user.pk).save())
+        self.assertRevalidates(url, lambda: ActivityRule.objects.create(
+            title="Medication",
+            frequency=ActivityRule.Frequency.DAILY,
+            start_date=date(2024, 1, 1),
+            user=self.user,
+            pet=self.pet,
+        ))
+
+    def test_moving_an_activity_touches_both_pets(self):
+        other_pet = Pet.objects.create(
+            name="Fido",
+            breed="test",
+            weight=Decimal("10.3"),
+            height=Decimal("20.5"),
+            birth_date=date(2020, 1, 1),
+        )
+
+        def move():
+            activity = Activity.objects.get(pk=self.activity.pk)
+            activity.pet = other_pet
+            activity.save()
+
+        url = reverse("core:pet-detail", args=[self.pet.pk])
+        other_url = reverse("core:pet-detail", args=[other_pet.pk])
+        etag = self.client.get(other_url)["ETag"]
+        self.assertRevalidates(url, move)
+        self.assertEqual(self.client.get(other_url, headers={"if-none-match": etag}).status_code, 200)
+
+    def test_user_detail_pets_and_unrelated_changes(self):
+        url = reverse("core:user-detail", args=[self.other_user.pk])
+        self.assertRevalidates(url, lambda: self.status.save(), modified=False)
+        self.assertRevalidates(url, lambda: self.pet.owners.add(self.other_user))
+        self.assertRevalidates(url, lambda: Pet.objects.get(pk=self.pet.pk).save())
+
+    def test_deleting_a_pet_or_user_touches_the_other_side(self):
+        older = Pet.objects.create(
+            name="Fido", breed="test", weight=Decimal("10.3"), height=Decimal("20.5"), birth_date=date(2020, 1, 1)
+        )
+        older.owners.add(self.other_user)
+        self.pet.owners.add(self.other_user)
+        # The deleted pet is not the most recently updated one.
+        Pet.objects.get(pk=self.pet.pk).save()
+        url = reverse("core:user-detail", args=[self.other_user.pk])
+        self.assertRevalidates(url, lambda: Pet.objects.get(pk=older.pk).delete())
+
+        owner = User.objects.create_user(username="owner", password="password")
+        self.pet.owners.add(owner)
+        User.objects.get(pk=self.other_user.pk).save()
+        url = reverse("core:pet-detail", args=[self.pet.pk])
+        self.assertRevalidates(url, lambda: User.objects.get(pk=owner.pk).delete())
+
+    def test_bulk_update_sets_updated_at(self):
+        activity = Activity.objects.get(pk=self.activity.pk)
+        before = activity.updated_at
+        activity.title = "Run"
+        bulk_update(Activity, [activity], ["title"])
+        activity.refresh_from_db()
+        self.assertGreater(activity.updated_at, before)
+
+    def test_missing_object(self):
+        res = self.client.get(reverse("core:activity-detail", args=[999]))
+        self.assertEqual(res.status_code, 404)
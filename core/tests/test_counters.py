@@ -0,0 +1,148 @@
+from datetime import date
+from decimal import Decimal
+from io import StringIO
+
+from django.contrib.auth import get_user_model
+from django.core.management import call_command
+from django.test import TestCase
+from django.urls import reverse
+
+from core.bulk import bulk_create
+from core.models import Pet, Activity, HealthEvent, Priority
+
+User = get_user_model()
+
+
+class CounterTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = User.objects.create_user(username="username", password="password")
+        cls.other_user = User.objects.create_user(username="other", password="password")
+        cls.pet = cls.create_pet("Rex")
+        cls.other_pet = cls.create_pet("Fido")
+
+    @staticmethod
+    def create_pet(name):
+        return Pet.objects.create(
+            name=name,
+            breed="test",
+            weight=Decimal("10.3"),
+            height=Decimal("20.5"),
+            birth_date=date(2020, 1, 1),
+        )
+
+    def create_activity(self, **kwargs):
+        return Activity.objects.create(
+            title=f"Walk {Activity.objects.count()}",
+            scheduled_date=date(2024, 3, 5),
+            **{"user": self.user, "pet": self.pet, **kwargs},
+        )
+
+    def assertCounts(self, obj, **counts):
+        obj.refresh_from_db()
+        self.assertEqual({field: getattr(obj, field) for field in counts}, counts)
+
+    def test_activities_and_health_events(self):
+        activity = self.create_activity()
+        HealthEvent.objects.create(
+            title="Vaccination",
+            scheduled_date=date(2024, 3, 6),
+            user=self.user,
+            pet=self.pet,
+            priority=Priority.objects.create(name="high"),
+        )
+        self.assertCounts(self.pet, activity_count=1, health_event_count=1)
+        self.assertCounts(self.user, activity_count=1, health_event_count=1)
+        activity.delete()
+        self.assertCounts(self.pet, activity_count=0, health_event_count=1)
+        self.assertCounts(self.user, activity_count=0, health_event_count=1)
+
+    def test_reassigned_activity_moves_counts(self):
+        activity = Activity.objects.get(pk=self.create_activity().pk)
+        activity.pet = self.other_pet
+        activity.user = self.other_user
+        activity.save()
+        activity.save()
+        self.assertCounts(self.pet, activity_count=0)
+        self.assertCounts(self.other_pet, activity_count=1)
+        self.assertCounts(self.user, activity_count=0)
+        self.assertCounts(self.other_user, activity_count=1)
+
+    def test_owners(self):
+        self.pet.owners.add(self.user, self.other_user)
+        self.pet.owners.remove(self.user, self.user)
+        self.other_user.pets.add(self.other_pet)
+        self.assertCounts(self.pet, owner_count=1)
+        self.assertCounts(self.other_user, pet_count=2)
+        self.other_user.pets.clear()
+        self.assertCounts(self.pet, owner_count=0)
+        self.assertCounts(self.other_pet, owner_count=0)
+        self.assertCounts(self.other_user, pet_count=0)
+
+    def test_toggle_assign_to_pet(self):
+        self.client.force_login(self.user)
+        url = reverse("core:toggle-pet-assign", args=[self.pet.pk])
+        self.client.post(url)
+        self.assertCounts(self.pet, owner_count=1)
+        self.assertCounts(self.user, pet_count=1)
+        self.client.post(url)
+        self.assertCounts(self.pet, owner_count=0)
+        self.assertCounts(self.user, pet_count=0)
+
+    def test_deleting_a_pet_updates_its_owners_and_activity_users(self):
+        self.pet.owners.add(self.user)
+        self.create_activity()
+        self.create_activity(user=self.other_user)
+        self.client.force_login(self.user)
+        self.client.post(reverse("core:pet-delete", args=[self.pet.pk]))
+        self.assertCounts(self.user, pet_count=0, activity_count=0)
+        self.assertCounts(self.other_user, activity_count=0)
+
+    def test_deleting_a_user_updates_their_pets(self):
+        self.pet.owners.add(self.other_user)
+        self.create_activity(user=self.other_user)
+        self.create_activity(user=self.other_user, pet=self.other_pet)
+        self.other_user.delete()
+        self.assertCounts(self.pet, owner_count=0, activity_count=0)
+        self.assertCounts(self.other_pet, activity_count=0)
+
+    def test_bulk_create_updates_counts_once(self):
+        activities = [
+            Activity(title=f"Walk {i}", scheduled_date=date(2024, 3, 5), user=self.user, pet=self.pet)
+            for i in range(10)
+        ]
+        # Insert, then one update per counter.
+        with self.assertNumQueries(3):
+            bulk_create(Activity, activities)
+        self.assertCounts(self.pet, activity_count=10)
+        self.assertCounts(self.user, activity_count=10)
+
+    def test_decrementing_a_drifted_counter_stops_at_zero(self):
+        activity = self.create_activity()
+        # Drifted low, as after rows removed with raw SQL.
+        Pet.objects.filter(pk=self.pet.pk).update(activity_count=0)
+        activity.delete()
+        self.assertCounts(self.pet, activity_count=0)
+        self.assertCounts(self.user, activity_count=0)
+
+
+class RepairCountersTests(TestCase):
+    def test_repairs_drifted_counters(self):
+        user = User.objects.create_user(username="username", password="password")
+        pet = CounterTests.create_pet("Rex")
+        pet.owners.add(user)
+        Pet.objects.filter(pk=pet.pk).update(owner_count=5)
+        User.objects.filter(pk=user.pk).update(activity_count=2)
+
+        out = StringIO()
+        call_command("repair_counters", "--dry-run", stdout=out)
+        self.assertIn("Found 2 drifted counters.", out.getvalue())
+        pet.refresh_from_db()
+        self.assertEqual(pet.owner_count, 5)
+
+        out = StringIO()
+        call_command("repair_counters", stdout=out)
+        self.assertIn("Repaired 2 drifted counters.", out.getvalue())
+        pet.refresh_from_db()
+        user.refresh_from_db()
+        self.assertEqual((pet.owner_count, user.pet_count, user.activity_count), (1, 1, 0))
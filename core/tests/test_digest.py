@@ -0,0 +1,87 @@
+from datetime import date, timedelta
+from io import StringIO
+
+from django.contrib.auth import get_user_model
+from django.core import mail
+from django.core.mail.backends import locmem
+from django.core.management import call_command
+from django.test import TestCase, override_settings
+from django.utils import timezone
+
+from core.digest import send_digests
+from core.models import Pet, Activity, ActivityRule, HealthEvent, Status
+
+User = get_user_model()
+
+
+class CountingBackend(locmem.EmailBackend):
+    opened = 0
+
+    def open(self):
+        CountingBackend.opened += 1
+        return super().open()
+
+
+@override_settings(EMAIL_BACKEND="core.tests.test_digest.CountingBackend")
+class DigestTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.today = timezone.localdate()
+        cls.pet = Pet.objects.create(
+            name="Rex", breed="test", weight=10, height=20, birth_date=date(2020, 1, 1)
+        )
+        cls.status = Status.objects.create(name="pending")
+        cls.users = [
+            User.objects.create_user(username=f"user{i}", email=f"user{i}@example.com")
+            for i in range(3)
+        ]
+        for i, user in enumerate(cls.users):
+            Activity.objects.create(
+                title=f"Walk {i}",
+                scheduled_date=cls.today + timedelta(days=i),
+                user=user,
+                pet=cls.pet,
+                status=cls.status,
+            )
+            HealthEvent.objects.create(
+                title=f"Checkup {i}", scheduled_date=cls.today + timedelta(days=1), user=user, pet=cls.pet
+            )
+        ActivityRule.objects.create(
+            title="Feeding",
+            frequency=ActivityRule.Frequency.DAILY,
+            start_date=cls.today,
+            user=cls.users[0],
+            pet=cls.pet,
+        )
+        # Outside the window, or without an email address.
+        Activity.objects.create(
+            title="Bath", scheduled_date=cls.today + timedelta(days=7), user=cls.users[0], pet=cls.pet
+        )
+        Activity.objects.create(
+            title="Nap", scheduled_date=cls.today, user=User.objects.create_user(username="other"), pet=cls.pet
+        )
+        User.objects.create_user(username="idle", email="idle@example.com")
+
+    def setUp(self):
+        CountingBackend.opened = 0
+
+    def test_agendas(self):
+        self.assertEqual(send_digests(days=7), 3)
+        body = {message.to[0]: message.body for message in mail.outbox}["user0@example.com"]
+        self.assertIn("- Walk 0 (Activity, Rex, pending)", body)
+        self.assertIn("- Checkup 0 (Health event, Rex)", body)
+        self.assertEqual(body.count("- Feeding (Recurring activity, Rex)"), 7)
+        self.assertNotIn("Bath", body)
+        self.assertLess(body.index("Walk 0"), body.index("Checkup 0"))
+
+    def test_batches_share_queries_and_connections(self):
+        # The users, then per batch the agenda UNION, the rules and, for the
+        # first batch only, their materialized occurrences.
+        with self.assertNumQueries(6):
+            self.assertEqual(send_digests(days=7, batch_size=2), 3)
+        self.assertEqual(CountingBackend.opened, 2)
+
+    def test_command(self):
+        out = StringIO()
+        call_command("send_digests", "--days", "1", stdout=out)
+        self.assertIn("Sent 1 digests.", out.getvalue())
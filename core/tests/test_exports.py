@@ -0,0 +1,85 @@
+import csv
+import json
+from datetime import date
+from decimal import Decimal
+from io import StringIO
+
+from django.contrib.auth import get_user_model
+from django.test import TestCase
+from django.urls import reverse
+
+from core.models import Species, Pet, Status, Priority, Activity, HealthEvent
+
+User = get_user_model()
+
+
+class ExportViewsTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = User.objects.create_user(
+            username="username",
+            password="password",
+        )
+        species = Species.objects.create(name="dog")
+        cls.status = Status.objects.create(name="pending")
+        cls.other_status = Status.objects.create(name="done")
+        priority = Priority.objects.create(name="high")
+        pet = Pet.objects.create(
+            name="Rex",
+            species=species,
+            breed="test",
+            weight=Decimal("10.3"),
+            height=Decimal("20.5"),
+            birth_date=date(2020, 1, 1),
+        )
+        for day, status in ((3, cls.status), (1, cls.status), (2, cls.other_status)):
+            Activity.objects.create(
+                title=f"Walk {day}",
+                scheduled_date=date(2024, 1, day),
+                user=cls.user,
+                pet=pet,
+                status=status,
+            )
+        HealthEvent.objects.create(
+            title="Vaccination, yearly",
+            scheduled_date=date(2024, 1, 1),
+            user=cls.user,
+            pet=pet,
+            status=cls.status,
+            priority=priority,
+        )
+
+    def setUp(self):
+        self.client.force_login(self.user)
+
+    def content(self, res):
+        return b"".join(res.streaming_content).decode()
+
+    def test_csv_export_is_streamed_in_date_order(self):
+        res = self.client.get(reverse("core:activity-export"), {"format": "csv"})
+        self.assertTrue(res.streaming)
+        self.assertEqual(res["Content-Type"], "text/csv")
+        self.assertIn('filename="activities.csv"', res["Content-Disposition"])
+        rows = list(csv.DictReader(StringIO(self.content(res))))
+        self.assertEqual([row["title"] for row in rows], ["Walk 1", "Walk 2", "Walk 3"])
+        self.assertEqual(rows[0]["status"], "pending")
+        self.assertEqual(rows[0]["pet"], "Rex")
+
+    def test_export_uses_list_filters(self):
+        res = self.client.get(
+            reverse("core:activity-export"), {"format": "csv", "status": self.other_status.pk}
+        )
+        rows = list(csv.DictReader(StringIO(self.content(res))))
+        self.assertEqual([row["title"] for row in rows], ["Walk 2"])
+
+    def test_ndjson_export(self):
+        res = self.client.get(reverse("core:healthevent-export"), {"format": "ndjson"})
+        self.assertEqual(res["Content-Type"], "application/x-ndjson")
+        rows = [json.loads(line) for line in self.content(res).splitlines()]
+        self.assertEqual(rows[0]["title"], "Vaccination, yearly")
+        self.assertEqual(rows[0]["scheduled_date"], "2024-01-01")
+        self.assertEqual(rows[0]["priority"], "high")
+
+    def test_unknown_format(self):
+        res = self.client.get(reverse("core:activity-export"), {"format": "xml"})
+        self.assertEqual(res.status_code, 404)
@@ -0,0 +1,137 @@
+from datetime import date
+from decimal import Decimal
+
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.test import TestCase, SimpleTestCase
+from django.urls import reverse
+from django.utils.http import http_date
+
+from core.feeds import feed_token, fold, get_watermark
+from core.models import Species, Pet, Activity, ActivityRule, HealthEvent, Priority
+from core.recurrence import materialize
+
+User = get_user_model()
+
+
+class FoldTests(SimpleTestCase):
+    def test_short_lines_are_kept(self):
+        self.assertEqual(fold("SUMMARY:Walk"), "SUMMARY:Walk\r\n")
+
+    def test_long_lines_are_folded_on_character_boundaries(self):
+        line = "SUMMARY:" + "é" * 60
+        folded = fold(line)
+        parts = folded[:-2].split("\r\n")
+        self.assertTrue(all(len(part.encode()) <= 75 for part in parts))
+        self.assertTrue(all(part.startswith(" ") for part in parts[1:]))
+        self.assertEqual("".join(part[1:] if i else part for i, part in enumerate(parts)), line)
+
+
+class CalendarFeedTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = User.objects.create_user(username="username", password="password")
+        cls.other_user = User.objects.create_user(username="other", password="password")
+        cls.pet = Pet.objects.create(
+            name="Rex",
+            species=Species.objects.create(name="dog"),
+            breed="test",
+            weight=Decimal("10.3"),
+            height=Decimal("20.5"),
+            birth_date=date(2020, 1, 1),
+        )
+        cls.activity = Activity.objects.create(
+            title="Walk, then feed",
+            scheduled_date=date(2024, 3, 5),
+            user=cls.user,
+            pet=cls.pet,
+        )
+        Activity.objects.create(
+            title="Someone else's walk",
+            scheduled_date=date(2024, 3, 5),
+            user=cls.other_user,
+            pet=cls.pet,
+        )
+        HealthEvent.objects.create(
+            title="Vaccination",
+            scheduled_date=date(2024, 3, 6),
+            user=cls.user,
+            pet=cls.pet,
+            priority=Priority.objects.create(name="high"),
+        )
+        cls.rule = ActivityRule.objects.create(
+            title="Medication",
+            frequency=ActivityRule.Frequency.WEEKLY,
+            interval=2,
+            start_date=date(2024, 3, 1),
+            end_date=date(2024, 6, 1),
+            user=cls.user,
+            pet=cls.pet,
+        )
+
+    def setUp(self):
+        cache.clear()
+        self.url = reverse("core:calendar-feed", args=[feed_token(self.user)])
+
+    def get_body(self, res):
+        return b"".join(res.streaming_content).decode()
+
+    def test_feed(self):
+        materialize(self.rule, date(2024, 3, 15))
+        res = self.client.get(self.url)
+        self.assertEqual(res.status_code, 200)
+        self.assertEqual(res["Content-Type"], "text/calendar; charset=utf-8")
+        body = self.get_body(res)
+        self.assertTrue(body.startswith("BEGIN:VCALENDAR\r\n"))
+        self.assertTrue(body.endswith("END:VCALENDAR\r\n"))
+        self.assertIn("SUMMARY:Walk\\, then feed (Rex)\r\n", body)
+        self.assertIn("SUMMARY:Vaccination (Rex)\r\n", body)
+        self.assertIn("RRULE:FREQ=WEEKLY;INTERVAL=2;UNTIL=20240601\r\n", body)
+        self.assertIn("EXDATE;VALUE=DATE:20240315\r\n", body)
+        self.assertNotIn("Someone else", body)
+
+    def test_forged_token(self):
+        url = reverse("core:calendar-feed", args=[f"{self.user.pk}:forged"])
+        self.assertEqual(self.client.get(url).status_code, 404)
+
+    def test_conditional_requests_skip_the_database(self):
+        res = self.client.get(self.url)
+        self.get_body(res)
+        with self.assertNumQueries(0):
+            res = self.client.get(self.url, headers={"if-none-match": res["ETag"]})
+        self.assertEqual(res.status_code, 304)
+        since = http_date(get_watermark(self.user.pk).timestamp() + 1)
+        with self.assertNumQueries(0):
+            res = self.client.get(self.url, headers={"if-modified-since": since})
+        self.assertEqual(res.status_code, 304)
+
+    def test_changes_move_the_watermark(self):
+        etag = self.client.get(self.url)["ETag"]
+        with self.captureOnCommitCallbacks(execute=True):
+            self.activity.title = "Run"
+            self.activity.save()
+        res = self.client.get(self.url, headers={"if-none-match": etag})
+        self.assertEqual(res.status_code, 200)
+        self.assertIn("SUMMARY:Run (Rex)", self.get_body(res))
+
+    def test_reassigned_activity_moves_both_watermarks(self):
+        url = reverse("core:calendar-feed", args=[feed_token(self.other_user)])
+        etags = [self.client.get(u)["ETag"] for u in (self.url, url)]
+        with self.captureOnCommitCallbacks(execute=True):
+            activity = Activity.objects.get(pk=self.activity.pk)
+            activity.user = self.other_user
+            activity.save()
+        for u, etag in zip((self.url, url), etags):
+            self.assertEqual(self.client.get(u, headers={"if-none-match": etag}).status_code, 200)
+
+    def test_other_users_changes_keep_the_watermark(self):
+        etag = self.client.get(self.url)["ETag"]
+        with self.captureOnCommitCallbacks(execute=True):
+            Activity.objects.create(
+                title="Feed",
+                scheduled_date=date(2024, 3, 5),
+                user=self.other_user,
+                pet=self.pet,
+            )
+        res = self.client.get(self.url, headers={"if-none-match": etag})
+        self.assertEqual(res.status_code, 304)
@@ -17,7 +17,7 @@ from core.forms import (
     StatusSearchForm,
     PrioritySearchForm
 )
-from core.models import Species
+from core.models import Species, Pet
 
 User = get_user_model()
 
@@ -109,6 +109,26 @@ class ActivitySearchFormTests(TestCase):
             forms.ModelChoiceField
         )
 
+    def test_pets_widget_renders_only_selected_pet(self):
+        species = Species.objects.create(name="test")
+        pets = [
+            Pet.objects.create(
+                name=f"test{i}",
+                species=species,
+                breed="test",
+                weight=Decimal("10.3"),
+                height=Decimal("20.5"),
+                birth_date=date(2020, 1, 1),
+            )
+            for i in range(3)
+        ]
+        form = ActivitySearchForm(initial={"pets": str(pets[1].pk)})
+        html = str(form["pets"])
+        self.assertIn("data-autocomplete-url", html)
+        self.assertIn("test1", html)
+        self.assertNotIn("test0", html)
+        self.assertNotIn("test2", html)
+
 
 class HealthEventSearchFormTests(TestCase):
     def test_form_contains_title_field(self):
@@ -0,0 +1,111 @@
+from datetime import date
+from decimal import Decimal
+
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.test import TestCase, override_settings
+from django.urls import reverse
+
+from core.fragments import version_key
+from core.models import Species, Pet, Status, Activity
+
+User = get_user_model()
+
+
+# Rows read from a replica are not cached.
+@override_settings(REPLICA_DATABASES=[])
+class RowFragmentTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = User.objects.create_user(
+            username="username",
+            password="password",
+        )
+        cls.species = Species.objects.create(name="dog")
+        cls.status = Status.objects.create(name="pending")
+        cls.pet = Pet.objects.create(
+            name="Rex",
+            species=cls.species,
+            breed="test",
+            weight=Decimal("10.3"),
+            height=Decimal("20.5"),
+            birth_date=date(2020, 1, 1),
+        )
+        cls.activity = Activity.objects.create(
+            title="Walk",
+            scheduled_date=date(2020, 1, 1),
+            user=cls.user,
+            pet=cls.pet,
+            status=cls.status,
+        )
+
+    def setUp(self):
+        cache.clear()
+        self.client.force_login(self.user)
+
+    def get(self, name):
+        return self.client.get(reverse(f"core:{name}")).content.decode()
+
+    def test_rows_are_served_from_cache(self):
+        self.assertIn("Rex", self.get("pet-list"))
+        Pet.objects.filter(pk=self.pet.pk).update(name="Max")
+        self.assertIn("Rex", self.get("pet-list"))
+
+    def test_save_retires_row(self):
+        self.get("pet-list")
+        with self.captureOnCommitCallbacks(execute=True):
+            self.pet.name = "Max"
+            self.pet.save()
+        content = self.get("pet-list")
+        self.assertIn("Max", content)
+        self.assertNotIn("Rex", content)
+
+    def test_related_save_retires_row(self):
+        self.get("activity-list")
+        with self.captureOnCommitCallbacks(execute=True):
+            self.status.name = "done"
+            self.status.save()
+        self.assertIn("Done", self.get("activity-list"))
+
+    def test_owner_change_retires_pet_and_user_rows(self):
+        self.get("pet-list")
+        self.get("user-list")
+        with self.captureOnCommitCallbacks(execute=True):
+            self.pet.owners.add(self.user)
+        self.assertInHTML(
+            '<span class="badge badge-sm bg-gradient-success">1</span>', self.get("pet-list")
+        )
+        self.assertInHTML(
+            '<span class="badge badge-sm bg-gradient-success">1</span>', self.get("user-list")
+        )
+
+    def test_cascaded_owner_removal_retires_counter_rows(self):
+        other = Pet.objects.create(
+            name="Fido", species=self.species, breed="test", weight=Decimal("10.3"),
+            height=Decimal("20.5"), birth_date=date(2020, 1, 1),
+        )
+        with self.captureOnCommitCallbacks(execute=True):
+            self.pet.owners.add(self.user)
+            other.owners.add(self.user)
+        self.assertInHTML(
+            '<span class="badge badge-sm bg-gradient-success">2</span>', self.get("user-list")
+        )
+        with self.captureOnCommitCallbacks(execute=True):
+            other.delete()
+        self.assertInHTML(
+            '<span class="badge badge-sm bg-gradient-success">1</span>', self.get("user-list")
+        )
+
+    def test_login_does_not_retire_user_rows(self):
+        self.get("user-list")
+        version = cache.get(version_key(User, self.user.pk))
+        with self.captureOnCommitCallbacks(execute=True):
+            self.client.login(username="username", password="password")
+        self.assertEqual(cache.get(version_key(User, self.user.pk)), version)
+
+    def test_cached_rows_carry_no_csrf_token(self):
+        self.get("pet-list")
+        res = self.client.get(reverse("core:pet-list"))
+        key, html = res.context["pet_list"][0].row_fragment
+        self.assertIn('form="row-delete-form"', html)
+        self.assertNotIn("csrfmiddlewaretoken", html)
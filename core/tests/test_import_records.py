@@ -0,0 +1,141 @@
+import json
+import tempfile
+from datetime import date
+from decimal import Decimal
+from io import StringIO
+from pathlib import Path
+from unittest import mock
+
+from django.contrib.auth import get_user_model
+from django.core.management import call_command
+from django.db import connection
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+
+from core.bulk import validate_batch
+from core.models import Species, Pet, Status, Priority, Activity, HealthEvent
+
+User = get_user_model()
+
+
+class ImportRecordsTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = User.objects.create_user(username="alice", password="password")
+        cls.other_user = User.objects.create_user(username="bob", password="password")
+        cls.species = Species.objects.create(name="dog")
+        cls.status = Status.objects.create(name="pending")
+        cls.priority = Priority.objects.create(name="high")
+        cls.pet = Pet.objects.create(
+            name="Rex",
+            species=cls.species,
+            breed="test",
+            weight=Decimal("10.3"),
+            height=Decimal("20.5"),
+            birth_date=date(2020, 1, 1),
+        )
+
+    def setUp(self):
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        self.directory = Path(directory.name)
+
+    def write(self, name, content):
+        path = self.directory / name
+        path.write_text(content, encoding="utf-8")
+        return str(path)
+
+    def run_import(self, *args):
+        stdout, stderr = StringIO(), StringIO()
+        call_command("import_records", *args, stdout=stdout, stderr=stderr)
+        return stdout.getvalue(), stderr.getvalue()
+
+    def test_import_pets_from_csv(self):
+        path = self.write("pets.csv", (
+            "name,species,breed,weight,height,birth_date,owners\n"
+            "Max,dog,lab,30.5,60,2019-04-01,alice;bob\n"
+            "Bella,dog,pug,8,30,2021-07-15,bob\n"
+        ))
+        stdout, stderr = self.run_import("pets", path)
+        self.assertIn("Imported 2 rows", stdout)
+        self.assertEqual(stderr, "")
+        max_ = Pet.objects.get(name="Max")
+        self.assertEqual(max_.species, self.species)
+        self.assertCountEqual(max_.owners.all(), [self.user, self.other_user])
+
+    def test_import_health_events_from_jsonl_in_chunks(self):
+        rows = [
+            {
+                "title": f"Checkup {i}",
+                "scheduled_date": "2024-03-01",
+                "user": "alice",
+                "pet": "Rex",
+                "status": "pending",
+                "priority": "high",
+            }
+            for i in range(5)
+        ]
+        path = self.write("events.jsonl", "\n".join(json.dumps(row) for row in rows))
+        stdout, stderr = self.run_import("healthevents", path, "--chunk-size", "2")
+        self.assertIn("Imported 5 rows", stdout)
+        self.assertEqual(stdout.count("rows/s"), 3)
+        self.assertEqual(HealthEvent.objects.filter(priority=self.priority).count(), 5)
+
+    def test_invalid_rows_are_reported_and_skipped(self):
+        path = self.write("activities.csv", (
+            "title,scheduled_date,user,pet,status\n"
+            "Walk,2024-03-01,alice,Rex,pending\n"
+            "Feed,2024-03-01,alice,Unknown,pending\n"
+            "Walk,2024-03-02,bob,Rex,\n"
+        ))
+        stdout, stderr = self.run_import("activities", path)
+        self.assertIn("Imported 1 rows, skipped 2 invalid rows", stdout)
+        self.assertIn("line 3: pet:", stderr)
+        self.assertIn("line 4: title:", stderr)
+        self.assertQuerySetEqual(Activity.objects.values_list("title", flat=True), ["Walk"])
+
+    def test_dry_run(self):
+        path = self.write("activities.csv", (
+            "title,scheduled_date,user,pet,status\n"
+            "Walk,2024-03-01,alice,Rex,pending\n"
+        ))
+        stdout, stderr = self.run_import("activities", path, "--dry-run")
+        self.assertIn("Validated 1 rows", stdout)
+        self.assertFalse(Activity.objects.exists())
+
+    def test_pets_import_query_count_does_not_grow(self):
+        counts = []
+        for size in (2, 10):
+            rows = "".join(f"Pet {size}-{i},dog,lab,30,60,2019-04-01,alice;bob\n" for i in range(size))
+            path = self.write(f"pets{size}.csv", "name,species,breed,weight,height,birth_date,owners\n" + rows)
+            with CaptureQueriesContext(connection) as queries:
+                stdout, stderr = self.run_import("pets", path)
+            self.assertIn(f"Imported {size} rows", stdout)
+            counts.append(len(queries))
+        self.assertEqual(counts[0], counts[1])
+        self.assertEqual(User.objects.get(pk=self.user.pk).pet_count, 12)
+
+    def test_rows_rejected_by_the_database_are_skipped_alone(self):
+        def validate_then_take_a_title(forms_list):
+            valid = validate_batch(forms_list)
+            # Another writer takes a title after the chunk was validated.
+            Activity.objects.create(
+                title="Feed", scheduled_date=date(2024, 3, 1), user=self.user, pet=self.pet,
+                status=self.status,
+            )
+            return valid
+
+        path = self.write("activities.csv", "title,scheduled_date,user,pet,status\n" + "".join(
+            f"{title},2024-03-01,alice,Rex,pending\n" for title in ("Walk", "Feed", "Groom", "Bath", "Play")
+        ))
+        with mock.patch(
+            "core.management.commands.import_records.validate_batch", validate_then_take_a_title
+        ):
+            stdout, stderr = self.run_import("activities", path)
+        self.assertIn("Imported 4 rows, skipped 1 invalid rows", stdout)
+        self.assertIn("line 3:", stderr)
+        self.assertNotIn("line 2:", stderr)
+        self.assertCountEqual(
+            Activity.objects.values_list("title", flat=True), ["Walk", "Feed", "Groom", "Bath", "Play"]
+        )
+        self.assertEqual(User.objects.get(pk=self.user.pk).activity_count, 5)
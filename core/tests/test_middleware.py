@@ -0,0 +1,84 @@
+import json
+
+from django.contrib.auth import get_user_model
+from django.test import TestCase, override_settings
+from django.urls import reverse
+
+User = get_user_model()
+
+
+@override_settings(REQUEST_TIMING_SAMPLE_RATE=1.0, REQUEST_TIMING_SLOW_MS=60000)
+class RequestTimingMiddlewareTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = User.objects.create_user(
+            username="username",
+            password="password",
+            is_staff=True,
+        )
+        cls.other_user = User.objects.create_user(username="other")
+
+    def setUp(self):
+        self.client.force_login(self.user)
+
+    def server_timing(self, res):
+        metrics = dict()
+        for entry in res["Server-Timing"].split(", "):
+            name, *params = entry.split(";")
+            metrics[name] = dict(param.split("=", 1) for param in params)
+        return metrics
+
+    def test_server_timing_header(self):
+        res = self.client.get(reverse("core:activity-list"))
+        metrics = self.server_timing(res)
+        self.assertCountEqual(metrics, ["total", "db", "view", "template"])
+        self.assertRegex(metrics["db"]["desc"], r'^"[1-9]\d* queries"$')
+        self.assertLessEqual(float(metrics["view"]["dur"]), float(metrics["total"]["dur"]))
+
+    def test_view_without_template_has_no_template_timing(self):
+        res = self.client.get(reverse("core:pet-autocomplete"))
+        self.assertCountEqual(self.server_timing(res), ["total", "db", "view"])
+
+    async def test_server_timing_header_under_asgi(self):
+        await self.async_client.aforce_login(self.user)
+        res = await self.async_client.get(reverse("core:activity-list"))
+        metrics = self.server_timing(res)
+        self.assertCountEqual(metrics, ["total", "db", "view", "template"])
+        self.assertRegex(metrics["db"]["desc"], r'^"[1-9]\d* queries"$')
+
+    @override_settings(REQUEST_TIMING_SLOW_MS=0)
+    def test_header_is_for_staff_only(self):
+        self.client.force_login(self.other_user)
+        with self.assertLogs("core.timing", level="WARNING"):
+            res = self.client.get(reverse("core:activity-list"))
+        self.assertFalse(res.has_header("Server-Timing"))
+
+    async def test_header_is_for_staff_only_under_asgi(self):
+        await self.async_client.aforce_login(self.other_user)
+        res = await self.async_client.get(reverse("core:activity-list"))
+        self.assertFalse(res.has_header("Server-Timing"))
+
+    @override_settings(DEBUG=True)
+    def test_header_is_for_everyone_with_debug(self):
+        self.client.force_login(self.other_user)
+        res = self.client.get(reverse("core:activity-list"))
+        self.assertCountEqual(self.server_timing(res), ["total", "db", "view", "template"])
+
+    @override_settings(REQUEST_TIMING_SAMPLE_RATE=0)
+    def test_unsampled_request(self):
+        res = self.client.get(reverse("core:activity-list"))
+        self.assertFalse(res.has_header("Server-Timing"))
+
+    @override_settings(REQUEST_TIMING_SLOW_MS=0)
+    def test_slow_request_is_logged(self):
+        with self.assertLogs("core.timing", level="WARNING") as logs:
+            self.client.get(reverse("core:activity-list"))
+        entry = json.loads(logs.records[0].args[0])
+        self.assertEqual(entry["path"], reverse("core:activity-list"))
+        self.assertEqual(entry["status"], 200)
+        self.assertGreater(entry["queries"], 0)
+        self.assertIn("template_ms", entry)
+
+    def test_fast_request_is_not_logged(self):
+        with self.assertNoLogs("core.timing", level="WARNING"):
+            self.client.get(reverse("core:activity-list"))
@@ -0,0 +1,89 @@
+from datetime import date, timedelta
+from decimal import Decimal
+
+from django.contrib.auth import get_user_model
+from django.test import TestCase
+from django.urls import reverse
+
+from core.models import Species, Pet, Status, Activity
+from core.pagination import CursorPaginator, InvalidCursor
+
+User = get_user_model()
+
+
+class CursorPaginatorTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = User.objects.create_user(
+            username="username",
+            password="password",
+        )
+        cls.pet = Pet.objects.create(
+            name="test",
+            species=Species.objects.create(name="test"),
+            breed="test",
+            weight=Decimal("10.3"),
+            height=Decimal("20.5"),
+            birth_date=date(2020, 1, 1),
+        )
+        cls.status = Status.objects.create(name="test")
+        cls.activities = list()
+        for i in range(7):
+            cls.activities.append(
+                Activity.objects.create(
+                    title=f"activity{i}",
+                    scheduled_date=date(2020, 1, 1) + timedelta(days=i // 2),
+                    user=cls.user,
+                    pet=cls.pet,
+                    status=cls.status,
+                )
+            )
+
+    def paginator(self, per_page=3):
+        return CursorPaginator(Activity.objects.all(), per_page, ("scheduled_date", "id"))
+
+    def test_first_page(self):
+        page = self.paginator().page()
+        self.assertEqual(page.object_list, self.activities[:3])
+        self.assertTrue(page.has_next())
+        self.assertFalse(page.has_previous())
+
+    def test_walk_forward_and_back(self):
+        paginator = self.paginator()
+        first = paginator.page()
+        second = paginator.page(first.next_cursor)
+        third = paginator.page(second.next_cursor)
+        self.assertEqual(second.object_list, self.activities[3:6])
+        self.assertEqual(third.object_list, self.activities[6:])
+        self.assertFalse(third.has_next())
+
+        back = paginator.page(third.previous_cursor)
+        self.assertEqual(back.object_list, self.activities[3:6])
+        self.assertTrue(back.has_previous())
+        self.assertEqual(paginator.page(back.previous_cursor).object_list, self.activities[:3])
+
+    def test_deep_page_costs_one_query(self):
+        paginator = self.paginator(per_page=2)
+        page = paginator.page()
+        while page.has_next():
+            cursor = page.next_cursor
+            with self.assertNumQueries(1):
+                page = paginator.page(cursor)
+
+    def test_invalid_cursor(self):
+        with self.assertRaises(InvalidCursor):
+            self.paginator().page("not-a-cursor")
+
+    def test_list_view_keeps_filters(self):
+        self.client.force_login(self.user)
+        res = self.client.get(reverse("core:activity-list"), {"pets": self.pet.pk})
+        cursor = res.context["page_obj"].next_cursor
+        self.assertContains(res, f"?pets={self.pet.pk}&amp;cursor={cursor}")
+
+        res = self.client.get(reverse("core:activity-list"), {"pets": self.pet.pk, "cursor": cursor})
+        self.assertEqual(list(res.context["activity_list"]), self.activities[2:4])
+
+    def test_list_view_invalid_cursor(self):
+        self.client.force_login(self.user)
+        res = self.client.get(reverse("core:healthevent-list"), {"cursor": "bad"})
+        self.assertEqual(res.status_code, 404)
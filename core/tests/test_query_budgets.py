@@ -0,0 +1,252 @@
+from contextlib import nullcontext
+from datetime import date, timedelta
+from decimal import Decimal
+from unittest import mock
+
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.db import connection, transaction
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse, resolve
+
+from core.models import Species, Pet, Status, Priority, Activity, ActivityRule, HealthEvent
+from core.feeds import feed_token
+from core.recurrence import materialize
+from core.urls import urlpatterns
+
+User = get_user_model()
+
+# Maximum number of SQL queries per route, including the session and user
+# lookups every authenticated request makes. Each route is rendered against
+# datasets and page sizes of different scales and must issue the same number
+# of queries at every scale.
+QUERY_BUDGETS = {
+    "index": 3,
+    "user-list": 4,
+    "user-detail": 4,
+    "user-update": 3,
+    "user-delete": 25,
+    "user-create": 2,
+    "signup": 2,
+    "pet-list": 4,
+    "pet-create": 4,
+    "pet-detail": 4,
+    "pet-update": 6,
+    "pet-delete": 22,
+    "toggle-pet-assign": 7,
+    "activity-list": 3,
+    "activity-create": 5,
+    "activity-detail": 4,
+    "activity-update": 6,
+    "activity-delete": 6,
+    "activityrule-list": 4,
+    "activityrule-create": 5,
+    "activityrule-update": 6,
+    "activityrule-delete": 5,
+    "activityrule-materialize": 9,
+    "healthevent-list": 3,
+    "healthevent-create": 6,
+    "healthevent-detail": 4,
+    "healthevent-update": 7,
+    "healthevent-delete": 6,
+    "calendar": 5,
+    "calendar-feed": 5,
+    "status-list": 4,
+    "status-create": 2,
+    "status-update": 3,
+    "status-delete": 9,
+    "priority-list": 4,
+    "priority-create": 2,
+    "priority-update": 3,
+    "priority-delete": 6,
+    "species-list": 4,
+    "species-create": 2,
+    "species-update": 3,
+    "species-delete": 5,
+    "pet-autocomplete": 3,
+    "user-autocomplete": 3,
+    "status-autocomplete": 3,
+    "priority-autocomplete": 3,
+    "activity-export": 3,
+    "healthevent-export": 3,
+    "api-pet-list": 4,
+    "api-pet-detail": 4,
+    "api-activity-list": 3,
+    "api-activity-detail": 3,
+    "api-healthevent-list": 3,
+    "api-healthevent-detail": 3,
+}
+
+# Routes that take a primary key, mapped to the seeded object they act on.
+# Routes not listed are requested without arguments.
+ROUTE_OBJECTS = {
+    "user-detail": "user",
+    "user-update": "user",
+    "user-delete": "user",
+    "pet-detail": "pet",
+    "pet-update": "pet",
+    "pet-delete": "pet",
+    "toggle-pet-assign": "pet",
+    "activity-detail": "activity",
+    "activity-update": "activity",
+    "activity-delete": "activity",
+    "activityrule-update": "rule",
+    "activityrule-delete": "rule",
+    "activityrule-materialize": "rule",
+    "healthevent-detail": "health_event",
+    "healthevent-update": "health_event",
+    "healthevent-delete": "health_event",
+    "status-update": "status",
+    "status-delete": "status",
+    "priority-update": "priority",
+    "priority-delete": "priority",
+    "species-update": "species",
+    "species-delete": "species",
+    "api-pet-detail": "pet",
+    "api-activity-detail": "activity",
+    "api-healthevent-detail": "health_event",
+}
+
+# Routes that take other arguments, mapped to a function of the seeded
+# objects returning them.
+ROUTE_ARGUMENTS = {
+    "activityrule-materialize": lambda objects: {
+        "day": (date.today() + timedelta(days=1)).isoformat(),
+    },
+    "calendar-feed": lambda objects: {"token": feed_token(objects["viewer"])},
+}
+
+POST_ROUTES = {name for name in QUERY_BUDGETS if name.endswith("-delete")}
+POST_ROUTES.update(("activityrule-materialize", "toggle-pet-assign"))
+
+SCALES = (3, 8)
+
+
+def seed(size):
+    species = [Species.objects.create(name=f"species{i}") for i in range(size)]
+    statuses = [Status.objects.create(name=f"status{i}") for i in range(size)]
+    priorities = [Priority.objects.create(name=f"priority{i}") for i in range(size)]
+    users = [
+        User.objects.create_user(username=f"user{i}")
+        for i in range(size)
+    ]
+    pets = list()
+    for i in range(size):
+        pet = Pet.objects.create(
+            name=f"pet{i}",
+            species=species[i],
+            breed="test",
+            weight=Decimal("10.3"),
+            height=Decimal("20.5"),
+            birth_date=date(2020, 1, 1),
+        )
+        pet.owners.set(users)
+        pets.append(pet)
+
+    activities = list()
+    health_events = list()
+    for i in range(size * size):
+        activities.append(
+            Activity.objects.create(
+                title=f"activity{i}",
+                scheduled_date=date(2020, 1, 1) + timedelta(days=i),
+                user=users[i % size],
+                pet=pets[i % size],
+                status=statuses[i % size],
+            )
+        )
+        health_events.append(
+            HealthEvent.objects.create(
+                title=f"health event{i}",
+                scheduled_date=date(2020, 1, 1) + timedelta(days=i),
+                user=users[i % size],
+                pet=pets[i % size],
+                status=statuses[i % size],
+                priority=priorities[i % size],
+            )
+        )
+
+    # Every rule belongs to the first pet, so its upcoming occurrences grow
+    # with the scale, and today's occurrences are materialized.
+    rules = list()
+    for i in range(size):
+        rule = ActivityRule.objects.create(
+            title=f"rule{i}",
+            frequency=ActivityRule.Frequency.DAILY,
+            start_date=date.today() - timedelta(days=i),
+            user=users[i % size],
+            pet=pets[0],
+            status=statuses[i % size],
+        )
+        materialize(rule, date.today())
+        rules.append(rule)
+
+    return {
+        "viewer": users[0],
+        "user": users[0],
+        "pet": pets[0],
+        "activity": activities[0],
+        "rule": rules[0],
+        "health_event": health_events[0],
+        "status": statuses[0],
+        "priority": priorities[0],
+        "species": species[0],
+    }
+
+
+class QueryBudgetTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        # The backend probes for JSON support with a query the first time a
+        # connection compiles a JSON expression, not on every request.
+        connection.features.supports_json_field
+
+    def route_names(self):
+        return [pattern.name for pattern in urlpatterns]
+
+    def count_queries(self, name, size):
+        with transaction.atomic():
+            objects = seed(size)
+            self.client.force_login(objects["viewer"])
+            cache.clear()
+
+            kwargs = ROUTE_ARGUMENTS[name](objects) if name in ROUTE_ARGUMENTS else {}
+            if name in ROUTE_OBJECTS:
+                kwargs["pk"] = objects[ROUTE_OBJECTS[name]].pk
+            url = reverse(f"core:{name}", kwargs=kwargs)
+            view_class = getattr(resolve(url).func, "view_class", None)
+
+            if hasattr(view_class, "paginate_by"):
+                page_size = mock.patch.object(view_class, "paginate_by", size)
+            else:
+                page_size = nullcontext()
+
+            with page_size:
+                with CaptureQueriesContext(connection) as queries:
+                    if name in POST_ROUTES:
+                        res = self.client.post(url)
+                    else:
+                        res = self.client.get(url)
+                    if res.streaming:
+                        b"".join(res.streaming_content)
+
+            self.assertLess(res.status_code, 400, f"{name} returned {res.status_code}")
+            transaction.set_rollback(True)
+        return len(queries)
+
+    def test_every_route_has_budget(self):
+        self.assertCountEqual(self.route_names(), QUERY_BUDGETS)
+
+    def test_query_counts_are_constant_and_within_budget(self):
+        for name in self.route_names():
+            with self.subTest(route=name):
+                counts = [self.count_queries(name, size) for size in SCALES]
+                self.assertEqual(
+                    len(set(counts)), 1,
+                    f"{name} issues a number of queries that grows with the data: {counts}"
+                )
+                self.assertLessEqual(
+                    counts[0], QUERY_BUDGETS[name],
+                    f"{name} issued {counts[0]} queries, budget is {QUERY_BUDGETS[name]}"
+                )
@@ -0,0 +1,183 @@
+from datetime import date, timedelta
+from decimal import Decimal
+
+from django.contrib.auth import get_user_model
+from django.test import TestCase
+from django.urls import reverse
+
+from core.models import Species, Pet, Status, Activity, ActivityRule
+from core.recurrence import occurrence_dates, is_occurrence, expand, materialize
+
+User = get_user_model()
+
+
+class RecurrenceTestCase(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = User.objects.create_user(username="username", password="password")
+        cls.status = Status.objects.create(name="pending")
+        cls.pet = Pet.objects.create(
+            name="Rex",
+            species=Species.objects.create(name="dog"),
+            breed="test",
+            weight=Decimal("10.3"),
+            height=Decimal("20.5"),
+            birth_date=date(2020, 1, 1),
+        )
+
+    def create_rule(self, frequency, start_date, **kwargs):
+        return ActivityRule.objects.create(
+            title=kwargs.pop("title", "Feed"),
+            frequency=frequency,
+            start_date=start_date,
+            user=self.user,
+            pet=self.pet,
+            status=self.status,
+            **kwargs,
+        )
+
+
+class OccurrenceDatesTests(RecurrenceTestCase):
+    def dates(self, rule, start, end):
+        return list(occurrence_dates(rule, start, end))
+
+    def test_daily_with_interval(self):
+        rule = self.create_rule(ActivityRule.Frequency.DAILY, date(2024, 1, 1), interval=3)
+        self.assertEqual(
+            self.dates(rule, date(2024, 1, 5), date(2024, 1, 14)),
+            [date(2024, 1, 7), date(2024, 1, 10), date(2024, 1, 13)],
+        )
+
+    def test_weekly_window_far_from_start(self):
+        rule = self.create_rule(ActivityRule.Frequency.WEEKLY, date(2000, 1, 3))
+        self.assertEqual(
+            self.dates(rule, date(2024, 6, 1), date(2024, 6, 14)),
+            [date(2024, 6, 3), date(2024, 6, 10)],
+        )
+
+    def test_monthly_skips_months_without_the_day(self):
+        rule = self.create_rule(ActivityRule.Frequency.MONTHLY, date(2024, 1, 31))
+        self.assertEqual(
+            self.dates(rule, date(2024, 1, 1), date(2024, 5, 31)),
+            [date(2024, 1, 31), date(2024, 3, 31), date(2024, 5, 31)],
+        )
+
+    def test_yearly_leap_day(self):
+        rule = self.create_rule(ActivityRule.Frequency.YEARLY, date(2020, 2, 29))
+        self.assertEqual(
+            self.dates(rule, date(2020, 1, 1), date(2028, 12, 31)),
+            [date(2020, 2, 29), date(2024, 2, 29), date(2028, 2, 29)],
+        )
+
+    def test_window_is_clipped_to_rule_dates(self):
+        rule = self.create_rule(
+            ActivityRule.Frequency.DAILY, date(2024, 1, 10), end_date=date(2024, 1, 12)
+        )
+        self.assertEqual(
+            self.dates(rule, date(2024, 1, 1), date(2024, 1, 31)),
+            [date(2024, 1, 10), date(2024, 1, 11), date(2024, 1, 12)],
+        )
+        self.assertFalse(is_occurrence(rule, date(2024, 1, 13)))
+        self.assertTrue(is_occurrence(rule, date(2024, 1, 11)))
+
+
+class ExpandTests(RecurrenceTestCase):
+    def test_only_materialized_occurrences_are_stored(self):
+        rule = self.create_rule(ActivityRule.Frequency.DAILY, date(2024, 1, 1))
+        occurrences = expand([rule], date(2024, 1, 1), date(2024, 12, 31))
+        self.assertEqual(len(occurrences), 366)
+        self.assertFalse(Activity.objects.exists())
+
+        activity = materialize(rule, date(2024, 1, 2))
+        self.assertEqual(materialize(rule, date(2024, 1, 2)), activity)
+        self.assertEqual(activity.title, "Feed (2024-01-02)")
+        self.assertEqual(Activity.objects.count(), 1)
+
+        with self.assertNumQueries(1):
+            occurrences = expand([rule], date(2024, 1, 1), date(2024, 1, 3))
+        self.assertEqual([o.is_materialized for o in occurrences], [False, True, False])
+        self.assertEqual(occurrences[1].activity, activity)
+
+    def test_occurrences_of_several_rules_are_ordered_by_date(self):
+        daily = self.create_rule(ActivityRule.Frequency.DAILY, date(2024, 1, 2), interval=2)
+        weekly = self.create_rule(ActivityRule.Frequency.WEEKLY, date(2024, 1, 1), title="Walk")
+        occurrences = expand([daily, weekly], date(2024, 1, 1), date(2024, 1, 4))
+        self.assertEqual(
+            [(o.date, o.title) for o in occurrences],
+            [(date(2024, 1, 1), "Walk"), (date(2024, 1, 2), "Feed"), (date(2024, 1, 4), "Feed")],
+        )
+
+    def test_materialized_titles_are_unique_and_fit(self):
+        first = self.create_rule(ActivityRule.Frequency.DAILY, date(2024, 1, 1))
+        second = self.create_rule(ActivityRule.Frequency.DAILY, date(2024, 1, 1))
+        self.assertEqual(materialize(first, date(2024, 1, 2)).title, "Feed (2024-01-02)")
+        self.assertEqual(
+            materialize(second, date(2024, 1, 2)).title, f"Feed (2024-01-02, rule {second.pk})"
+        )
+
+        long = self.create_rule(ActivityRule.Frequency.DAILY, date(2024, 1, 1), title="x" * 150)
+        title = materialize(long, date(2024, 1, 2)).title
+        self.assertEqual(len(title), 150)
+        self.assertTrue(title.endswith(" (2024-01-02)"))
+
+    def test_materialize_rejects_other_dates(self):
+        rule = self.create_rule(ActivityRule.Frequency.WEEKLY, date(2024, 1, 1))
+        with self.assertRaises(ValueError):
+            materialize(rule, date(2024, 1, 2))
+
+
+class ActivityRuleViewTests(RecurrenceTestCase):
+    def setUp(self):
+        self.client.force_login(self.user)
+
+    def test_materialize_view_redirects_to_activity_form(self):
+        rule = self.create_rule(ActivityRule.Frequency.DAILY, date(2024, 1, 1))
+        url = reverse("core:activityrule-materialize", args=[rule.pk, "2024-01-05"])
+        res = self.client.post(url)
+        activity = Activity.objects.get(rule=rule, occurrence_date=date(2024, 1, 5))
+        self.assertRedirects(res, reverse("core:activity-update", args=[activity.pk]))
+
+    def test_materialize_view_with_rules_sharing_a_title(self):
+        rules = [self.create_rule(ActivityRule.Frequency.DAILY, date(2024, 1, 1)) for _ in range(2)]
+        for rule in rules:
+            res = self.client.post(reverse("core:activityrule-materialize", args=[rule.pk, "2024-01-05"]))
+            self.assertEqual(res.status_code, 302)
+        self.assertEqual(Activity.objects.filter(occurrence_date=date(2024, 1, 5)).count(), 2)
+
+        # An activity someone named like the disambiguated title.
+        rule = self.create_rule(ActivityRule.Frequency.DAILY, date(2024, 1, 1))
+        for title in ("Feed (2024-01-06)", f"Feed (2024-01-06, rule {rule.pk})"):
+            Activity.objects.create(title=title, scheduled_date=date(2024, 1, 6), user=self.user, pet=self.pet)
+        res = self.client.post(reverse("core:activityrule-materialize", args=[rule.pk, "2024-01-06"]))
+        self.assertEqual(res.status_code, 409)
+
+    def test_materialize_view_rejects_non_occurrences(self):
+        rule = self.create_rule(ActivityRule.Frequency.WEEKLY, date(2024, 1, 1))
+        for day in ("2024-01-02", "not-a-date", "2023-12-25"):
+            with self.subTest(day=day):
+                url = reverse("core:activityrule-materialize", args=[rule.pk, day])
+                self.assertEqual(self.client.post(url).status_code, 404)
+        self.assertFalse(Activity.objects.exists())
+
+    def test_pet_detail_lists_upcoming_occurrences(self):
+        today = date.today()
+        rule = self.create_rule(ActivityRule.Frequency.DAILY, today - timedelta(days=30))
+        materialize(rule, today)
+        res = self.client.get(reverse("core:pet-detail", args=[self.pet.pk]))
+        occurrences = res.context["upcoming_occurrences"]
+        self.assertEqual(len(occurrences), 14)
+        self.assertTrue(occurrences[0].is_materialized)
+        self.assertContains(res, f"Feed ({today.isoformat()})")
+
+    def test_end_date_before_start_date_is_invalid(self):
+        res = self.client.post(reverse("core:activityrule-create"), {
+            "title": "Feed",
+            "frequency": "daily",
+            "interval": 1,
+            "start_date": "2024-01-10",
+            "end_date": "2024-01-01",
+            "user": self.user.pk,
+            "pet": self.pet.pk,
+        })
+        self.assertEqual(res.status_code, 200)
+        self.assertIn("end_date", res.context["form"].errors)
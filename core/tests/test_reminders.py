@@ -0,0 +1,148 @@
+from datetime import date, timedelta
+from io import StringIO
+from smtplib import SMTPException
+from unittest import mock
+
+from django.contrib.auth import get_user_model
+from django.core import mail
+from django.core.mail.backends.locmem import EmailBackend
+from django.core.management import call_command
+from django.test import TestCase
+from django.utils import timezone
+
+from core.models import Pet, HealthEvent, Priority, ReminderMark, Status
+from core.reminders import send_reminders
+
+User = get_user_model()
+
+
+class ReminderTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = User.objects.create_user(username="username", email="user@example.com")
+        cls.pet = Pet.objects.create(
+            name="Rex", breed="test", weight=10, height=20, birth_date=date(2020, 1, 1)
+        )
+        cls.low = Priority.objects.create(name="low", rank=1)
+        cls.high = Priority.objects.create(name="high", rank=2)
+
+    def day(self, offset):
+        return timezone.localdate() + timedelta(days=offset)
+
+    def create_event(self, title, offset, priority=None, user=None, status=None):
+        return HealthEvent.objects.create(
+            title=title,
+            scheduled_date=self.day(offset),
+            priority=priority,
+            user=user or self.user,
+            pet=self.pet,
+            status=status,
+        )
+
+    def subject(self, title, offset):
+        return f"Reminder: {title} on {self.day(offset):%b %d}"
+
+    def sent_subjects(self):
+        subjects = [message.subject for message in mail.outbox]
+        mail.outbox.clear()
+        return subjects
+
+    def test_sends_due_events_by_priority(self):
+        self.create_event("Checkup", -1)
+        self.create_event("Grooming", 0)
+        self.create_event("Deworming", 1, self.low)
+        self.create_event("Vaccination", 1, self.high)
+        self.create_event("Dental", 2)
+
+        self.assertEqual(send_reminders(lead_days=1), 3)
+        self.assertEqual(
+            self.sent_subjects(),
+            [self.subject("Vaccination", 1), self.subject("Deworming", 1), self.subject("Grooming", 0)],
+        )
+        self.assertEqual(ReminderMark.objects.get().due_through, self.day(1))
+
+    def test_runs_are_incremental(self):
+        self.create_event("Grooming", 0)
+        self.create_event("Dental", 2)
+        send_reminders(lead_days=1)
+        self.sent_subjects()
+
+        # The marks, one scan starting at them and the advanced marks.
+        with self.assertNumQueries(3):
+            self.assertEqual(send_reminders(lead_days=1), 0)
+
+        self.assertEqual(send_reminders(now=timezone.now() + timedelta(days=1), lead_days=1), 1)
+        self.assertEqual(self.sent_subjects(), [self.subject("Dental", 2)])
+
+    def test_events_added_inside_the_reminded_window(self):
+        send_reminders(lead_days=1)
+        self.create_event("Grooming", 1)
+        self.create_event("Checkup", -1)
+
+        self.assertEqual(send_reminders(lead_days=1), 1)
+        self.assertEqual(self.sent_subjects(), [self.subject("Grooming", 1)])
+
+    def test_edited_events_are_not_reminded_again(self):
+        event = self.create_event("Vaccination", 1)
+        send_reminders(lead_days=1)
+        self.sent_subjects()
+
+        def edit(**fields):
+            # As the update view does, on a freshly loaded event.
+            instance = HealthEvent.objects.get(pk=event.pk)
+            for name, value in fields.items():
+                setattr(instance, name, value)
+            instance.save()
+
+        completed = Status.objects.create(name="completed", is_terminal=True)
+        edit(title="Vax", status=completed)
+        self.assertEqual(send_reminders(lead_days=1), 0)
+        edit(status=None)
+        self.assertEqual(send_reminders(lead_days=1), 0)
+
+        edit(scheduled_date=self.day(0))
+        self.assertEqual(send_reminders(lead_days=1), 1)
+        self.assertEqual(self.sent_subjects(), [self.subject("Vax", 0)])
+
+    def test_finished_events_are_skipped(self):
+        self.create_event("Grooming", 0, status=Status.objects.create(name="done", is_terminal=True))
+        self.create_event("Dental", 0, status=Status.objects.create(name="open"))
+        self.assertEqual(send_reminders(lead_days=1), 1)
+        self.assertEqual(self.sent_subjects(), [self.subject("Dental", 0)])
+
+    def test_users_without_email_are_skipped(self):
+        self.create_event("Grooming", 0, user=User.objects.create_user(username="other"))
+        self.assertEqual(send_reminders(lead_days=1), 0)
+
+    def test_batches(self):
+        self.create_event("Grooming", 0)
+        self.create_event("Dental", 1)
+        self.assertEqual(send_reminders(lead_days=1, batch_size=1), 2)
+
+    def test_sent_batches_stay_reminded_when_a_later_batch_fails(self):
+        self.create_event("Vaccination", 1, self.high)
+        self.create_event("Grooming", 1, self.low)
+        send_messages = EmailBackend.send_messages
+
+        def fail_second_batch(backend, messages):
+            if mail.outbox:
+                raise SMTPException("connection lost")
+            return send_messages(backend, messages)
+
+        with mock.patch.object(EmailBackend, "send_messages", fail_second_batch):
+            with self.assertRaises(SMTPException):
+                send_reminders(lead_days=1, batch_size=1)
+        self.assertEqual(self.sent_subjects(), [self.subject("Vaccination", 1)])
+
+        self.assertEqual(send_reminders(lead_days=1, batch_size=1), 1)
+        self.assertEqual(self.sent_subjects(), [self.subject("Grooming", 1)])
+
+    def test_command(self):
+        event = self.create_event("Grooming", 0, self.high)
+        out = StringIO()
+        call_command("send_reminders", stdout=out)
+        self.assertIn("Sent 1 reminders.", out.getvalue())
+        self.assertIn(
+            f"Grooming for Rex is scheduled for {event.scheduled_date:%A, %B} {event.scheduled_date.day} (high priority).",
+            mail.outbox[0].body,
+        )
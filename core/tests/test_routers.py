@@ -0,0 +1,163 @@
+import sqlite3
+import tempfile
+from datetime import date
+from pathlib import Path
+from unittest import skipUnless
+
+from asgiref.sync import async_to_sync, sync_to_async
+from django.conf import settings
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.db import connections, transaction
+from django.test import TransactionTestCase
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+
+from core import stats
+from core.models import Pet
+from core.routers import STICKY_COOKIE, ReplicaRouter, ReplicaState, replica_state
+
+User = get_user_model()
+
+
+@skipUnless("replica" in settings.DATABASES, "No replica database is configured.")
+class ReplicaRouterTests(TransactionTestCase):
+    # The replica is a test mirror of the primary, committed rows are
+    # visible through both connections.
+    databases = {"default", "replica"}
+
+    def setUp(self):
+        self.user = User.objects.create_user(username="username", password="password")
+        self.pet = Pet.objects.create(
+            name="Rex", breed="test", weight=10, height=20, birth_date=date(2020, 1, 1)
+        )
+        self.client.force_login(self.user)
+        # Dashboard counts are read from the primary, on a cache miss.
+        stats.get_dashboard_stats()
+
+    def capture(self):
+        return CaptureQueriesContext(connections["default"]), CaptureQueriesContext(connections["replica"])
+
+    def assertReadsFrom(self, alias, method, url, **kwargs):
+        primary, replica = self.capture()
+        with primary, replica:
+            res = method(url, **kwargs)
+        captured = {"default": primary, "replica": replica}
+        self.assertTrue(captured[alias].captured_queries, f"{url} made no queries on {alias}")
+        other = "replica" if alias == "default" else "default"
+        # The session is always read from the primary.
+        self.assertFalse(
+            [query for query in captured[other].captured_queries if "django_session" not in query["sql"]]
+        )
+        return res
+
+    def test_list_detail_and_dashboard_read_from_the_replica(self):
+        for url in (
+            reverse("core:pet-list"),
+            reverse("core:pet-detail", args=[self.pet.pk]),
+            reverse("core:activity-list"),
+            reverse("core:index"),
+        ):
+            with self.subTest(url=url):
+                self.assertReadsFrom("replica", self.client.get, url)
+
+    async def test_list_reads_from_the_replica_under_asgi(self):
+        await self.async_client.aforce_login(self.user)
+        # Capture on the connections of the thread the async ORM queries in.
+        await sync_to_async(self.assertReadsFrom)(
+            "replica", async_to_sync(self.async_client.get), reverse("core:pet-list")
+        )
+
+    def test_other_views_read_from_the_primary(self):
+        self.assertReadsFrom("default", self.client.get, reverse("core:pet-update", args=[self.pet.pk]))
+
+    def test_reads_stick_to_the_primary_after_a_write(self):
+        url = reverse("core:species-create")
+        res = self.client.post(url, {"name": "Dog"})
+        self.assertEqual(res.status_code, 302)
+        self.assertEqual(res.cookies[STICKY_COOKIE]["max-age"], 10)
+
+        res = self.assertReadsFrom("default", self.client.get, reverse("core:species-list"))
+        self.assertContains(res, "Dog")
+        self.assertNotIn(STICKY_COOKIE, res.cookies)
+
+        del self.client.cookies[STICKY_COOKIE]
+        self.assertReadsFrom("replica", self.client.get, reverse("core:species-list"))
+
+    def test_reads_in_a_transaction_go_to_the_primary(self):
+        router = ReplicaRouter()
+        state = ReplicaState()
+        state.alias = "replica"
+        token = replica_state.set(state)
+        try:
+            self.assertEqual(router.db_for_read(Pet), "replica")
+            with transaction.atomic():
+                self.assertEqual(router.db_for_read(Pet), "default")
+            self.assertEqual(router.db_for_write(Pet), "default")
+            self.assertEqual(router.db_for_read(Pet), "default")
+        finally:
+            replica_state.reset(token)
+
+    def test_replica_is_not_migrated(self):
+        self.assertFalse(ReplicaRouter().allow_migrate("replica", "core"))
+        self.assertIsNone(ReplicaRouter().allow_migrate("default", "core"))
+
+
+@skipUnless("replica" in settings.DATABASES, "No replica database is configured.")
+@skipUnless(connections["default"].vendor == "sqlite", "The lagging replica is a copy of an SQLite primary.")
+class LaggingReplicaTests(TransactionTestCase):
+    """The replica is a copy of the primary that misses its latest writes."""
+
+    databases = {"default", "replica"}
+
+    def setUp(self):
+        cache.clear()
+        self.user = User.objects.create_user(username="username", password="password")
+        self.pet = Pet.objects.create(
+            name="Rex", breed="test", weight=10, height=20, birth_date=date(2020, 1, 1)
+        )
+        self.client.force_login(self.user)
+        self.copy_primary_to_replica()
+
+    def copy_primary_to_replica(self):
+        path = Path(tempfile.mkdtemp()) / "replica.sqlite3"
+        primary = connections["default"]
+        primary.ensure_connection()
+        with sqlite3.connect(path) as copy:
+            primary.connection.backup(copy)
+        copy.close()
+
+        # The mirror shares the primary's settings dict, point the replica
+        # at the copy with one of its own.
+        replica = connections["replica"]
+        settings_dict = replica.settings_dict
+        replica.close()
+        replica.settings_dict = {**settings_dict, "NAME": str(path)}
+
+        def restore():
+            replica.close()
+            replica.settings_dict = settings_dict
+            path.unlink()
+            path.parent.rmdir()
+
+        self.addCleanup(restore)
+
+    def test_rows_read_from_the_replica_are_not_cached(self):
+        pet = Pet.objects.get(pk=self.pet.pk)
+        pet.name = "Max"
+        pet.save()
+
+        res = self.client.get(reverse("core:pet-list"))
+        self.assertContains(res, "Rex")
+
+        # Once the browser reads from the primary, the row is current.
+        self.client.cookies[STICKY_COOKIE] = "1"
+        res = self.client.get(reverse("core:pet-list"))
+        self.assertContains(res, "Max")
+        self.assertNotContains(res, "Rex")
+
+    def test_dashboard_counts_come_from_the_primary(self):
+        Pet.objects.create(name="Fido", breed="test", weight=10, height=20, birth_date=date(2020, 1, 1))
+        res = self.client.get(reverse("core:index"))
+        self.assertEqual(res.context["num_pets"], 2)
+        self.assertEqual(cache.get(stats._cache_key("num_pets")), 2)
@@ -0,0 +1,67 @@
+from datetime import date
+from decimal import Decimal
+
+from django.test import TestCase, override_settings
+
+from core.models import Species, Pet
+from core.search import search, ContainsSearchBackend, FTS5SearchBackend
+
+
+class SearchTestMixin:
+    @classmethod
+    def setUpTestData(cls):
+        cls.species = Species.objects.create(name="test")
+        for name in ("Max", "Maximus", "Rex", "Bella", "Maxwell the Great"):
+            Pet.objects.create(
+                name=name,
+                species=cls.species,
+                breed="test",
+                weight=Decimal("10.3"),
+                height=Decimal("20.5"),
+                birth_date=date(2020, 1, 1),
+            )
+
+    def names(self, queryset):
+        return [pet.name for pet in queryset]
+
+
+class FTS5SearchBackendTests(SearchTestMixin, TestCase):
+    backend = FTS5SearchBackend()
+
+    def test_substring_match(self):
+        queryset = self.backend.search(Pet.objects.all(), "name", "axi")
+        self.assertEqual(self.names(queryset), ["Maximus"])
+
+    def test_match_is_case_insensitive(self):
+        queryset = self.backend.search(Pet.objects.all(), "name", "ELL", ranked=False)
+        self.assertCountEqual(self.names(queryset), ["Bella", "Maxwell the Great"])
+
+    def test_results_are_ranked(self):
+        queryset = self.backend.search(Pet.objects.all(), "name", "max")
+        self.assertEqual(self.names(queryset)[0], "Max")
+        self.assertCountEqual(self.names(queryset), ["Max", "Maximus", "Maxwell the Great"])
+
+    def test_short_term_falls_back_to_scan(self):
+        queryset = self.backend.search(Pet.objects.all(), "name", "ex")
+        self.assertEqual(self.names(queryset), ["Rex"])
+
+    def test_index_follows_updates_and_deletes(self):
+        pet = Pet.objects.get(name="Rex")
+        pet.name = "Rocky"
+        pet.save()
+        self.assertEqual(self.names(self.backend.search(Pet.objects.all(), "name", "rex")), [])
+        self.assertEqual(self.names(self.backend.search(Pet.objects.all(), "name", "ock")), ["Rocky"])
+
+        pet.delete()
+        self.assertEqual(self.names(self.backend.search(Pet.objects.all(), "name", "ock")), [])
+
+
+class ContainsSearchBackendTests(SearchTestMixin, TestCase):
+    def test_substring_match(self):
+        queryset = ContainsSearchBackend().search(Pet.objects.all(), "name", "axi")
+        self.assertEqual(self.names(queryset), ["Maximus"])
+
+    @override_settings(SEARCH_BACKEND="core.search.ContainsSearchBackend")
+    def test_backend_from_settings(self):
+        queryset = search(Pet.objects.all(), "name", "bel")
+        self.assertEqual(self.names(queryset), ["Bella"])
@@ -0,0 +1,90 @@
+import tempfile
+from datetime import date
+from decimal import Decimal
+
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.test import TestCase, override_settings
+from django.urls import reverse
+
+from core.models import Species, Pet
+from core.stats import get_dashboard_stats
+
+User = get_user_model()
+
+
+class DashboardStatsTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = User.objects.create_user(
+            username="username",
+            password="password",
+        )
+        cls.species = Species.objects.create(name="test")
+
+    def setUp(self):
+        cache.clear()
+
+    def create_pet(self, name):
+        return Pet.objects.create(
+            name=name,
+            species=self.species,
+            breed="test",
+            weight=Decimal("10.3"),
+            height=Decimal("20.5"),
+            birth_date=date(2020, 1, 1),
+        )
+
+    def test_counts_all_models_in_one_query(self):
+        with self.assertNumQueries(1):
+            stats = get_dashboard_stats()
+        self.assertEqual(
+            stats,
+            {
+                "num_users": 1,
+                "num_pets": 0,
+                "num_activities": 0,
+                "num_health_events": 0,
+            }
+        )
+
+    def test_cached_stats_do_not_query(self):
+        get_dashboard_stats()
+        with self.assertNumQueries(0):
+            get_dashboard_stats()
+
+    def test_create_updates_cached_count(self):
+        get_dashboard_stats()
+        with self.captureOnCommitCallbacks(execute=True):
+            self.create_pet("test")
+        with self.assertNumQueries(0):
+            self.assertEqual(get_dashboard_stats()["num_pets"], 1)
+
+    def test_delete_updates_cached_count(self):
+        pet = self.create_pet("test")
+        get_dashboard_stats()
+        with self.captureOnCommitCallbacks(execute=True):
+            pet.delete()
+        self.assertEqual(get_dashboard_stats()["num_pets"], 0)
+
+    def test_index_uses_stats(self):
+        self.client.force_login(self.user)
+        res = self.client.get(reverse("core:index"))
+        self.assertEqual(res.context["num_users"], 1)
+        self.assertEqual(res.context["num_pets"], 0)
+
+    def test_caches_without_atomic_increments_recount(self):
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        file_cache = {
+            "default": {
+                "BACKEND": "django.core.cache.backends.filebased.FileBasedCache",
+                "LOCATION": directory.name,
+            }
+        }
+        with override_settings(CACHES=file_cache):
+            get_dashboard_stats()
+            with self.captureOnCommitCallbacks(execute=True):
+                self.create_pet("test")
+            with self.assertNumQueries(1):
+                self.assertEqual(get_dashboard_stats()["num_pets"], 1)
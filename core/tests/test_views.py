@@ -1,7 +1,9 @@
-from datetime import date
+from datetime import date, timedelta
 from decimal import Decimal
 
+from django.db import connection
 from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
 from django.contrib.auth import get_user_model
 from django.urls import reverse
 
@@ -11,6 +13,7 @@ from core.models import (
     Priority,
     Status,
     Activity,
+    ActivityRule,
     HealthEvent
 )
 
@@ -180,6 +183,66 @@ class PetViewsTests(TestCase):
             self.pets,
         )
 
+    def test_detail_view_viewer_ownership(self):
+        url = reverse("core:pet-detail", kwargs={"pk": self.pets[0].pk})
+        with CaptureQueriesContext(connection) as queries:
+            res = self.client.get(url)
+        self.assertFalse(res.context["pet"].viewer_is_owner)
+        self.assertContains(res, "Assign me to this pet")
+
+        User.objects.get(username=USERNAME).pets.add(*self.pets)
+        with self.assertNumQueries(len(queries)):
+            res = self.client.get(url)
+        self.assertTrue(res.context["pet"].viewer_is_owner)
+        self.assertContains(res, "Delete me from this pet")
+
+    def test_detail_view_owners_and_recurring_activities(self):
+        pet = self.pets[0]
+        owner = User.objects.get(username=USERNAME)
+        owner.first_name = "Alice"
+        owner.save()
+        pet.owners.add(owner)
+        status = Status.objects.create(name="planned")
+        for title, rule_status in (("Walk", status), ("Brush", None)):
+            ActivityRule.objects.create(
+                title=title, frequency=ActivityRule.Frequency.WEEKLY, start_date=date.today(),
+                user=owner, pet=pet, status=rule_status,
+            )
+
+        res = self.client.get(reverse("core:pet-detail", kwargs={"pk": pet.pk}))
+        self.assertEqual(res.context["pet"].owner_list, [owner])
+        self.assertContains(res, "Alice")
+        occurrences = res.context["upcoming_occurrences"]
+        self.assertEqual(
+            [(occurrence.title, occurrence.date) for occurrence in occurrences if occurrence.title == "Walk"],
+            [("Walk", date.today()), ("Walk", date.today() + timedelta(days=7))],
+        )
+        self.assertEqual(
+            {occurrence.title: occurrence.status for occurrence in occurrences},
+            {"Walk": status, "Brush": None},
+        )
+        self.assertContains(res, "planned")
+        self.assertContains(res, "No status")
+
+    def test_toggle_owner(self):
+        url = reverse("core:toggle-pet-assign", kwargs={"pk": self.pets[0].pk})
+        res = self.client.post(url)
+        self.assertRedirects(res, reverse("core:pet-detail", kwargs={"pk": self.pets[0].pk}))
+        self.assertTrue(self.pets[0].owners.filter(username=USERNAME).exists())
+
+        res = self.client.post(url, headers={"accept": "application/json"})
+        self.assertEqual(res.json(), {"owner": False, "owner_count": 0})
+        self.assertFalse(self.pets[0].owners.exists())
+
+    def test_toggle_owner_requires_post(self):
+        url = reverse("core:toggle-pet-assign", kwargs={"pk": self.pets[0].pk})
+        self.assertEqual(self.client.get(url).status_code, 405)
+        self.assertFalse(self.pets[0].owners.exists())
+
+    def test_toggle_owner_of_missing_pet(self):
+        res = self.client.post(reverse("core:toggle-pet-assign", kwargs={"pk": 999}))
+        self.assertEqual(res.status_code, 404)
+
     def test_search_by_name(self):
         res = self.client.get(
             reverse("core:pet-list"),
@@ -569,3 +632,69 @@ class StatusViewsTests(TestCase):
     def test_search_form_in_context(self):
         res = self.client.get(reverse("core:status-list"))
         self.assertIn("search_form", res.context)
+
+
+class AutocompleteViewsTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        species = Species.objects.create(
+            name="test"
+        )
+        for i in range(25):
+            Pet.objects.create(
+                name=f"rex{i:02}",
+                species=species,
+                breed="test",
+                weight=Decimal("10.3"),
+                height=Decimal("20.5"),
+                birth_date=date(2020, 1, 1),
+            )
+        Pet.objects.create(
+            name="bella",
+            species=species,
+            breed="test",
+            weight=Decimal("10.3"),
+            height=Decimal("20.5"),
+            birth_date=date(2020, 1, 1),
+        )
+        Status.objects.create(name="pending")
+        Priority.objects.create(name="high")
+
+    def setUp(self):
+        User.objects.create_user(
+            username=USERNAME,
+            password=PASSWORD,
+        )
+        self.client.login(
+            username=USERNAME,
+            password=PASSWORD,
+        )
+
+    def test_pets_prefix_search(self):
+        res = self.client.get(reverse("core:pet-autocomplete"), {"q": "BEL"})
+        self.assertEqual(
+            [item["text"] for item in res.json()["results"]],
+            ["bella (species: test)"]
+        )
+
+    def test_pets_are_paginated(self):
+        res = self.client.get(reverse("core:pet-autocomplete"), {"q": "rex"})
+        self.assertEqual(len(res.json()["results"]), 20)
+        self.assertTrue(res.json()["more"])
+
+        res = self.client.get(reverse("core:pet-autocomplete"), {"q": "rex", "page": 2})
+        self.assertEqual(len(res.json()["results"]), 5)
+        self.assertFalse(res.json()["more"])
+
+    def test_users_statuses_priorities(self):
+        res = self.client.get(reverse("core:user-autocomplete"), {"q": "user"})
+        self.assertEqual(res.json()["results"][0]["text"], USERNAME)
+        res = self.client.get(reverse("core:status-autocomplete"))
+        self.assertEqual(res.json()["results"][0]["text"], "pending")
+        res = self.client.get(reverse("core:priority-autocomplete"), {"q": "h"})
+        self.assertEqual(res.json()["results"][0]["text"], "high")
+
+    def test_list_page_does_not_render_every_pet(self):
+        res = self.client.get(reverse("core:activity-list"))
+        self.assertNotContains(res, "rex00")
+        self.assertContains(res, reverse("core:pet-autocomplete"))
@@ -0,0 +1,26 @@
+from django.template import engines
+from django.test import SimpleTestCase
+from django.urls import get_resolver
+
+from core.warmup import template_names, warm_templates, warm_urls
+
+
+class WarmUpTests(SimpleTestCase):
+    def cached_loader(self):
+        return engines["django"].engine.template_loaders[0]
+
+    def test_templates_are_compiled_into_cache(self):
+        loader = self.cached_loader()
+        loader.reset()
+        warm_templates()
+        cached = set(loader.get_template_cache)
+        names = {name for engine, name in template_names()}
+        self.assertIn("core/pet_list.html", names)
+        self.assertIn("registration/login.html", names)
+        self.assertIn("base.html", names)
+        self.assertLessEqual(names, cached)
+
+    def test_url_reverse_tables_are_built(self):
+        self.assertGreater(warm_urls(), 0)
+        prefix, resolver = get_resolver().namespace_dict["core"]
+        self.assertTrue(resolver._populated)
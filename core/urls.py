@@ -1,5 +1,13 @@
 from django.urls import path
 
+from .api import (
+    PetBulkApiView,
+    PetDetailApiView,
+    ActivityBulkApiView,
+    ActivityDetailApiView,
+    HealthEventBulkApiView,
+    HealthEventDetailApiView,
+)
 from .views import (
     index,
     UserListView,
@@ -19,7 +27,10 @@ from .views import (
     toggle_assign_to_pet, ActivityDetailView, ActivityUpdateView, ActivityDeleteView, HealthEventDetailView,
     HealthEventUpdateView, HealthEventDeleteView, StatusListView, StatusCreateView, StatusUpdateView, StatusDeleteView,
     PriorityListView, PriorityCreateView, PriorityUpdateView, PriorityDeleteView, SpeciesListView, SpeciesCreateView,
-    SpeciesUpdateView, SpeciesDeleteView, SignUpView
+    SpeciesUpdateView, SpeciesDeleteView, SignUpView, PetAutocompleteView, UserAutocompleteView,
+    StatusAutocompleteView, PriorityAutocompleteView, ActivityExportView, HealthEventExportView,
+    ActivityRuleListView, ActivityRuleCreateView, ActivityRuleUpdateView, ActivityRuleDeleteView,
+    materialize_occurrence, CalendarView, calendar_feed
 )
 
 urlpatterns = [
@@ -42,14 +53,27 @@ urlpatterns = [
     ),
     path("activities/", ActivityListView.as_view(), name="activity-list"),
     path("activities/create/", ActivityCreateView.as_view(), name="activity-create"),
+    path("activities/export/", ActivityExportView.as_view(), name="activity-export"),
     path("activities/<int:pk>/", ActivityDetailView.as_view(), name="activity-detail"),
     path("activities/<int:pk>/update", ActivityUpdateView.as_view(), name="activity-update"),
     path("activities/<int:pk>/delete", ActivityDeleteView.as_view(), name="activity-delete"),
+    path("rules/", ActivityRuleListView.as_view(), name="activityrule-list"),
+    path("rules/create/", ActivityRuleCreateView.as_view(), name="activityrule-create"),
+    path("rules/<int:pk>/update", ActivityRuleUpdateView.as_view(), name="activityrule-update"),
+    path("rules/<int:pk>/delete", ActivityRuleDeleteView.as_view(), name="activityrule-delete"),
+    path(
+        "rules/<int:pk>/occurrences/<str:day>/",
+        materialize_occurrence,
+        name="activityrule-materialize",
+    ),
     path("healthevents/", HealthEventListView.as_view(), name="healthevent-list"),
     path("healthevents/create/", HealthEventCreateView.as_view(), name="healthevent-create"),
+    path("healthevents/export/", HealthEventExportView.as_view(), name="healthevent-export"),
     path("healthevents/<int:pk>/", HealthEventDetailView.as_view(), name="healthevent-detail"),
     path("healthevents/<int:pk>/update", HealthEventUpdateView.as_view(), name="healthevent-update"),
     path("healthevents/<int:pk>/delete", HealthEventDeleteView.as_view(), name="healthevent-delete"),
+    path("calendar/", CalendarView.as_view(), name="calendar"),
+    path("calendar/feed/<str:token>.ics", calendar_feed, name="calendar-feed"),
     path("statuses/", StatusListView.as_view(), name="status-list"),
     path("statuses/create/", StatusCreateView.as_view(), name="status-create"),
     path("statuses/<int:pk>/update", StatusUpdateView.as_view(), name="status-update"),
@@ -62,6 +86,16 @@ urlpatterns = [
     path("species/create/", SpeciesCreateView.as_view(), name="species-create"),
     path("species/<int:pk>/update", SpeciesUpdateView.as_view(), name="species-update"),
     path("species/<int:pk>/delete", SpeciesDeleteView.as_view(), name="species-delete"),
+    path("autocomplete/pets/", PetAutocompleteView.as_view(), name="pet-autocomplete"),
+    path("autocomplete/users/", UserAutocompleteView.as_view(), name="user-autocomplete"),
+    path("autocomplete/statuses/", StatusAutocompleteView.as_view(), name="status-autocomplete"),
+    path("autocomplete/priorities/", PriorityAutocompleteView.as_view(), name="priority-autocomplete"),
+    path("api/v1/pets/", PetBulkApiView.as_view(), name="api-pet-list"),
+    path("api/v1/pets/<int:pk>/", PetDetailApiView.as_view(), name="api-pet-detail"),
+    path("api/v1/activities/", ActivityBulkApiView.as_view(), name="api-activity-list"),
+    path("api/v1/activities/<int:pk>/", ActivityDetailApiView.as_view(), name="api-activity-detail"),
+    path("api/v1/healthevents/", HealthEventBulkApiView.as_view(), name="api-healthevent-list"),
+    path("api/v1/healthevents/<int:pk>/", HealthEventDetailApiView.as_view(), name="api-healthevent-detail"),
 ]
 
 app_name = "core"
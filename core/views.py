@@ -1,20 +1,32 @@
+from datetime import date, datetime, time, timedelta
+
+from asgiref.sync import sync_to_async
+
 from django.contrib.auth.decorators import login_required
 from django.contrib.auth.mixins import LoginRequiredMixin
-from django.http import HttpRequest, HttpResponse, HttpResponseRedirect, Http404
-from django.shortcuts import render
+from django.http import HttpRequest, HttpResponse, HttpResponseRedirect, Http404, JsonResponse, StreamingHttpResponse
+from django.db import IntegrityError, transaction
+from django.db.models import Exists, OuterRef, Prefetch, prefetch_related_objects
+from django.db.models.signals import m2m_changed
+from django.shortcuts import get_object_or_404
+from django.template.response import TemplateResponse
 from django.contrib.auth import get_user_model
 from django.urls import reverse_lazy
-from django.views.generic import ListView, DetailView, CreateView, UpdateView, DeleteView
+from django.utils import timezone
+from django.views.decorators.http import condition, require_POST
+from django.views.generic import View, TemplateView, ListView, DetailView, CreateView, UpdateView, DeleteView
 
 from core.forms import (
     UserForm,
     PetForm,
     ActivityForm,
+    ActivityRuleForm,
     HealthEventForm,
     UserUpdateForm,
     UserSearchForm,
     PetSearchForm,
     ActivitySearchForm,
+    ActivityRuleSearchForm,
     HealthEventSearchForm,
     SpeciesSearchForm,
     StatusSearchForm,
@@ -24,35 +36,49 @@ from core.forms import (
 from core.models import (
     Pet,
     Activity,
+    ActivityRule,
+    ArchivedActivity,
     HealthEvent,
+    ArchivedHealthEvent,
     Status,
     Priority,
     Species
 )
+from core import counters
+from core.aggregates import from_json, json_rows
+from core.archive import IncludeArchivedMixin
+from core.asyncviews import AsyncLoginRequiredMixin, AsyncListMixin
+from core.conditional import ConditionalDetailMixin
+from core.exports import ExportMixin
+from core.feeds import feed_token, feed_user_id, feed_etag, feed_last_modified, get_watermark, stream_feed
+from core.fragments import RowFragmentMixin
+from core.pagination import CursorPaginationMixin
+from core.recurrence import expand, is_occurrence, materialize
+from core.routers import replica_reads
+from core.schedule import get_weeks, month_weeks, week_days
+from core.search import search
+from core.stats import aget_dashboard_stats
 
 User = get_user_model()
 
 
+@replica_reads
 @login_required
-def index(request: HttpRequest) -> HttpResponse:
-    num_users = User.objects.count()
-    num_pets = Pet.objects.count()
-    num_activities = Activity.objects.count()
-    num_health_events = HealthEvent.objects.count()
-
+async def index(request: HttpRequest) -> HttpResponse:
+    # login_required loaded the user asynchronously, keep templates from
+    # loading it again.
+    request.user = await request.auser()
     context = {
-        "num_users": num_users,
-        "num_pets": num_pets,
-        "num_activities": num_activities,
-        "num_health_events": num_health_events,
+        **await aget_dashboard_stats(),
         "segment": "home"
     }
 
-    return render(request, 'core/index.html', context)
+    return TemplateResponse(request, 'core/index.html', context)
 
 
-class UserListView(LoginRequiredMixin, ListView):
+class UserListView(AsyncLoginRequiredMixin, RowFragmentMixin, AsyncListMixin, ListView):
     model = User
+    row_fragment = "user_row"
     paginate_by = 5
     def get_context_data(
         self, *, object_list = ..., **kwargs
@@ -66,22 +92,23 @@ class UserListView(LoginRequiredMixin, ListView):
         return context
 
     def get_queryset(self):
-        queryset = User.objects.all().prefetch_related("pets")
+        queryset = User.objects.all()
         form = UserSearchForm(self.request.GET)
-        if form.is_valid():
-            return queryset.filter(
-                username__icontains=form.cleaned_data["username"]
-            )
+        if form.is_valid() and form.cleaned_data["username"]:
+            return search(queryset, "username", form.cleaned_data["username"])
         return queryset
 
 
-class UserDetailView(LoginRequiredMixin, DetailView):
+class UserDetailView(LoginRequiredMixin, ConditionalDetailMixin, DetailView):
     model=User
+    version_lookups = ("updated_at", "last_login", "pets__updated_at", "pets__species__updated_at")
     def get_object(self, queryset=None):
+        pets = Prefetch("pets", queryset=Pet.objects.select_related("species"))
         if self.request.user.id == self.kwargs.get("pk"):
+            prefetch_related_objects([self.request.user], pets)
             return self.request.user
         try:
-            return User.objects.prefetch_related("pets").get(pk=self.kwargs["pk"])
+            return User.objects.prefetch_related(pets).get(pk=self.kwargs["pk"])
         except User.DoesNotExist:
             raise Http404("User not found")
 
@@ -108,9 +135,17 @@ class UserDeleteView(LoginRequiredMixin, DeleteView):
     model = User
     success_url = reverse_lazy("core:user-list")
 
+    # The cascade adjusts the same counters once per deleted row otherwise.
+    @transaction.atomic
+    @counters.deferred()
+    def form_valid(self, form):
+        return super().form_valid(form)
 
-class PetListView(LoginRequiredMixin, ListView):
+
+class PetListView(AsyncLoginRequiredMixin, RowFragmentMixin, AsyncListMixin, ListView):
     model = Pet
+    row_fragment = "pet_row"
+    row_fragment_dependencies = ("species",)
     paginate_by = 5
     def get_context_data(
             self, *, object_list=..., **kwargs
@@ -124,22 +159,94 @@ class PetListView(LoginRequiredMixin, ListView):
         return context
 
     def get_queryset(self):
-        queryset = Pet.objects.all().prefetch_related("owners").select_related("species")
+        queryset = Pet.objects.all().select_related("species")
         form = PetSearchForm(self.request.GET)
-        if form.is_valid():
-            return queryset.filter(
-                name__icontains=form.cleaned_data["name"]
-            )
+        if form.is_valid() and form.cleaned_data["name"]:
+            return search(queryset, "name", form.cleaned_data["name"])
         return queryset
 
 
-class PetDetailView(LoginRequiredMixin, DetailView):
+class PetDetailView(LoginRequiredMixin, ConditionalDetailMixin, DetailView):
     model = Pet
+    upcoming_days = 14
+    version_lookups = (
+        "updated_at",
+        "species__updated_at",
+        "owners__updated_at",
+        "activity_rules__status__updated_at",
+    )
     def get_object(self, queryset=None):
+        if getattr(self, "object", None) is not None:
+            return self.object
+        # Whether the viewer owns the pet is answered by the pet query
+        # rather than by loading every pet of the viewer, and the owners,
+        # the recurring activities and the validators come with it as well.
+        viewer_is_owner = Exists(
+            Pet.owners.through.objects.filter(pet=OuterRef("pk"), user=self.request.user.pk)
+        )
+        owners = json_rows(
+            Pet.owners.through.objects.filter(pet=OuterRef("pk")),
+            "pet",
+            id="user_id",
+            username="user__username",
+            first_name="user__first_name",
+            last_name="user__last_name",
+        )
+        rules = json_rows(
+            ActivityRule.objects.filter(pet=OuterRef("pk")),
+            "pet",
+            id="id",
+            title="title",
+            frequency="frequency",
+            interval="interval",
+            start_date="start_date",
+            end_date="end_date",
+            status_id="status_id",
+            status_name="status__name",
+        )
         try:
-            return Pet.objects.prefetch_related("owners").select_related("species").get(pk=self.kwargs["pk"])
+            pet = (
+                Pet.objects.select_related("species")
+                .annotate(
+                    viewer_is_owner=viewer_is_owner,
+                    owner_rows=owners,
+                    rule_rows=rules,
+                    **self.version_annotations(),
+                )
+                .get(pk=self.kwargs["pk"])
+            )
         except Pet.DoesNotExist:
             raise Http404("Pet not found")
+        using = pet._state.db
+        pet.owner_list = sorted(
+            (from_json(User, row, using) for row in pet.owner_rows or []), key=lambda owner: owner.pk
+        )
+        pet.rule_list = []
+        for row in pet.rule_rows or []:
+            status_name = row.pop("status_name")
+            rule = from_json(ActivityRule, row, using)
+            if rule.status_id is not None:
+                rule.status = from_json(Status, {"id": rule.status_id, "name": status_name}, using)
+            pet.rule_list.append(rule)
+        return pet
+
+    def get_versions(self):
+        # The pet query answers conditional GETs as well.
+        self.object = self.get_object()
+        versions = [getattr(self.object, name) for name in self.version_annotations()]
+        # Upcoming occurrences move on with the date.
+        today = timezone.make_aware(datetime.combine(date.today(), time()))
+        return versions + [today]
+
+    def get_context_data(self, **kwargs):
+        context = super().get_context_data(**kwargs)
+        today = date.today()
+        context["upcoming_occurrences"] = expand(
+            self.object.rule_list,
+            today,
+            today + timedelta(days=self.upcoming_days - 1),
+        )
+        return context
 
 
 class PetCreateView(LoginRequiredMixin, CreateView):
@@ -158,22 +265,69 @@ class PetDeleteView(LoginRequiredMixin, DeleteView):
     model = Pet
     success_url = reverse_lazy("core:pet-list")
 
+    # The cascade adjusts the same counters once per deleted row otherwise.
+    @transaction.atomic
+    @counters.deferred()
+    def form_valid(self, form):
+        return super().form_valid(form)
+
 
 @login_required
+@require_POST
 def toggle_assign_to_pet(request, pk):
-    user = User.objects.get(id=request.user.id)
-    if (
-        Pet.objects.get(id=pk) in user.pets.all()
-    ):
-        user.pets.remove(pk)
-    else:
-        user.pets.add(pk)
+    """
+    Add the viewer to the owners of a pet, or remove them if they already
+    are one, with one conditional statement on the ownership table. Answers
+    JSON to scripts and redirects to the pet page otherwise.
+    """
+    ownerships = Pet.owners.through.objects.filter(pet_id=pk, user_id=request.user.pk)
+    with transaction.atomic():
+        deleted, _ = ownerships.delete()
+        if deleted:
+            action = "post_remove"
+        elif Pet.objects.filter(pk=pk).exists():
+            # Ignoring conflicts keeps concurrent clicks from failing.
+            Pet.owners.through.objects.bulk_create(
+                [Pet.owners.through(pet_id=pk, user_id=request.user.pk)],
+                ignore_conflicts=True,
+            )
+            action = "post_add"
+        else:
+            raise Http404("Pet not found")
+        # The through table is written directly, so tell the receivers that
+        # keep counters and caches up to date what changed.
+        m2m_changed.send(
+            sender=Pet.owners.through,
+            instance=Pet(pk=pk),
+            action=action,
+            reverse=False,
+            model=User,
+            pk_set={request.user.pk},
+            using=ownerships.db,
+        )
+
+    if request.get_preferred_type(["text/html", "application/json"]) == "application/json":
+        return JsonResponse({
+            "owner": action == "post_add",
+            "owner_count": Pet.objects.filter(pk=pk).values_list("owner_count", flat=True).get(),
+        })
     return HttpResponseRedirect(reverse_lazy("core:pet-detail", args=[pk]))
 
 
-class ActivityListView(LoginRequiredMixin, ListView):
+class ActivityListView(
+    AsyncLoginRequiredMixin,
+    IncludeArchivedMixin,
+    CursorPaginationMixin,
+    RowFragmentMixin,
+    AsyncListMixin,
+    ListView,
+):
     model = Activity
+    row_fragment = "activity_row"
+    row_fragment_dependencies = ("user", "pet", "status")
     queryset = Activity.objects.all().select_related("user", "status", "pet")
+    archive_queryset = ArchivedActivity.objects.select_related("user", "status", "pet")
+    search_form_class = ActivitySearchForm
     paginate_by = 2
     def get_context_data(
             self, *, object_list=..., **kwargs
@@ -183,47 +337,67 @@ class ActivityListView(LoginRequiredMixin, ListView):
         status = self.request.GET.get("status", "")
         pets = self.request.GET.get("pets", "")
         users = self.request.GET.get("users", "")
+        include_archived = self.request.GET.get("include_archived", "")
         context["search_form"] = ActivitySearchForm(
             initial={
                 "title": title,
                 "status": status,
                 "pets": pets,
-                "users": users
+                "users": users,
+                "include_archived": include_archived,
             }
         )
         context["segment"] = "activities"
         return context
 
+    async def aget_queryset(self):
+        # Validating the filters looks up the chosen objects.
+        return await sync_to_async(self.get_queryset)()
+
     def get_queryset(self):
-        queryset = Activity.objects.select_related("user", "status", "pet")
+        return self.filter_queryset(Activity.objects.select_related("user", "status", "pet"))
 
-        form = ActivitySearchForm(self.request.GET)
-        if form.is_valid():
-            if form.cleaned_data["title"]:
-                queryset = queryset.filter(
-                    title__icontains=form.cleaned_data["title"]
-                )
+    def filter_queryset(self, queryset):
+        filters = self.search_data
+        if filters.get("title"):
+            queryset = search(
+                queryset, "title", filters["title"], ranked=False
+            )
 
-            if form.cleaned_data["status"]:
-                queryset = queryset.filter(
-                    status=form.cleaned_data["status"]
-                )
+        if filters.get("status"):
+            queryset = queryset.filter(
+                status=filters["status"]
+            )
 
-            if form.cleaned_data["pets"]:
-                queryset = queryset.filter(
-                    pet=form.cleaned_data["pets"]
-                )
+        if filters.get("pets"):
+            queryset = queryset.filter(
+                pet=filters["pets"]
+            )
 
-            if form.cleaned_data["users"]:
-                queryset = queryset.filter(
-                    user=form.cleaned_data["users"]
-                )
+        if filters.get("users"):
+            queryset = queryset.filter(
+                user=filters["users"]
+            )
 
         return queryset
 
 
-class ActivityDetailView(LoginRequiredMixin, DetailView):
+class ActivityExportView(ExportMixin, ActivityListView):
+    export_filename = "activities"
+    export_fields = (
+        ("id", "id"),
+        ("title", "title"),
+        ("description", "description"),
+        ("scheduled_date", "scheduled_date"),
+        ("status", "status__name"),
+        ("user", "user__username"),
+        ("pet", "pet__name"),
+    )
+
+
+class ActivityDetailView(LoginRequiredMixin, ConditionalDetailMixin, DetailView):
     model = Activity
+    version_lookups = ("updated_at", "user__updated_at", "pet__updated_at", "status__updated_at")
     def get_object(self, queryset=None):
         try:
             return Activity.objects.select_related("user", "status", "pet").get(pk=self.kwargs["pk"])
@@ -248,9 +422,76 @@ class ActivityDeleteView(LoginRequiredMixin, DeleteView):
     success_url = reverse_lazy("core:activity-list")
 
 
-class HealthEventListView(LoginRequiredMixin, ListView):
+class ActivityRuleListView(AsyncLoginRequiredMixin, AsyncListMixin, ListView):
+    model = ActivityRule
+    paginate_by = 5
+    def get_context_data(
+            self, *, object_list=..., **kwargs
+    ):
+        context = super().get_context_data(**kwargs)
+        title = self.request.GET.get("title", "")
+        context["search_form"] = ActivityRuleSearchForm(
+            initial={"title": title}
+        )
+        context["segment"] = "activity_rules"
+        return context
+
+    def get_queryset(self):
+        queryset = ActivityRule.objects.select_related("user", "pet", "status").order_by("title", "pk")
+        form = ActivityRuleSearchForm(self.request.GET)
+        if form.is_valid() and form.cleaned_data["title"]:
+            return search(queryset, "title", form.cleaned_data["title"], ranked=False)
+        return queryset
+
+
+class ActivityRuleCreateView(LoginRequiredMixin, CreateView):
+    model = ActivityRule
+    form_class = ActivityRuleForm
+    success_url = reverse_lazy("core:activityrule-list")
+
+
+class ActivityRuleUpdateView(LoginRequiredMixin, UpdateView):
+    model = ActivityRule
+    form_class = ActivityRuleForm
+    success_url = reverse_lazy("core:activityrule-list")
+
+
+class ActivityRuleDeleteView(LoginRequiredMixin, DeleteView):
+    model = ActivityRule
+    success_url = reverse_lazy("core:activityrule-list")
+
+
+@login_required
+@require_POST
+def materialize_occurrence(request, pk, day):
+    rule = get_object_or_404(ActivityRule, pk=pk)
+    try:
+        day = date.fromisoformat(day)
+    except ValueError:
+        raise Http404("Invalid date")
+    if not is_occurrence(rule, day):
+        raise Http404("Not an occurrence of this rule")
+    try:
+        activity = materialize(rule, day)
+    except IntegrityError:
+        return HttpResponse("Another activity already has this occurrence's title.", status=409)
+    return HttpResponseRedirect(reverse_lazy("core:activity-update", args=[activity.pk]))
+
+
+class HealthEventListView(
+    AsyncLoginRequiredMixin,
+    IncludeArchivedMixin,
+    CursorPaginationMixin,
+    RowFragmentMixin,
+    AsyncListMixin,
+    ListView,
+):
     model = HealthEvent
+    row_fragment = "healthevent_row"
+    row_fragment_dependencies = ("user", "pet", "status", "priority")
     queryset = HealthEvent.objects.all().select_related("priority", "status", "user", "pet")
+    archive_queryset = ArchivedHealthEvent.objects.select_related("priority", "status", "user", "pet")
+    search_form_class = HealthEventSearchForm
     paginate_by = 2
     def get_context_data(
             self, *, object_list=..., **kwargs
@@ -261,52 +502,81 @@ class HealthEventListView(LoginRequiredMixin, ListView):
         priority = self.request.GET.get("priority", "")
         pets = self.request.GET.get("pets", "")
         users = self.request.GET.get("users", "")
+        include_archived = self.request.GET.get("include_archived", "")
         context["search_form"] = HealthEventSearchForm(
             initial={
                 "title": title,
                 "status": status,
                 "priority": priority,
                 "pets": pets,
-                "users": users
+                "users": users,
+                "include_archived": include_archived,
             }
         )
         context["segment"] = "health_events"
         return context
 
+    async def aget_queryset(self):
+        # Validating the filters looks up the chosen objects.
+        return await sync_to_async(self.get_queryset)()
+
     def get_queryset(self):
-        queryset = HealthEvent.objects.select_related("priority", "status", "user", "pet")
+        return self.filter_queryset(
+            HealthEvent.objects.select_related("priority", "status", "user", "pet")
+        )
 
-        form = HealthEventSearchForm(self.request.GET)
-        if form.is_valid():
-            if form.cleaned_data["title"]:
-                queryset = queryset.filter(
-                    title__icontains=form.cleaned_data["title"]
-                )
+    def filter_queryset(self, queryset):
+        filters = self.search_data
+        if filters.get("title"):
+            queryset = search(
+                queryset, "title", filters["title"], ranked=False
+            )
 
-            if form.cleaned_data["status"]:
-                queryset = queryset.filter(
-                    status=form.cleaned_data["status"]
-                )
+        if filters.get("status"):
+            queryset = queryset.filter(
+                status=filters["status"]
+            )
 
-            if form.cleaned_data["priority"]:
-                queryset = queryset.filter(
-                    priority=form.cleaned_data["priority"]
-                )
+        if filters.get("priority"):
+            queryset = queryset.filter(
+                priority=filters["priority"]
+            )
 
-            if form.cleaned_data["pets"]:
-                queryset = queryset.filter(
-                    pet=form.cleaned_data["pets"]
-                )
+        if filters.get("pets"):
+            queryset = queryset.filter(
+                pet=filters["pets"]
+            )
 
-            if form.cleaned_data["users"]:
-                queryset = queryset.filter(
-                    user=form.cleaned_data["users"]
-                )
+        if filters.get("users"):
+            queryset = queryset.filter(
+                user=filters["users"]
+            )
 
         return queryset
 
-class HealthEventDetailView(LoginRequiredMixin, DetailView):
+class HealthEventExportView(ExportMixin, HealthEventListView):
+    export_filename = "health-events"
+    export_fields = (
+        ("id", "id"),
+        ("title", "title"),
+        ("description", "description"),
+        ("scheduled_date", "scheduled_date"),
+        ("priority", "priority__name"),
+        ("status", "status__name"),
+        ("user", "user__username"),
+        ("pet", "pet__name"),
+    )
+
+
+class HealthEventDetailView(LoginRequiredMixin, ConditionalDetailMixin, DetailView):
     model = HealthEvent
+    version_lookups = (
+        "updated_at",
+        "user__updated_at",
+        "pet__updated_at",
+        "status__updated_at",
+        "priority__updated_at",
+    )
     def get_object(self, queryset=None):
         try:
             return HealthEvent.objects.select_related("priority", "status", "user", "pet").get(pk=self.kwargs["pk"])
@@ -330,7 +600,114 @@ class HealthEventDeleteView(LoginRequiredMixin, DeleteView):
     success_url = reverse_lazy("core:healthevent-list")
 
 
-class StatusListView(LoginRequiredMixin, ListView):
+class CalendarView(LoginRequiredMixin, TemplateView):
+    """
+    Activities, health events and recurring activities of a month or week,
+    filtered like the activity list and fetched in one query per period.
+    """
+
+    template_name = "core/calendar.html"
+    periods = ("month", "week")
+    summaries_per_day = 3
+
+    def get_day(self):
+        try:
+            return date.fromisoformat(self.request.GET.get("date", ""))
+        except ValueError:
+            return date.today()
+
+    # The activity list filters the calendar applies, the others would only
+    # split its cache.
+    filter_fields = ("title", "status", "pets", "users")
+
+    def get_filters(self):
+        form = ActivitySearchForm(self.request.GET)
+        if not form.is_valid():
+            return {}
+        values = {name: form.cleaned_data.get(name) for name in self.filter_fields}
+        return {name: getattr(value, "pk", value) for name, value in values.items() if value}
+
+    def filter(self, queryset, filters, title_field="title"):
+        if "title" in filters:
+            queryset = search(queryset, title_field, filters["title"], ranked=False)
+        if "status" in filters:
+            queryset = queryset.filter(status=filters["status"])
+        if "pets" in filters:
+            queryset = queryset.filter(pet=filters["pets"])
+        if "users" in filters:
+            queryset = queryset.filter(user=filters["users"])
+        return queryset
+
+    def get_context_data(self, **kwargs):
+        context = super().get_context_data(**kwargs)
+        period = self.request.GET.get("period")
+        if period not in self.periods:
+            period = "month"
+        day = self.get_day()
+        filters = self.get_filters()
+
+        if period == "month":
+            weeks = month_weeks(day)
+            first = day.replace(day=1)
+            previous_day = (first - timedelta(days=1)).replace(day=1)
+            next_day = (first + timedelta(days=31)).replace(day=1)
+        else:
+            weeks = week_days(day)
+            previous_day = day - timedelta(days=7)
+            next_day = day + timedelta(days=7)
+
+        querysets = {
+            "activity": self.filter(Activity.objects.all(), filters),
+            "healthevent": self.filter(HealthEvent.objects.all(), filters),
+        }
+        rules = self.filter(ActivityRule.objects.select_related("pet", "status"), filters)
+        context["weeks"] = get_weeks(
+            self.request.user, weeks, querysets, rules, {"period": period, **filters}
+        )
+        # Month cells show the first few rows of each day, the week view all.
+        if period == "month":
+            for week in context["weeks"]:
+                for calendar_day in week:
+                    calendar_day["more"] = calendar_day["total"] - self.summaries_per_day
+                    calendar_day["entries"] = calendar_day["entries"][:self.summaries_per_day]
+        context.update({
+            "period": period,
+            "day": day,
+            "previous_day": previous_day,
+            "next_day": next_day,
+            "search_form": ActivitySearchForm(initial={
+                "title": self.request.GET.get("title", ""),
+                "status": self.request.GET.get("status", ""),
+                "pets": self.request.GET.get("pets", ""),
+                "users": self.request.GET.get("users", ""),
+            }),
+            "feed_url": self.request.build_absolute_uri(
+                reverse_lazy("core:calendar-feed", args=[feed_token(self.request.user)])
+            ),
+            "segment": "calendar",
+        })
+        return context
+
+
+@condition(etag_func=feed_etag, last_modified_func=feed_last_modified)
+def calendar_feed(request, token):
+    """
+    iCalendar feed of a user's activities and health events for calendar
+    apps, which cannot log in, so the signed token in the URL identifies
+    the user. Conditional requests are answered from the cached change
+    watermark without touching the database.
+    """
+    user_id = feed_user_id(token)
+    if user_id is None or not User.objects.filter(pk=user_id).exists():
+        raise Http404("Feed not found")
+    return StreamingHttpResponse(
+        stream_feed(user_id, get_watermark(user_id)),
+        content_type="text/calendar; charset=utf-8",
+        headers={"Content-Disposition": 'inline; filename="petcare.ics"'},
+    )
+
+
+class StatusListView(AsyncLoginRequiredMixin, AsyncListMixin, ListView):
     model = Status
     paginate_by = 5
     def get_context_data(
@@ -347,10 +724,8 @@ class StatusListView(LoginRequiredMixin, ListView):
     def get_queryset(self):
         queryset = Status.objects.all()
         form = StatusSearchForm(self.request.GET)
-        if form.is_valid():
-            return queryset.filter(
-                name__icontains=form.cleaned_data["name"]
-            )
+        if form.is_valid() and form.cleaned_data["name"]:
+            return search(queryset, "name", form.cleaned_data["name"])
         return queryset
 
 
@@ -372,7 +747,7 @@ class StatusDeleteView(LoginRequiredMixin, DeleteView):
     success_url = reverse_lazy("core:status-list")
 
 
-class PriorityListView(LoginRequiredMixin, ListView):
+class PriorityListView(AsyncLoginRequiredMixin, AsyncListMixin, ListView):
     model = Priority
     paginate_by = 5
     def get_context_data(
@@ -388,10 +763,8 @@ class PriorityListView(LoginRequiredMixin, ListView):
     def get_queryset(self):
         queryset = Priority.objects.all()
         form = PrioritySearchForm(self.request.GET)
-        if form.is_valid():
-            return queryset.filter(
-                name__icontains=form.cleaned_data["name"]
-            )
+        if form.is_valid() and form.cleaned_data["name"]:
+            return search(queryset, "name", form.cleaned_data["name"])
         return queryset
 
 
@@ -412,7 +785,7 @@ class PriorityDeleteView(LoginRequiredMixin, DeleteView):
     success_url = reverse_lazy("core:priority-list")
 
 
-class SpeciesListView(LoginRequiredMixin, ListView):
+class SpeciesListView(AsyncLoginRequiredMixin, AsyncListMixin, ListView):
     model = Species
     paginate_by = 5
     def get_context_data(
@@ -428,10 +801,8 @@ class SpeciesListView(LoginRequiredMixin, ListView):
     def get_queryset(self):
         queryset = Species.objects.all()
         form = SpeciesSearchForm(self.request.GET)
-        if form.is_valid():
-            return queryset.filter(
-                name__icontains=form.cleaned_data["name"]
-            )
+        if form.is_valid() and form.cleaned_data["name"]:
+            return search(queryset, "name", form.cleaned_data["name"])
         return queryset
 
 class SpeciesCreateView(LoginRequiredMixin, CreateView):
@@ -449,3 +820,56 @@ class SpeciesUpdateView(LoginRequiredMixin, UpdateView):
 class SpeciesDeleteView(LoginRequiredMixin, DeleteView):
     model = Species
     success_url = reverse_lazy("core:species-list")
+
+
+
+class AutocompleteView(AsyncLoginRequiredMixin, View):
+    model = None
+    search_field = "name"
+    paginate_by = 20
+
+    def get_queryset(self):
+        return self.model.objects.all()
+
+    async def get(self, request, *args, **kwargs):
+        term = request.GET.get("q", "").strip()
+        try:
+            page = max(int(request.GET.get("page", 1)), 1)
+        except ValueError:
+            page = 1
+
+        queryset = self.get_queryset().order_by(self.search_field, "pk")
+        if term:
+            queryset = queryset.filter(
+                **{f"{self.search_field}__istartswith": term}
+            )
+
+        offset = (page - 1) * self.paginate_by
+        objects = [obj async for obj in queryset[offset:offset + self.paginate_by + 1]]
+        return JsonResponse({
+            "results": [
+                {"id": obj.pk, "text": str(obj)}
+                for obj in objects[:self.paginate_by]
+            ],
+            "more": len(objects) > self.paginate_by,
+        })
+
+
+class PetAutocompleteView(AutocompleteView):
+    model = Pet
+
+    def get_queryset(self):
+        return Pet.objects.select_related("species")
+
+
+class UserAutocompleteView(AutocompleteView):
+    model = User
+    search_field = "username"
+
+
+class StatusAutocompleteView(AutocompleteView):
+    model = Status
+
+
+class PriorityAutocompleteView(AutocompleteView):
+    model = Priority
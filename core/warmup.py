@@ -0,0 +1,57 @@
+import logging
+from pathlib import Path
+from time import perf_counter
+
+from django.template import engines
+from django.template.backends.django import DjangoTemplates
+from django.urls import get_resolver
+
+logger = logging.getLogger(__name__)
+
+# Template directories, relative to each DIRS entry, compiled at worker boot
+# along with the base templates at the top of each DIRS entry. Parents and
+# includes are only loaded when a template renders, so they are listed too.
+WARM_TEMPLATE_DIRS = ("core", "includes", "registration")
+
+
+def template_names():
+    for engine in engines.all():
+        if not isinstance(engine, DjangoTemplates):
+            continue
+        for directory in map(Path, engine.dirs):
+            paths = sorted(directory.glob("*.html"))
+            for subdir in WARM_TEMPLATE_DIRS:
+                paths.extend(sorted((directory / subdir).rglob("*.html")))
+            for path in paths:
+                yield engine, path.relative_to(directory).as_posix()
+
+
+def warm_templates():
+    """Compile templates into the cached loader."""
+    count = 0
+    for engine, name in template_names():
+        engine.get_template(name)
+        count += 1
+    return count
+
+
+def warm_urls():
+    """Compile URL patterns and build the reverse lookup tables of every namespace."""
+    resolvers = [get_resolver()]
+    count = 0
+    while resolvers:
+        resolver = resolvers.pop()
+        resolver.reverse_dict
+        count += len(resolver.url_patterns)
+        resolvers.extend(sub_resolver for prefix, sub_resolver in resolver.namespace_dict.values())
+    return count
+
+
+def warm_up():
+    start = perf_counter()
+    templates = warm_templates()
+    patterns = warm_urls()
+    logger.info(
+        "Warmed up %d templates and %d URL patterns in %.1f ms",
+        templates, patterns, (perf_counter() - start) * 1000,
+    )
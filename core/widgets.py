@@ -0,0 +1,39 @@
+from django import forms
+from django.urls import reverse
+
+
+class AutocompleteSelect(forms.Select):
+    """
+    Select for a ModelChoiceField that renders only the selected option.
+    The remaining choices are fetched page by page from ``url`` as the
+    user types, so rendering does not load the whole related table.
+    """
+
+    def __init__(self, url, attrs=None):
+        super().__init__(attrs)
+        self.url = url
+
+    def get_context(self, name, value, attrs):
+        context = super().get_context(name, value, attrs)
+        context["widget"]["attrs"]["data-autocomplete-url"] = reverse(self.url)
+        return context
+
+    def optgroups(self, name, value, attrs=None):
+        field = self.choices.field
+        options = []
+        if not self.is_required:
+            options.append(self.create_option(name, "", field.empty_label or "", False, 0))
+
+        selected_values = [v for v in value if v not in field.empty_values]
+        try:
+            selected_objects = list(self.choices.queryset.filter(pk__in=selected_values))
+        except (ValueError, TypeError):
+            selected_objects = []
+
+        for obj in selected_objects:
+            options.append(
+                self.create_option(
+                    name, obj.pk, field.label_from_instance(obj), True, len(options)
+                )
+            )
+        return [(None, options, 0)]
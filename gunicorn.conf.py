@@ -0,0 +1,9 @@
+# Gunicorn reads this file from the working directory on start-up.
+
+
+def post_worker_init(worker):
+    # Compile templates and URL patterns before the worker accepts requests,
+    # so the first request to each page does not pay for them.
+    from core.warmup import warm_up
+
+    warm_up()
@@ -0,0 +1,96 @@
+(function () {
+  "use strict";
+
+  var LOAD_MORE = "__more__";
+
+  function debounce(fn, wait) {
+    var timer;
+    return function () {
+      clearTimeout(timer);
+      timer = setTimeout(fn, wait);
+    };
+  }
+
+  function initAutocomplete(select) {
+    var url = select.dataset.autocompleteUrl;
+    var term = "";
+    var page = 1;
+    var loaded = false;
+    var previous = select.value;
+
+    var search = document.createElement("input");
+    search.type = "search";
+    search.className = "form-control form-control-sm mb-1";
+    search.placeholder = "Type to search...";
+    search.autocomplete = "off";
+    select.parentNode.insertBefore(search, select);
+
+    function removeLoadMore() {
+      var option = select.querySelector('option[value="' + LOAD_MORE + '"]');
+      if (option) {
+        option.remove();
+      }
+    }
+
+    function render(data, reset) {
+      removeLoadMore();
+      if (reset) {
+        Array.prototype.slice.call(select.options).forEach(function (option) {
+          if (option.value && option.value !== select.value) {
+            option.remove();
+          }
+        });
+      }
+      data.results.forEach(function (item) {
+        if (!select.querySelector('option[value="' + item.id + '"]')) {
+          select.add(new Option(item.text, item.id));
+        }
+      });
+      if (data.more) {
+        select.add(new Option("Load more...", LOAD_MORE));
+      }
+      loaded = true;
+    }
+
+    function load(reset) {
+      if (reset) {
+        page = 1;
+      }
+      var params = new URLSearchParams({q: term, page: page});
+      fetch(url + "?" + params.toString(), {
+        credentials: "same-origin",
+        headers: {"Accept": "application/json"}
+      })
+        .then(function (response) {
+          return response.json();
+        })
+        .then(function (data) {
+          render(data, reset);
+        });
+    }
+
+    select.addEventListener("focus", function () {
+      previous = select.value;
+      if (!loaded) {
+        load(true);
+      }
+    });
+
+    select.addEventListener("change", function () {
+      if (select.value === LOAD_MORE) {
+        select.value = previous;
+        page += 1;
+        load(false);
+      } else {
+        previous = select.value;
+      }
+    });
+
+    search.addEventListener("input", debounce(function () {
+      term = search.value.trim();
+      load(true);
+    }, 250));
+  }
+
+  document.querySelectorAll("select[data-autocomplete-url]").forEach(initAutocomplete);
+})();
@@ -0,0 +1,52 @@
+(function () {
+  "use strict";
+
+  function initToggle(form) {
+    var button = form.querySelector("button[type=submit]");
+    var owners = document.querySelector("[data-owners]");
+    var noOwners = document.querySelector("[data-no-owners]");
+    var viewer = document.querySelector("template[data-viewer-owner]");
+    var count = document.querySelector("[data-owner-count]");
+
+    function render(data) {
+      button.textContent = data.owner ? form.dataset.ownerLabel : form.dataset.notOwnerLabel;
+      button.classList.toggle("btn-danger", data.owner);
+      button.classList.toggle("btn-success", !data.owner);
+      var item = viewer.content.firstElementChild;
+      var current = owners.querySelector('[data-owner="' + item.dataset.owner + '"]');
+      if (data.owner && !current) {
+        owners.appendChild(item.cloneNode(true));
+      } else if (!data.owner && current) {
+        current.remove();
+      }
+      noOwners.hidden = owners.children.length > 0;
+      count.textContent = data.owner_count;
+    }
+
+    form.addEventListener("submit", function (event) {
+      event.preventDefault();
+      button.disabled = true;
+      fetch(form.action, {
+        method: "POST",
+        body: new FormData(form),
+        credentials: "same-origin",
+        headers: {"Accept": "application/json"}
+      })
+        .then(function (response) {
+          if (!response.ok) {
+            throw new Error(response.statusText);
+          }
+          return response.json();
+        })
+        .then(render)
+        .catch(function () {
+          form.submit();
+        })
+        .finally(function () {
+          button.disabled = false;
+        });
+    });
+  }
+
+  document.querySelectorAll("form[data-ownership-toggle]").forEach(initToggle);
+})();